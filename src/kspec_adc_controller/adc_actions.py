@@ -6,9 +6,18 @@
 # @Filename: adc_actions.py
 
 import asyncio
+import inspect
+import math
+import time
+
+import numpy as np
+
 from .adc_controller import AdcController
 from .adc_logger import AdcLogger
 from .adc_calc_angle import ADCCalc
+from .adc_ephemeris import tracking_schedule
+from .adc_position import shortest_delta, unwrap_position
+from .adc_session import get_session_registry
 
 __all__ = ["AdcActions"]
 
@@ -16,20 +25,28 @@ __all__ = ["AdcActions"]
 class AdcActions:
     """Class to manage ADC actions including connecting, powering on/off, and motor control."""
 
-    def __init__(self):
+    def __init__(self, registry=None):
         """
         Initialize the AdcActions class and set up the ADC controller.
 
+        The controller is leased from a session registry, so all AdcActions
+        instances of a process share one opened bus and its device handles;
+        only the first instance creates the controller and finds the devices.
+
         Parameters
         ----------
-        logger : AdcLogger, optional
-            Logger instance for logging operations. If None, a default AdcLogger instance is created.
+        registry : SessionRegistry, optional
+            Registry to lease the controller session from. If None, the
+            process-wide registry is used.
         """
         self.logger = AdcLogger(__file__)  # Use provided logger or create a default one
         self.logger.debug("Initializing AdcActions class.")
-        self.controller = AdcController()
-        self.controller.find_devices()
-        self.calculator = ADCCalc()  # Method change line
+        if registry is None:
+            registry = get_session_registry()
+        self.session = registry.acquire(AdcController)
+        self.controller = self.session.controller
+        self.calculator = ADCCalc(use_cache=True)  # Method change line
+        self._tracking_stop = asyncio.Event()
 
     def connect(self):
         """
@@ -85,13 +102,19 @@ class AdcActions:
         -------
         dict
             A dictionary indicating the status or any error encountered.
+            On success, ``effective_za`` maps each motor to the zenith angle
+            its current position corresponds to (None if it is outside the
+            lookup table range).
         """
         self.logger.info(f"Retrieving status for motor {motor_num}.")
         try:
             state = self.controller.device_state(motor_num)
+            effective_za = self._effective_za(state)
             self.logger.info(f"Motor {motor_num} status: {state}")
             return self._generate_response(
-                "success", f"Motor {motor_num} status retrieved: {state}"
+                "success",
+                f"Motor {motor_num} status retrieved: {state}",
+                effective_za=effective_za,
             )
         except Exception as e:
             self.logger.error(f"Error in status: {e}")
@@ -99,6 +122,35 @@ class AdcActions:
                 "error", f"Error retrieving motor {motor_num} status: {str(e)}"
             )
 
+    def _effective_za(self, state: dict) -> dict:
+        """
+        Map the motor positions of a `device_state` result to effective zenith
+        angles through the calculator's precomputed inverse map.
+
+        The drive position is unwrapped and taken relative to the zero
+        reference (`AdcController.zero_position`), on the shortest rotation.
+        Motors are driven to -count(ADC angle) from there (see `activate`),
+        so the result is negated before the lookup. Before homing there is
+        no zero reference and every motor maps to None.
+        """
+        if not self.controller.home_position:
+            # homing 전은 정상 상태: 매 status마다 log를 남기지 않음
+            return {motor: None for motor in state}
+        effective_za = {}
+        for motor, motor_state in state.items():
+            try:
+                motor_id = int(motor[len("motor") :])
+                counts = shortest_delta(
+                    self.controller.zero_position(motor_id),
+                    motor_state["position_state"],
+                )
+                za = self.calculator.za_from_counts(-counts)
+                effective_za[motor] = None if math.isnan(za) else float(za)
+            except Exception as e:
+                self.logger.warning(f"Cannot compute effective ZA of {motor}: {e}")
+                effective_za[motor] = None
+        return effective_za
+
     async def move(self, motor_id, pos_count, vel_set=1):
         """
         Move the motor(s) to the specified position with a given velocity.
@@ -123,12 +175,8 @@ class AdcActions:
                     f"Starting simultaneous move for motors 1 and 2 to position {pos_count} with velocity {vel_set}."
                 )
 
-                motor1_task = asyncio.to_thread(
-                    self.controller.move_motor, 1, -pos_count, vel_set
-                )
-                motor2_task = asyncio.to_thread(
-                    self.controller.move_motor, 2, -pos_count, vel_set
-                )
+                motor1_task = self.controller.move(1, -pos_count, vel_set)
+                motor2_task = self.controller.move(2, -pos_count, vel_set)
 
                 # Wait for both motors to complete
                 results = await asyncio.gather(motor1_task, motor2_task)
@@ -145,12 +193,8 @@ class AdcActions:
                     f"Starting simultaneous move for motors 1 and 2 to position {pos_count} with velocity {vel_set} in same direction"
                 )
 
-                motor1_task = asyncio.to_thread(
-                    self.controller.move_motor, 1, -pos_count, vel_set
-                )
-                motor2_task = asyncio.to_thread(
-                    self.controller.move_motor, 2, pos_count, vel_set
-                )
+                motor1_task = self.controller.move(1, -pos_count, vel_set)
+                motor2_task = self.controller.move(2, pos_count, vel_set)
 
                 # Wait for both motors to complete
                 results = await asyncio.gather(motor1_task, motor2_task)
@@ -166,9 +210,7 @@ class AdcActions:
                 self.logger.debug(
                     f"Moving motor {motor_id} to position {pos_count} with velocity {vel_set}."
                 )
-                result = await asyncio.to_thread(
-                    self.controller.move_motor, motor_id, -pos_count, vel_set
-                )
+                result = await self.controller.move(motor_id, -pos_count, vel_set)
                 self.logger.info(
                     f"Motor {motor_id} moved successfully to position {pos_count}."
                 )
@@ -199,11 +241,16 @@ class AdcActions:
         dict
             A response dictionary indicating success or failure of the operation.
         """
+        received = time.monotonic()  # stop latency 기준 시각
         try:
             if motor_id == 0:
                 self.logger.debug("Stopping both motors simultaneously.")
-                motor1_task = asyncio.to_thread(self.controller.stop_motor, 1)
-                motor2_task = asyncio.to_thread(self.controller.stop_motor, 2)
+                motor1_task = self.controller.bus.run(
+                    self.controller.stop_motor, 1, requested_at=received
+                )
+                motor2_task = self.controller.bus.run(
+                    self.controller.stop_motor, 2, requested_at=received
+                )
                 results = await asyncio.gather(motor1_task, motor2_task)
                 self.logger.info("Both motors stopped successfully.")
                 return self._generate_response(
@@ -212,7 +259,9 @@ class AdcActions:
                 )
             elif motor_id in [1, 2]:
                 self.logger.debug(f"Stopping motor {motor_id}.")
-                result = await asyncio.to_thread(self.controller.stop_motor, motor_id)
+                result = await self.controller.bus.run(
+                    self.controller.stop_motor, motor_id, requested_at=received
+                )
                 self.logger.info(f"Motor {motor_id} stopped successfully.")
                 return self._generate_response(
                     "success",
@@ -226,7 +275,29 @@ class AdcActions:
                 "error", f"Failed to stop motor {motor_id}: {str(e)}"
             )
 
-    async def activate(self, za, vel_set=1) -> dict:
+    def _validate_velocity(self, vel_set):
+        """
+        Cap the requested velocity at 5 RPM and replace negative values by
+        the default of 1 RPM.
+        """
+        max_velocity = 5
+        default_velocity = 1
+
+        if vel_set < 0:
+            self.logger.warning(
+                f"Requested velocity ({vel_set} RPM) is negative. "
+                f"Setting velocity to the default value of {default_velocity} RPM."
+            )
+            return default_velocity
+
+        if vel_set > max_velocity:
+            self.logger.warning(
+                f"Requested velocity ({vel_set} RPM) exceeds the limit of {max_velocity} RPM. "
+                f"Setting velocity to {max_velocity} RPM."
+            )
+        return min(vel_set, max_velocity)
+
+    async def activate(self, za, vel_set=1, absolute=False) -> dict:
         """
         Activate both motors simultaneously to the calculated target position based on zenith angle.
 
@@ -239,29 +310,21 @@ class AdcActions:
             Maximum allowed velocity is 5 RPM. If a value greater than 5 is provided,
             it will be automatically capped at 5 RPM.
             If a negative value is provided, it will be reset to the default value of 1 RPM.
+        absolute : bool, optional
+            If True, drive the motors to -count measured from the zero
+            reference (as in `track`) with `AdcController.move_to`: only the
+            shortest delta from the commanded position is moved, and a motor
+            already within one count is not moved at all, so repeated
+            activates converge. Requires a completed homing.
+            If False (default), move both motors by -count relative to
+            their current positions.
 
         Returns
         -------
         dict
             A dictionary indicating the success or failure of the activation.
         """
-        max_velocity = 5
-        default_velocity = 1
-
-        # Validate velocity
-        if vel_set < 0:
-            self.logger.warning(
-                f"Requested velocity ({vel_set} RPM) is negative. "
-                f"Setting velocity to the default value of {default_velocity} RPM."
-            )
-            vel = default_velocity
-        else:
-            vel = min(vel_set, max_velocity)
-            if vel_set > max_velocity:
-                self.logger.warning(
-                    f"Requested velocity ({vel_set} RPM) exceeds the limit of {max_velocity} RPM. "
-                    f"Setting velocity to {max_velocity} RPM."
-                )
+        vel = self._validate_velocity(vel_set)
 
         self.logger.info(
             f"Activating motors with zenith angle {za}, velocity {vel} RPM."
@@ -281,11 +344,17 @@ class AdcActions:
 
         try:
             # Activate motors
-            # Activate motors using asyncio.to_thread for non-blocking calls
-            # motor 1 L4 위치, 빛의 진행 방향 기준 시계 방향 회전
-            motor1_task = asyncio.to_thread(self.controller.move_motor, 1, -pos, vel)
-            # motor 2 L3 위치, 빛의 진행 방향 기준 반시계 방향 회전
-            motor2_task = asyncio.to_thread(self.controller.move_motor, 2, -pos, vel)
+            if absolute:
+                # zero 기준 절대 목표 -count까지의 최소 delta만 이동
+                motor1_task = self.controller.move_to(1, -pos, vel)
+                motor2_task = self.controller.move_to(2, -pos, vel)
+            else:
+                # 같은 prism 각도를 가장 짧은 회전 방향으로 (한 바퀴 = 16200 counts)
+                distance = shortest_delta(0, -pos)
+                # motor 1 L4 위치, 빛의 진행 방향 기준 시계 방향 회전
+                motor1_task = self.controller.move(1, distance, vel)
+                # motor 2 L3 위치, 빛의 진행 방향 기준 반시계 방향 회전
+                motor2_task = self.controller.move(2, distance, vel)
 
             results = await asyncio.gather(
                 motor1_task, motor2_task, return_exceptions=True
@@ -312,6 +381,200 @@ class AdcActions:
                 f"Failed to activate motors for zenith angle {za} with velocity {vel}: {str(e)}",
             )
 
+    async def _iter_za_source(self, za_source, interval):
+        """
+        Yield zenith angles from a callable (polled every `interval` seconds)
+        or an async iterator, until the source is exhausted, returns None, or
+        `stop_tracking` is called.
+        """
+        if hasattr(za_source, "__aiter__"):
+            async for za in za_source:
+                if za is None or self._tracking_stop.is_set():
+                    return
+                yield za
+            return
+
+        while not self._tracking_stop.is_set():
+            za = za_source()
+            if inspect.isawaitable(za):
+                za = await za
+            if za is None:
+                return
+            yield za
+            try:
+                await asyncio.wait_for(self._tracking_stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def track(
+        self,
+        za_source,
+        deadband=1,
+        interval=1.0,
+        vel_set=1,
+        max_samples=None,
+        streaming=False,
+    ) -> dict:
+        """
+        Continuously follow a drifting zenith angle, moving the motors only
+        when the target leaves the deadband around the commanded position.
+
+        The motor positions are read once at the start and converted to
+        counts from the zero reference (`AdcController.zero_position`), the
+        frame of the -count targets; after that the commanded positions are
+        tracked locally, so a sample inside the deadband costs no bus traffic
+        at all. Tracking requires a completed homing.
+
+        Parameters
+        ----------
+        za_source : callable or async iterator
+            Source of zenith angles (degree). A callable (sync or async) is
+            polled every `interval` seconds; an async iterator sets its own
+            pace. Tracking ends when the source is exhausted or yields None,
+            or when `stop_tracking` is called.
+        deadband : int, optional
+            Allowed difference between target and commanded position in
+            encoder counts (1 count = 360/16200 deg). A move is issued only
+            when the difference exceeds it. Defaults to 1.
+        interval : float, optional
+            Polling interval (seconds) for a callable source. Defaults to 1.
+        vel_set : int, optional
+            The velocity of the correction moves (RPM), validated as in `activate`.
+        max_samples : int, optional
+            Stop after this many samples.
+        streaming : bool, optional
+            If True, send the corrections as set-points of an
+            `AdcController.setpoint_stream` per motor: each correction
+            returns once the drive acknowledged it and replaces the running
+            target, so the prisms move smoothly instead of stop-start moves.
+            When tracking ends the streams are closed, after waiting for the
+            drives to reach the last set-points unless tracking aborted.
+
+        Returns
+        -------
+        dict
+            A dictionary indicating the success or failure of the tracking run,
+            with the counts of processed samples, issued moves, samples skipped
+            because the calculation failed, and the largest residual
+            (counts) left uncorrected.
+        """
+        if deadband < 0:
+            self.logger.error(f"Invalid tracking deadband: {deadband}")
+            return self._generate_response(
+                "error", f"Invalid tracking deadband: {deadband}"
+            )
+        vel = self._validate_velocity(vel_set)
+        # 첫 await 전에 clear: 시작 중에 온 stop_tracking도 유지됨
+        self._tracking_stop.clear()
+        stats = {"samples": 0, "moves": 0, "skipped": 0, "max_residual": 0}
+
+        try:
+            state = await self.controller.bus.run(self.controller.device_state, 0)
+            # 0x6064는 unsigned로 읽히므로 signed 32-bit로 변환 후 zero 기준으로
+            commanded = {
+                m: unwrap_position(state[f"motor{m}"]["position_state"])
+                - self.controller.zero_position(m)
+                for m in (1, 2)
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to read motor positions for tracking: {e}")
+            return self._generate_response(
+                "error", f"Failed to start tracking: {str(e)}", **stats
+            )
+
+        streams = (
+            {m: self.controller.setpoint_stream(m, vel) for m in (1, 2)}
+            if streaming
+            else None
+        )
+        self.logger.info(
+            f"Tracking started with deadband {deadband} counts, velocity {vel} RPM"
+            f"{' (set-point streaming)' if streaming else ''}."
+        )
+        try:
+            async for za in self._iter_za_source(za_source, interval):
+                stats["samples"] += 1
+                try:
+                    # activate와 같은 방향: motor 위치 = -count
+                    target = -self.calculator.degree_to_count(
+                        self.calculator.calc_from_za(za)
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Skipping tracking sample ZA {za}: {e}")
+                    stats["skipped"] += 1
+                    continue
+
+                deltas = {m: shortest_delta(commanded[m], target) for m in (1, 2)}
+                if max(abs(d) for d in deltas.values()) > deadband:
+                    moving = [m for m in (1, 2) if deltas[m] != 0]
+                    if streams is not None:
+                        corrections = (streams[m].push(target) for m in moving)
+                    else:
+                        corrections = (
+                            self.controller.move(m, deltas[m], vel) for m in moving
+                        )
+                    results = await asyncio.gather(*corrections, return_exceptions=True)
+                    for m, result in zip(moving, results):
+                        if isinstance(result, Exception):
+                            raise RuntimeError(f"Motor {m} failed: {result}")
+                        commanded[m] += deltas[m]
+                    stats["moves"] += 1
+                    self.logger.debug(f"Tracking move to {target} counts (ZA {za}).")
+                else:
+                    stats["max_residual"] = max(
+                        stats["max_residual"], *(abs(d) for d in deltas.values())
+                    )
+
+                if max_samples is not None and stats["samples"] >= max_samples:
+                    break
+        except Exception as e:
+            self.logger.error(f"Tracking aborted: {e}")
+            if streams is not None:
+                await self._close_streams(streams, settle=False)
+            return self._generate_response(
+                "error", f"Tracking aborted: {str(e)}", **stats
+            )
+
+        if streams is not None:
+            try:
+                await self._close_streams(streams, settle=True)
+            except Exception as e:
+                self.logger.error(f"Tracking set-points did not settle: {e}")
+                return self._generate_response(
+                    "error", f"Tracking set-points did not settle: {str(e)}", **stats
+                )
+
+        self.logger.info(
+            f"Tracking finished: {stats['samples']} samples, {stats['moves']} moves."
+        )
+        return self._generate_response(
+            "success",
+            f"Tracking finished after {stats['samples']} samples "
+            f"with {stats['moves']} moves.",
+            **stats,
+        )
+
+    @staticmethod
+    async def _close_streams(streams, settle):
+        """
+        Close the set-point streams of a tracking run, waiting for the
+        drives to reach the last set-points if `settle` is True.
+        """
+        results = await asyncio.gather(
+            *(stream.close(settle=settle) for stream in streams.values()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    def stop_tracking(self):
+        """
+        Ask a running `track` call to finish after its current sample.
+        """
+        self.logger.info("Stopping tracking.")
+        self._tracking_stop.set()
+
     async def homing(self, homing_vel=1):
         """
         Perform a homing operation with the motor controller.
@@ -460,6 +723,85 @@ class AdcActions:
             self.logger.error(f"Error in zeroing operation: {str(e)}")
             return self._generate_response("error", str(e))
 
+    def _prediction_response(self, operation, times) -> dict:
+        """
+        Build the response of a motion-time prediction; both motors move
+        concurrently, so the operation takes as long as the slower one.
+        """
+        duration = max(times.values())
+        self.logger.info(f"Predicted {operation} duration: {duration:.3f} s.")
+        return self._generate_response(
+            "success",
+            f"Predicted {operation} duration: {duration:.3f} s.",
+            duration=duration,
+            motor_1=times[1],
+            motor_2=times[2],
+        )
+
+    def predict_activate(self, za, vel_set=1) -> dict:
+        """
+        Predict how long `activate` would take, without moving the motors.
+
+        Parameters
+        ----------
+        za : float
+            Input zenith angle (in degrees).
+        vel_set : int, optional
+            The velocity (in RPM), validated as in `activate`. Defaults to 1.
+
+        Returns
+        -------
+        dict
+            A JSON-like dictionary with "duration" (seconds) and the per-motor
+            predictions "motor_1" and "motor_2", or an error message.
+        """
+        vel = self._validate_velocity(vel_set)
+        try:
+            pos = self.calculator.degree_to_count(self.calculator.calc_from_za(za))
+            times = {m: self.controller.predict_move_time(m, -pos, vel) for m in (1, 2)}
+            return self._prediction_response("activate", times)
+        except Exception as e:
+            self.logger.error(f"Error predicting activate duration: {e}")
+            return self._generate_response("error", str(e))
+
+    def predict_parking(self, parking_vel=1) -> dict:
+        """
+        Predict how long `parking` would take from the current positions.
+
+        Returns
+        -------
+        dict
+            A JSON-like dictionary with "duration" (seconds) and the per-motor
+            predictions "motor_1" and "motor_2", or an error message.
+        """
+        vel = self._validate_velocity(parking_vel)
+        try:
+            return self._prediction_response(
+                "parking", self.controller.predict_parking_time(vel)
+            )
+        except Exception as e:
+            self.logger.error(f"Error predicting parking duration: {e}")
+            return self._generate_response("error", str(e))
+
+    def predict_zeroing(self, zeroing_vel=1) -> dict:
+        """
+        Predict how long `zeroing` would take from the current positions.
+
+        Returns
+        -------
+        dict
+            A JSON-like dictionary with "duration" (seconds) and the per-motor
+            predictions "motor_1" and "motor_2", or an error message.
+        """
+        vel = self._validate_velocity(zeroing_vel)
+        try:
+            return self._prediction_response(
+                "zeroing", self.controller.predict_zeroing_time(vel)
+            )
+        except Exception as e:
+            self.logger.error(f"Error predicting zeroing duration: {e}")
+            return self._generate_response("error", str(e))
+
     def disconnect(self):
         """
         Disconnect from the ADC controller and related devices.
@@ -486,7 +828,10 @@ class AdcActions:
         """
         Power off and disconnect from all devices, shutting down the system safely.
 
-        This function will close all active connections and power off the system, ensuring no devices are left in an inconsistent state.
+        This releases the controller session of this instance. Only the last
+        AdcActions instance sharing the session stops the telemetry poller,
+        disconnects the devices and closes the bus; earlier ones leave the bus
+        open for the remaining users.
 
         Returns
         -------
@@ -497,8 +842,12 @@ class AdcActions:
         """
         self.logger.info("Powering off and disconnecting from devices.")
         try:
-            self.controller.disconnect()
-            self.controller.close()
+            if not self.session.release():
+                users = self.session.users
+                self.logger.info(f"Session released; bus kept open for {users} users.")
+                return self._generate_response(
+                    "success", f"Session released; bus still used by {users} users."
+                )
             self.logger.info("Power off successful.")
             return self._generate_response(
                 "success", "Power off and devices disconnected."
@@ -560,3 +909,109 @@ class AdcActions:
         except Exception as e:
             self.logger.error(f"Error converting degrees to counts: {str(e)}")
             return self._generate_response("error", str(e))
+
+    def calc_trajectory(self, za, dtype="int64", rounding="trunc") -> dict:
+        """
+        Precompute motor setpoints for a whole zenith-angle series.
+
+        The series is converted in a single vectorized pass without per-sample
+        logging, using the same motor sign convention as `activate`.
+
+        Parameters
+        ----------
+        za : array-like
+            Either a 1-D array of zenith angles (degree), or an (N, 2) array of
+            (time, zenith angle) pairs.
+        dtype : {'int64', 'int32'}, optional
+            Integer type of the returned count arrays.
+        rounding : {'trunc', 'nearest', 'floor'}, optional
+            Rounding mode used to convert degrees to counts.
+
+        Returns
+        -------
+        dict
+            A JSON-like dictionary indicating the success or failure of the operation:
+            - "status": "success" if the operation was successful, "error" if it failed.
+            - "message": A summary or the error message.
+            - "time": The time column if (time, zenith angle) pairs were given, else None.
+            - "motor_1", "motor_2": Count arrays to command for each motor.
+        """
+        self.logger.info("Calculating setpoint trajectory from ZA series.")
+        try:
+            times, counts = self.calculator.za_to_counts(
+                za, dtype=dtype, rounding=rounding
+            )
+            self.logger.info(f"Trajectory calculated for {len(counts)} samples.")
+            return self._generate_response(
+                "success",
+                f"Trajectory calculated for {len(counts)} samples.",
+                time=times,
+                motor_1=-counts,
+                motor_2=-counts,
+            )
+        except Exception as e:
+            self.logger.error(f"Error calculating trajectory: {str(e)}")
+            return self._generate_response("error", str(e))
+
+    def calc_schedule(
+        self, ra, dec, latitude, longitude, utc, dtype="int64", rounding="trunc"
+    ) -> dict:
+        """
+        Precompute a time-stamped tracking schedule for a target.
+
+        The zenith distance is computed locally from the target coordinates,
+        the site position and the UTC time stamps, and converted to motor
+        setpoints in one vectorized pass. Samples outside the lookup table
+        range are left out.
+
+        Parameters
+        ----------
+        ra, dec : float
+            Right ascension and declination of the target (degree).
+        latitude, longitude : float
+            Site latitude (north positive) and longitude (east positive) (degree).
+        utc : array-like
+            1-D array of ``datetime64`` values or Unix time stamps (seconds).
+        dtype : {'int64', 'int32'}, optional
+            Integer type of the returned count arrays.
+        rounding : {'trunc', 'nearest', 'floor'}, optional
+            Rounding mode used to convert degrees to counts.
+
+        Returns
+        -------
+        dict
+            A JSON-like dictionary indicating the success or failure of the operation:
+            - "status": "success" if the operation was successful, "error" if it failed.
+            - "message": A summary or the error message.
+            - "time": Time stamps of the scheduled samples.
+            - "za": Zenith distance (degree) of each scheduled sample.
+            - "motor_1", "motor_2": Count arrays to command for each motor.
+        """
+        self.logger.info(f"Calculating tracking schedule for RA {ra}, Dec {dec}.")
+        try:
+            times, za, counts = tracking_schedule(
+                self.calculator,
+                ra,
+                dec,
+                latitude,
+                longitude,
+                utc,
+                dtype=dtype,
+                rounding=rounding,
+            )
+            message = (
+                f"Tracking schedule calculated for {len(counts)} of "
+                f"{len(np.atleast_1d(utc))} samples."
+            )
+            self.logger.info(message)
+            return self._generate_response(
+                "success",
+                message,
+                time=times,
+                za=za,
+                motor_1=-counts,
+                motor_2=-counts,
+            )
+        except Exception as e:
+            self.logger.error(f"Error calculating tracking schedule: {str(e)}")
+            return self._generate_response("error", str(e))
@@ -0,0 +1,399 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_benchmark.py
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from .adc_calc_angle import (
+    ADCCalc,
+    COUNT_PER_DEGREE,
+    INTERP_METHODS,
+    _get_default_lookup_path,
+    fit_interpolant,
+)
+
+__all__ = [
+    "benchmark_grid_lookup",
+    "benchmark_startup",
+    "benchmark_method",
+    "leave_one_out",
+    "run_suite",
+    "compare_reports",
+    "main",
+]
+
+DEFAULT_SIZES = tuple(10**k for k in range(8))  # 1 .. 10^7
+
+
+def _time_per_call(func, args, n_calls):
+    """
+    Return the mean wall-clock time of `func(arg)` in microseconds,
+    cycling through `args` for `n_calls` calls.
+    """
+    n_args = len(args)
+    start = time.perf_counter()
+    for i in range(n_calls):
+        func(args[i % n_args])
+    return (time.perf_counter() - start) / n_calls * 1e6
+
+
+def benchmark_grid_lookup(
+    lookup_table=None, method="pchip", grid_step=0.01, n_calls=10000
+):
+    """
+    Compare the per-call latency of `ADCCalc.calc_from_za` in grid mode
+    against the exact interpolation function.
+
+    Parameters
+    ----------
+    lookup_table : str, optional
+        A path to the ADC lookup CSV. If None, the default table is used.
+    method : {'cubic', 'pchip', 'akima'}, optional
+        The interpolation method to be benchmarked.
+    grid_step : float, optional
+        Spacing of the setpoint grid (degree).
+    n_calls : int, optional
+        Number of scalar calls timed for each path.
+
+    Returns
+    -------
+    dict
+        Mean latency per call (microseconds) for both paths, the speedup and
+        the maximum grid error against the exact interpolant (degree).
+    """
+    exact = ADCCalc(lookup_table=lookup_table, method=method)
+    grid = ADCCalc(lookup_table=lookup_table, method=method, grid_step=grid_step)
+
+    # 실제 tracking처럼 매번 다른 ZA로 호출
+    span = exact.za_max - exact.za_min
+    za_values = [float(exact.za_min + span * (k + 0.5) / 997) for k in range(997)]
+
+    exact_us = _time_per_call(exact.calc_from_za, za_values, n_calls)
+    grid_us = _time_per_call(grid.calc_from_za, za_values, n_calls)
+
+    return {
+        "method": method,
+        "grid_step": grid.grid_step,
+        "n_calls": n_calls,
+        "exact_us_per_call": exact_us,
+        "grid_us_per_call": grid_us,
+        "speedup": exact_us / grid_us if grid_us > 0 else float("inf"),
+        "grid_max_error": grid.grid_max_error,
+    }
+
+
+def benchmark_startup(lookup_table=None, method="pchip", repeats=5):
+    """
+    Compare `ADCCalc` construction time with a cold and a hot interpolant cache.
+
+    Each cold construction uses an empty cache directory, so it parses the CSV,
+    fits the interpolant and writes the cache entry. Hot constructions load the
+    memory-mapped entry written by a warm-up construction.
+
+    Parameters
+    ----------
+    lookup_table : str, optional
+        A path to the ADC lookup CSV. If None, the default table is used.
+    method : {'cubic', 'pchip', 'akima'}, optional
+        The interpolation method to be benchmarked.
+    repeats : int, optional
+        Number of constructions timed for each case.
+
+    Returns
+    -------
+    dict
+        Mean constructor time and mean interpolant load time (milliseconds)
+        for the cold and hot cases.
+    """
+    cold_total, cold_interp = [], []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            start = time.perf_counter()
+            calc = ADCCalc(lookup_table, method, use_cache=True, cache_dir=cache_dir)
+            cold_total.append(time.perf_counter() - start)
+            cold_interp.append(calc.interp_load_time)
+
+    hot_total, hot_interp = [], []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ADCCalc(lookup_table, method, use_cache=True, cache_dir=cache_dir)
+        for _ in range(repeats):
+            start = time.perf_counter()
+            calc = ADCCalc(lookup_table, method, use_cache=True, cache_dir=cache_dir)
+            hot_total.append(time.perf_counter() - start)
+            hot_interp.append(calc.interp_load_time)
+
+    return {
+        "method": method,
+        "repeats": repeats,
+        "cold_init_ms": sum(cold_total) / repeats * 1e3,
+        "cold_interp_ms": sum(cold_interp) / repeats * 1e3,
+        "hot_init_ms": sum(hot_total) / repeats * 1e3,
+        "hot_interp_ms": sum(hot_interp) / repeats * 1e3,
+    }
+
+
+def _time_batch(func, arg, min_time=0.05, max_repeats=50):
+    """
+    Return the best wall-clock time of `func(arg)` in seconds, repeating
+    until `min_time` has been spent or `max_repeats` calls were made.
+    """
+    best = float("inf")
+    spent = 0.0
+    for _ in range(max_repeats):
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= min_time:
+            break
+    return best
+
+
+def _peak_memory(func, arg):
+    """
+    Return the peak memory (bytes) allocated while running `func(arg)`,
+    not counting memory that was already allocated before the call.
+    """
+    tracemalloc.start()
+    try:
+        func(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_method(calc, sizes=DEFAULT_SIZES, n_scalar=10000, seed=0):
+    """
+    Time scalar and batch `calc_from_za` calls of one `ADCCalc` instance.
+
+    Parameters
+    ----------
+    calc : ADCCalc
+        The calculator to be benchmarked.
+    sizes : sequence of int, optional
+        Array sizes for the batch benchmark.
+    n_scalar : int, optional
+        Number of scalar calls timed.
+    seed : int, optional
+        Seed of the random zenith angles.
+
+    Returns
+    -------
+    dict
+        Scalar latency (microseconds) and, per array size, the best batch
+        time (seconds), the time per element (nanoseconds) and the peak memory
+        allocated by the call (bytes).
+    """
+    rng = np.random.default_rng(seed)
+    za_values = rng.uniform(calc.za_min, calc.za_max, 997).tolist()
+    report = {
+        "scalar_us_per_call": _time_per_call(calc.calc_from_za, za_values, n_scalar)
+    }
+
+    batch = []
+    for size in sizes:
+        za = rng.uniform(calc.za_min, calc.za_max, size)
+        seconds = _time_batch(calc.calc_from_za, za)
+        batch.append(
+            {
+                "size": int(size),
+                "seconds": seconds,
+                "ns_per_element": seconds / size * 1e9,
+                "peak_memory_bytes": _peak_memory(calc.calc_from_za, za),
+            }
+        )
+    report["batch"] = batch
+    return report
+
+
+def leave_one_out(lookup_table=None, method="pchip"):
+    """
+    Leave-one-out accuracy of an interpolation method on the lookup points.
+
+    Each interior table point is removed in turn, the method is fitted to the
+    remaining points and evaluated at the removed zenith angle. The end points
+    are kept because they bound the interpolation range.
+
+    Parameters
+    ----------
+    lookup_table : str, optional
+        A path to the ADC lookup CSV. If None, the default table is used.
+    method : str, optional
+        The interpolation method to be evaluated.
+
+    Returns
+    -------
+    dict
+        Per-point errors and the maximum/RMS error (degree and counts).
+    """
+    if lookup_table is None:
+        lookup_table = _get_default_lookup_path()
+    data = np.genfromtxt(lookup_table, comments="#", delimiter=",")
+    data_za, data_adc = data[:, 0], data[:, 1]
+
+    errors = []
+    for i in range(1, len(data_za) - 1):
+        keep = np.arange(len(data_za)) != i
+        fn = fit_interpolant(data_za[keep], data_adc[keep], method)
+        errors.append(float(fn(float(data_za[i])) - data_adc[i]))
+
+    errors = np.array(errors)
+    max_abs = float(np.abs(errors).max())
+    return {
+        "za": data_za[1:-1].tolist(),
+        "error_deg": errors.tolist(),
+        "max_abs_error_deg": max_abs,
+        "rms_error_deg": float(np.sqrt(np.mean(errors**2))),
+        "max_abs_error_counts": max_abs * COUNT_PER_DEGREE,
+    }
+
+
+def run_suite(
+    lookup_table=None, methods=INTERP_METHODS, sizes=DEFAULT_SIZES, n_scalar=10000
+):
+    """
+    Run the speed and accuracy benchmark for each interpolation method.
+
+    Parameters
+    ----------
+    lookup_table : str, optional
+        A path to the ADC lookup CSV. If None, the default table is used.
+    methods : sequence of str, optional
+        Interpolation methods to be benchmarked.
+    sizes : sequence of int, optional
+        Array sizes for the batch benchmark.
+    n_scalar : int, optional
+        Number of scalar calls timed per method.
+
+    Returns
+    -------
+    dict
+        JSON-serializable report with one entry per method.
+    """
+    report = {
+        "lookup_table": lookup_table or _get_default_lookup_path(),
+        "numpy_version": np.__version__,
+        "python_version": sys.version.split()[0],
+        "sizes": [int(size) for size in sizes],
+        "methods": {},
+    }
+    for method in methods:
+        calc = ADCCalc(lookup_table=lookup_table, method=method)
+        entry = benchmark_method(calc, sizes=sizes, n_scalar=n_scalar)
+        entry["interp_load_ms"] = calc.interp_load_time * 1e3
+        entry["leave_one_out"] = leave_one_out(lookup_table, method)
+        report["methods"][method] = entry
+    return report
+
+
+def compare_reports(current, baseline, tolerance=1.5):
+    """
+    List timings of `current` that are slower than `baseline` by more than
+    `tolerance` times.
+
+    Parameters
+    ----------
+    current, baseline : dict
+        Reports produced by `run_suite`.
+    tolerance : float, optional
+        Allowed slowdown factor.
+
+    Returns
+    -------
+    list of str
+        One message per regression; empty if there is none.
+    """
+    regressions = []
+    for method, entry in current["methods"].items():
+        base = baseline.get("methods", {}).get(method)
+        if base is None:
+            continue
+        if entry["scalar_us_per_call"] > tolerance * base["scalar_us_per_call"]:
+            regressions.append(
+                f"{method} scalar: {entry['scalar_us_per_call']:.3g} us "
+                f"vs baseline {base['scalar_us_per_call']:.3g} us"
+            )
+        base_batch = {b["size"]: b for b in base.get("batch", [])}
+        for b in entry["batch"]:
+            ref = base_batch.get(b["size"])
+            if ref is not None and b["seconds"] > tolerance * ref["seconds"]:
+                regressions.append(
+                    f"{method} batch size {b['size']}: {b['seconds']:.3g} s "
+                    f"vs baseline {ref['seconds']:.3g} s"
+                )
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command-line entry point: run the suite and write a JSON report.
+
+    Returns
+    -------
+    int
+        0 on success, 1 if timings regressed against ``--baseline``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="adc-benchmark",
+        description="Benchmark speed and accuracy of the ADCCalc interpolation methods.",
+    )
+    parser.add_argument(
+        "--lookup-table", help="ADC lookup CSV (default: etc/ADC_lookup.csv)"
+    )
+    parser.add_argument(
+        "--methods",
+        default=",".join(INTERP_METHODS),
+        help="comma-separated interpolation methods",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_SIZES[-1],
+        help="largest batch size; sizes are powers of ten up to this value",
+    )
+    parser.add_argument("--scalar-calls", type=int, default=10000)
+    parser.add_argument(
+        "--output", help="write the JSON report to this file (default: stdout)"
+    )
+    parser.add_argument("--baseline", help="JSON report to compare timings against")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    sizes = [10**k for k in range(len(str(max(args.max_size, 1))))]
+    sizes = [size for size in sizes if size <= args.max_size]
+    report = run_suite(
+        lookup_table=args.lookup_table,
+        methods=[m.strip() for m in args.methods.split(",") if m.strip()],
+        sizes=sizes,
+        n_scalar=args.scalar_calls,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_reports(report, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"Performance regression: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_bus_executor.py
+
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+__all__ = [
+    "PRIORITY_STOP",
+    "PRIORITY_MOTION",
+    "PRIORITY_POLL",
+    "BusExecutor",
+    "SerializedAccessor",
+    "get_bus_executor",
+]
+
+# 숫자가 작을수록 먼저 처리됨
+PRIORITY_STOP = 0
+PRIORITY_MOTION = 1
+PRIORITY_POLL = 2
+PRIORITY_NAMES = {
+    PRIORITY_STOP: "stop",
+    PRIORITY_MOTION: "motion",
+    PRIORITY_POLL: "poll",
+}
+_SHUTDOWN = PRIORITY_POLL + 1
+
+# task/thread별 현재 우선순위; bus 호출은 이 값으로 queue에 들어감
+_current_priority = contextvars.ContextVar("bus_priority", default=PRIORITY_MOTION)
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+class BusExecutor:
+    """
+    Serialized I/O executor of one physical bus.
+
+    All bus calls go through a single worker thread fed by a priority queue,
+    so Nanolib requests of both motors never interleave on the shared Modbus
+    RTU line. Queued calls are served stop first, then motion setup, then
+    status polls, FIFO within a class; the class of a call is taken from the
+    `priority` context of the calling thread or task. A call already on the
+    bus is never interrupted. Long-running commands (e.g. `AdcController.move_motor`, which
+    waits for the move to finish) run on a small dedicated command pool via
+    `run`; only their individual bus calls are queued on the worker.
+
+    Attributes
+    ----------
+    name : str
+        Name of the bus, used for the thread names.
+    """
+
+    def __init__(self, name="bus", command_workers=4):
+        """
+        Parameters
+        ----------
+        name : str, optional
+            Name of the bus.
+        command_workers : int, optional
+            Threads of the command pool used by `run`; enough for a move of
+            each motor plus a stop of each, so a stop never waits for a slot.
+        """
+        self.name = name
+        self._closed = False
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._commands = ThreadPoolExecutor(
+            max_workers=command_workers, thread_name_prefix=f"adc-{name}-cmd"
+        )
+        self._metrics_lock = threading.Lock()
+        self.reset_metrics()
+        self._worker = threading.Thread(
+            target=self._run_worker, name=f"adc-{name}-io", daemon=True
+        )
+        self._worker.start()
+
+    def reset_metrics(self):
+        """
+        Reset the request counters and latency statistics.
+        """
+        with self._metrics_lock:
+            self._submitted = 0
+            self._completed = 0
+            self._failed = 0
+            self._max_depth = 0
+            self._wait_sum = 0.0
+            self._wait_max = 0.0
+            self._service_sum = 0.0
+            self._service_max = 0.0
+            # priority -> [completed, wait sum, wait max]
+            self._by_priority = {p: [0, 0.0, 0.0] for p in PRIORITY_NAMES}
+
+    def _run_worker(self):
+        while True:
+            priority, _, future, fn, args, kwargs, enqueued = self._queue.get()
+            if priority == _SHUTDOWN:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                error, result = e, None
+            else:
+                error = None
+            finished = time.monotonic()
+            with self._metrics_lock:
+                wait, service = started - enqueued, finished - started
+                self._completed += 1
+                self._failed += error is not None
+                self._wait_sum += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._service_sum += service
+                self._service_max = max(self._service_max, service)
+                stats = self._by_priority[priority]
+                stats[0] += 1
+                stats[1] += wait
+                stats[2] = max(stats[2], wait)
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Queue a bus call and return its future.
+
+        Raises
+        ------
+        RuntimeError
+            If the executor was shut down.
+        """
+        if self._closed:
+            raise RuntimeError(f"Bus executor {self.name} is shut down.")
+        future = Future()
+        with self._metrics_lock:
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._queue.qsize() + 1)
+        self._queue.put(
+            (
+                _current_priority.get(),
+                next(self._seq),
+                future,
+                fn,
+                args,
+                kwargs,
+                time.monotonic(),
+            )
+        )
+        return future
+
+    @staticmethod
+    @contextlib.contextmanager
+    def priority(level):
+        """
+        Context manager setting the priority of the bus calls made inside it.
+
+        Parameters
+        ----------
+        level : {PRIORITY_STOP, PRIORITY_MOTION, PRIORITY_POLL}
+            Priority class; calls outside any context use `PRIORITY_MOTION`.
+        """
+        token = _current_priority.set(level)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run a bus call on the worker and wait for its result.
+
+        Calls made from the worker thread itself run inline, so a queued
+        function may issue further bus calls without deadlocking.
+        """
+        if threading.current_thread() is self._worker:
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def call_async(self, fn, *args, **kwargs):
+        """
+        Awaitable version of `call`.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    async def run(self, fn, *args, **kwargs):
+        """
+        Run a blocking controller command on the bus's command pool.
+
+        Use this instead of `asyncio.to_thread` for motion commands; their
+        bus traffic is still serialized through the worker. The priority
+        context of the caller is carried over to the pool thread.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._commands, lambda: ctx.run(fn, *args, **kwargs)
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def metrics(self) -> dict:
+        """
+        Return queue depth and latency statistics of the bus.
+
+        Returns
+        -------
+        dict
+            ``queue_depth``, ``max_queue_depth``, ``submitted``,
+            ``completed``, ``failed``, mean/max queue wait and service time
+            in seconds, and ``by_priority`` with the count and mean/max
+            queue wait of each priority class.
+        """
+        with self._metrics_lock:
+            n = self._completed
+            by_priority = {
+                PRIORITY_NAMES[p]: {
+                    "completed": count,
+                    "mean_wait": wait_sum / count if count else 0.0,
+                    "max_wait": wait_max,
+                }
+                for p, (count, wait_sum, wait_max) in self._by_priority.items()
+            }
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_depth,
+                "submitted": self._submitted,
+                "completed": n,
+                "failed": self._failed,
+                "mean_wait": self._wait_sum / n if n else 0.0,
+                "max_wait": self._wait_max,
+                "mean_service": self._service_sum / n if n else 0.0,
+                "max_service": self._service_max,
+                "by_priority": by_priority,
+            }
+
+    def shutdown(self, wait=True):
+        """
+        Stop the worker after the queued calls and the command pool.
+        """
+        with _executors_lock:
+            for key, bus in list(_executors.items()):
+                if bus is self:
+                    del _executors[key]
+        self._closed = True
+        self._queue.put((_SHUTDOWN, next(self._seq), None, None, (), {}, 0.0))
+        self._commands.shutdown(wait=wait)
+        if wait:
+            self._worker.join()
+
+
+class SerializedAccessor:
+    """
+    Proxy of a Nanolib accessor whose method calls run on a `BusExecutor`.
+
+    The wrapper of a method is built on first access and stored on the
+    proxy, so later lookups on the polling hot path are plain attribute
+    reads; non-callable attributes are always forwarded.
+    """
+
+    def __init__(self, accessor, bus):
+        self._accessor = accessor
+        self._bus = bus
+
+    def __getattr__(self, name):
+        attr = getattr(self._accessor, name)
+        if not callable(attr):
+            return attr
+        bus = self._bus
+
+        def _call(*args, **kwargs):
+            return bus.call(attr, *args, **kwargs)
+
+        setattr(self, name, _call)  # 다음 접근부터 __getattr__ 생략
+        return _call
+
+
+def get_bus_executor(bus_key) -> BusExecutor:
+    """
+    Return the executor of a physical bus, creating it on first use, so
+    that all controllers on the same bus share one worker.
+    """
+    with _executors_lock:
+        bus = _executors.get(bus_key)
+        if bus is None:
+            bus = BusExecutor(name=f"bus{bus_key}")
+            _executors[bus_key] = bus
+        return bus
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-17
+# @Filename: adc_cache.py
+
+import os
+
+__all__ = ["get_cache_dir"]
+
+
+def get_cache_dir() -> str:
+    """
+    Return the user-writable cache directory of this package.
+
+    ``$KSPEC_ADC_CACHE_DIR`` if set, else ``$XDG_CACHE_HOME/kspec_adc_controller``,
+    else ``~/.cache/kspec_adc_controller``. The package directory itself is
+    not used, since it may be read-only (e.g. a site-packages install). The
+    directory is not created here; writers create it on first use.
+    """
+    cache_dir = os.environ.get("KSPEC_ADC_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(xdg_cache, "kspec_adc_controller")
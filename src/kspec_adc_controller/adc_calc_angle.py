@@ -5,14 +5,30 @@
 # @Date: 2024-12-06
 # @Filename: adc_calc_angle.py
 
+import bisect
 import os
-import numpy as np
+import threading
+import time
+from collections import namedtuple
 
-from scipy.interpolate import CubicSpline
-from scipy.interpolate import PchipInterpolator
-from scipy.interpolate import Akima1DInterpolator
+import numpy as np
 
 from .adc_logger import AdcLogger
+from .adc_interp_cache import InterpCache, lookup_table_digest
+
+COUNT_PER_DEGREE = 16200 / 360  # 360 degrees = 16200 counts
+
+_ROUNDING_FUNCS = {
+    "trunc": np.trunc,  # toward zero, same as int() in degree_to_count
+    "nearest": np.rint,  # half to even
+    "floor": np.floor,
+}
+
+SPLINE_METHODS = ("cubic", "pchip", "akima")
+POLY_METHODS = ("chebyshev", "minimax")
+INTERP_METHODS = SPLINE_METHODS + POLY_METHODS
+DEFAULT_POLY_DEGREE = 16
+DEFAULT_INVERSE_STEP = 0.01  # zenith-angle spacing of the inverse map (degree)
 
 
 def _get_default_lookup_path() -> str:
@@ -30,11 +46,382 @@ def _get_default_lookup_path() -> str:
     return default_path
 
 
+class PiecewisePolynomial:
+    """
+    Pure NumPy evaluator of a piecewise polynomial in SciPy `PPoly` layout.
+
+    The value on interval ``x[i] <= za < x[i+1]`` is
+    ``sum(c[m, i] * (za - x[i]) ** (k - 1 - m) for m in range(k))``,
+    evaluated with Horner's scheme. Points outside the breakpoints use the
+    first/last interval polynomial, as `PPoly` does with extrapolation.
+
+    Attributes
+    ----------
+    x : numpy.ndarray
+        Breakpoints, shape (m + 1,)
+    c : numpy.ndarray
+        Coefficients, shape (k, m)
+    """
+
+    def __init__(self, c, x):
+        self.c = c
+        self.x = x
+        self._c_rows = [row.tolist() for row in np.asarray(c)]
+        self._x_list = np.asarray(x).tolist()
+        self._last = len(self._x_list) - 2
+
+    def __call__(self, za):
+        if isinstance(za, (int, float)):
+            i = bisect.bisect_right(self._x_list, za) - 1
+            i = min(max(i, 0), self._last)
+            dx = za - self._x_list[i]
+            y = 0.0
+            for row in self._c_rows:
+                y = y * dx + row[i]
+            return y
+
+        za = np.asarray(za, dtype=float)
+        idx = np.clip(np.searchsorted(self.x, za, side="right") - 1, 0, self._last)
+        dx = za - self.x[idx]
+        y = np.zeros_like(dx)
+        for row in self.c:
+            y = y * dx + row[idx]
+        return y
+
+
+class ChebyshevSeries:
+    """
+    Pure NumPy evaluator of a Chebyshev series on the interval [x[0], x[1]].
+
+    The series is evaluated with Clenshaw's recurrence. Coefficients are kept
+    as a (degree + 1, 1) matrix so the cache can store them in the same
+    (breakpoints, coefficients) layout as piecewise polynomials.
+
+    Attributes
+    ----------
+    x : numpy.ndarray
+        Interval end points, shape (2,)
+    c : numpy.ndarray
+        Chebyshev coefficients, shape (degree + 1, 1)
+    """
+
+    def __init__(self, c, x):
+        self.c = c
+        self.x = x
+        self.coef = np.asarray(c)[:, 0]
+        self.degree = self.coef.size - 1
+        self._coef_rev = self.coef[::-1].tolist()
+        self._mid = float(x[0] + x[1]) / 2
+        self._inv_half = 2 / float(x[1] - x[0])
+
+    def __call__(self, za):
+        if isinstance(za, (int, float)):
+            t = (za - self._mid) * self._inv_half
+            b1 = b2 = 0.0
+            for c in self._coef_rev[:-1]:
+                b1, b2 = 2 * t * b1 - b2 + c, b1
+            return self._coef_rev[-1] + t * b1 - b2
+
+        t = (np.asarray(za, dtype=float) - self._mid) * self._inv_half
+        return np.polynomial.chebyshev.chebval(t, self.coef)
+
+
+def _fit_chebyshev(data_za, data_adc, degree, minimax):
+    """
+    Fit a Chebyshev series to the PCHIP curve through the lookup data.
+
+    The PCHIP baseline is sampled at Chebyshev points, which cluster toward the
+    ends of the range where the ADC curve is steepest. 'chebyshev' is the
+    least-squares fit to these samples; 'minimax' refines it with Lawson's
+    iteratively reweighted least squares toward the best uniform approximation.
+    """
+    baseline = fit_interpolant(data_za, data_adc, "pchip")
+    za_min, za_max = float(data_za.min()), float(data_za.max())
+
+    n_nodes = max(16 * (degree + 1), 512)
+    t = np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes)
+    y = baseline(za_min + (t + 1) * (za_max - za_min) / 2)
+
+    coef = np.polynomial.chebyshev.chebfit(t, y, degree)
+    if minimax:
+        weights = np.full(n_nodes, 1.0 / n_nodes)
+        for _ in range(100):
+            error = np.abs(np.polynomial.chebyshev.chebval(t, coef) - y)
+            weights = weights * error
+            if not weights.sum() > 0:
+                break
+            weights /= weights.sum()
+            coef = np.polynomial.chebyshev.chebfit(t, y, degree, w=np.sqrt(weights))
+
+    return ChebyshevSeries(coef[:, np.newaxis], np.array([za_min, za_max]))
+
+
+def fit_interpolant(data_za, data_adc, method, degree=None):
+    """
+    Fit an interpolant to the lookup data and convert it for NumPy evaluation.
+
+    SciPy is imported here rather than at module import, so that loading a
+    cached interpolant never pays the SciPy import cost.
+
+    Parameters
+    ----------
+    data_za : numpy.ndarray
+        Zenith angles of the lookup table (degree), increasing.
+    data_adc : numpy.ndarray
+        ADC angles of the lookup table (degree).
+    method : {'cubic', 'pchip', 'akima', 'chebyshev', 'minimax'}
+        Interpolation method.
+    degree : int, optional
+        Polynomial degree for 'chebyshev' and 'minimax'. If None,
+        `DEFAULT_POLY_DEGREE` is used. Ignored for spline methods.
+
+    Returns
+    -------
+    PiecewisePolynomial or ChebyshevSeries
+        The fitted interpolant.
+    """
+    if method not in INTERP_METHODS:
+        raise ValueError(f"Invalid interpolation method: {method}")
+
+    if method in POLY_METHODS:
+        degree = DEFAULT_POLY_DEGREE if degree is None else degree
+        if int(degree) != degree or degree < 1:
+            raise ValueError(f"Invalid polynomial degree: {degree}")
+        return _fit_chebyshev(data_za, data_adc, int(degree), method == "minimax")
+
+    from scipy.interpolate import Akima1DInterpolator
+    from scipy.interpolate import CubicSpline
+    from scipy.interpolate import PchipInterpolator
+
+    if method == "cubic":
+        fitted = CubicSpline(data_za, data_adc)
+    elif method == "pchip":
+        fitted = PchipInterpolator(data_za, data_adc)
+    else:
+        fitted = Akima1DInterpolator(data_za, data_adc)
+    return PiecewisePolynomial(fitted.c, fitted.x)
+
+
+def poly_fit_report(fn_za_adc, data_za, data_adc, n_probe=4001):
+    """
+    Compare a fitted interpolant against the PCHIP baseline.
+
+    Parameters
+    ----------
+    fn_za_adc : callable
+        The fitted interpolant.
+    data_za, data_adc : numpy.ndarray
+        Lookup table columns (degree).
+    n_probe : int, optional
+        Number of uniformly spaced zenith angles compared.
+
+    Returns
+    -------
+    dict
+        Maximum and RMS deviation from PCHIP (degree), the maximum deviation
+        in encoder counts, and the maximum residual at the table points.
+    """
+    baseline = fit_interpolant(data_za, data_adc, "pchip")
+    probe = np.linspace(data_za.min(), data_za.max(), n_probe)
+    diff = fn_za_adc(probe) - baseline(probe)
+    max_abs = float(np.abs(diff).max())
+    return {
+        "max_abs_error_deg": max_abs,
+        "rms_error_deg": float(np.sqrt(np.mean(diff**2))),
+        "max_abs_error_counts": max_abs * COUNT_PER_DEGREE,
+        "max_table_residual_deg": float(np.abs(fn_za_adc(data_za) - data_adc).max()),
+    }
+
+
+def degrees_to_counts(degrees, dtype=np.int64, rounding="trunc"):
+    """
+    Convert degree values to encoder counts in one vectorized pass.
+
+    Parameters
+    ----------
+    degrees : array-like
+        The degree values to be converted.
+    dtype : {numpy.int64, numpy.int32}, optional
+        Integer type of the returned array.
+    rounding : {'trunc', 'nearest', 'floor'}, optional
+        Rounding mode. 'trunc' rounds toward zero like
+        `ADCCalc.degree_to_count`, 'nearest' rounds half to even, and
+        'floor' rounds toward -inf.
+
+    Returns
+    -------
+    numpy.ndarray
+        The corresponding count values.
+
+    Raises
+    ------
+    ValueError
+        If `rounding` or `dtype` is not supported.
+    """
+    if rounding not in _ROUNDING_FUNCS:
+        raise ValueError(f"Invalid rounding mode: {rounding}")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.int32), np.dtype(np.int64)):
+        raise ValueError(f"Invalid count dtype: {dtype}")
+    counts = _ROUNDING_FUNCS[rounding](
+        np.asarray(degrees, dtype=float) * COUNT_PER_DEGREE
+    )
+    return counts.astype(dtype)
+
+
+class SetpointGrid:
+    """
+    Dense uniform zenith-angle grid sampled once from an interpolation function.
+
+    Lookups use O(1) index arithmetic plus a linear blend between nodes.
+    The grid spans [za_min, za_max]; the actual spacing is adjusted down so
+    that both ends fall on grid nodes.
+
+    Attributes
+    ----------
+    step : float
+        Actual grid spacing (degree)
+    requested_step : float
+        Grid spacing requested by the caller (degree)
+    max_error : float
+        Maximum absolute deviation of the grid lookup from the exact
+        interpolation function (degree)
+    """
+
+    def __init__(self, fn_za_adc, za_min, za_max, grid_step):
+        n_cells = max(1, int(np.ceil((za_max - za_min) / grid_step)))
+        grid_za = np.linspace(za_min, za_max, n_cells + 1)
+
+        self.values = np.asarray(fn_za_adc(grid_za), dtype=float)
+        self._values_list = (
+            self.values.tolist()
+        )  # scalar lookup은 list 인덱싱이 더 빠름
+        self._za_min = float(za_min)
+        self._last = n_cells - 1
+        self._inv_step = n_cells / (za_max - za_min)
+        self.size = n_cells + 1
+        self.step = float((za_max - za_min) / n_cells)
+        self.requested_step = grid_step
+
+        # 각 cell 내부를 8등분한 지점에서 exact interpolant와 비교
+        probe = np.linspace(za_min, za_max, 8 * n_cells + 1)
+        self.max_error = float(np.abs(self(probe) - fn_za_adc(probe)).max())
+
+    def __call__(self, za):
+        """
+        Evaluate the grid at the given zenith angle(s) by linear blending.
+
+        Bounds are not checked here; callers must validate the input first.
+        """
+        if isinstance(za, (int, float)):
+            pos = (za - self._za_min) * self._inv_step
+            i = int(pos)
+            if i > self._last:
+                i = self._last
+            y0 = self._values_list[i]
+            return y0 + (pos - i) * (self._values_list[i + 1] - y0)
+
+        pos = (np.asarray(za, dtype=float) - self._za_min) * self._inv_step
+        idx = np.minimum(pos.astype(np.intp), self._last)
+        y0 = self.values[idx]
+        return y0 + (pos - idx) * (self.values[idx + 1] - y0)
+
+
+class InverseMap:
+    """
+    Precomputed monotone inverse of an interpolation function (ADC angle to
+    zenith angle).
+
+    The interpolation function is sampled once on a uniform zenith-angle grid;
+    queries locate the ADC angle by binary search and blend linearly between
+    the two neighbouring samples, so no root-finding is needed per query.
+    Samples that break strict monotonicity (e.g. the ripple of a minimax fit)
+    are dropped, so the map is the inverse of the monotone envelope.
+
+    Attributes
+    ----------
+    angle_min, angle_max : float
+        ADC angle range covered by the map (degree)
+    size : int
+        Number of samples kept
+    n_dropped : int
+        Number of non-monotone samples dropped
+    max_error : float
+        Maximum absolute zenith-angle round-trip error
+        ``|inverse(fn_za_adc(za)) - za|`` at the samples and the midpoints
+        between them (degree)
+    """
+
+    def __init__(self, fn_za_adc, za_min, za_max, step=DEFAULT_INVERSE_STEP):
+        n_cells = max(1, int(np.ceil((za_max - za_min) / step)))
+        grid_za = np.linspace(za_min, za_max, n_cells + 1)
+        grid_adc = np.asarray(fn_za_adc(grid_za), dtype=float)
+
+        # ADC angle가 감소하는 table이면 뒤집어서 오름차순으로 맞춤
+        if grid_adc[-1] < grid_adc[0]:
+            grid_za, grid_adc = grid_za[::-1], grid_adc[::-1]
+        running_max = np.maximum.accumulate(grid_adc)
+        keep = grid_adc == running_max
+        keep[1:] &= running_max[1:] > running_max[:-1]
+
+        self.angles = grid_adc[keep]
+        self.za = grid_za[keep]
+        self._angles_list = self.angles.tolist()
+        self._za_list = self.za.tolist()
+        self.angle_min = float(self.angles[0])
+        self.angle_max = float(self.angles[-1])
+        self.size = int(self.angles.size)
+        self.n_dropped = int(grid_adc.size - self.size)
+
+        # sample 사이 중점에서 round-trip 오차 측정
+        probe = np.linspace(za_min, za_max, 2 * n_cells + 1)
+        probe_adc = np.clip(fn_za_adc(probe), self.angle_min, self.angle_max)
+        self.max_error = float(np.abs(self(probe_adc) - probe).max())
+
+    def __call__(self, angle):
+        """
+        Evaluate the zenith angle(s) of the given ADC angle(s).
+
+        Angles outside [angle_min, angle_max] map to NaN.
+        """
+        if isinstance(angle, (int, float)):
+            if not self.angle_min <= angle <= self.angle_max:
+                return float("nan")
+            i = min(
+                max(bisect.bisect_right(self._angles_list, angle) - 1, 0), self.size - 2
+            )
+            a0, a1 = self._angles_list[i], self._angles_list[i + 1]
+            z0, z1 = self._za_list[i], self._za_list[i + 1]
+            return z0 + (angle - a0) * (z1 - z0) / (a1 - a0)
+
+        angle = np.asarray(angle, dtype=float)
+        idx = np.clip(
+            np.searchsorted(self.angles, angle, side="right") - 1, 0, self.size - 2
+        )
+        a0, a1 = self.angles[idx], self.angles[idx + 1]
+        z0, z1 = self.za[idx], self.za[idx + 1]
+        za = z0 + (angle - a0) * (z1 - z0) / (a1 - a0)
+        return np.where(
+            (angle >= self.angle_min) & (angle <= self.angle_max), za, np.nan
+        )
+
+
+# calc_from_za가 한 번의 참조로 읽는 불변 묶음. reload 시 통째로 교체된다.
+_InterpState = namedtuple(
+    "_InterpState", ["fn_za_adc", "za_min", "za_max", "grid", "inverse", "digest"]
+)
+
+
 class ADCCalc:
     """
     A class to calculate the ADC angle from the input zenith angle and
     given lookup table.
 
+    The interpolation function, its bounds and the optional setpoint grid are
+    kept in a single immutable state object. Rebuilding (e.g. by hot reload)
+    replaces that object in one assignment, so concurrent `calc_from_za`
+    calls see either the old or the new interpolant, never a mix.
+
     Attributes
     ----------
     fn_za_adc : object
@@ -43,9 +430,43 @@ class ADCCalc:
         Minimum value of zenith angle in the lookup table (degree)
     za_max : float
         Maximum value of zenith angle in the lookup table (degree)
+    lookup_table : str
+        Path of the lookup table in use
+    method : str
+        Interpolation method in use
+    grid_step : float or None
+        Spacing of the precomputed setpoint grid (degree), or None if
+        grid mode is disabled
+    grid_max_error : float or None
+        Maximum absolute deviation of the grid lookup from the exact
+        interpolation function (degree)
+    interp_cache : InterpCache or None
+        On-disk interpolant cache, or None if caching is disabled
+    interp_cache_hit : bool or None
+        Whether the interpolation function was loaded from the cache
+        (None if caching is disabled)
+    interp_load_time : float
+        Time spent creating the interpolation function (seconds)
+    poly_degree : int or None
+        Polynomial degree requested for 'chebyshev'/'minimax'
+    fit_report : dict or None
+        Deviation of a freshly fitted 'chebyshev'/'minimax' interpolant from
+        the PCHIP baseline (see `poly_fit_report`); None for spline methods
+        and for interpolants loaded from the cache
+    inverse_max_error : float
+        Maximum zenith-angle round-trip error of the inverse map used by
+        `za_from_angle` / `za_from_counts` (degree)
     """
 
-    def __init__(self, lookup_table=None, method="pchip"):
+    def __init__(
+        self,
+        lookup_table=None,
+        method="pchip",
+        grid_step=None,
+        use_cache=False,
+        cache_dir=None,
+        poly_degree=None,
+    ):
         """
         Parameters
         ----------
@@ -53,10 +474,30 @@ class ADCCalc:
             A logger instance for debug/info/error outputs.
         lookup_table : str, optional
             A path to the ADC lookup CSV. If None, a default path is used.
-        method : {'cubic', 'pchip', 'akima'}, optional
-            The interpolation method to be used.
+        method : {'cubic', 'pchip', 'akima', 'chebyshev', 'minimax'}, optional
+            The interpolation method to be used. 'chebyshev' and 'minimax' fit a
+            single Chebyshev series to the PCHIP curve (least-squares and
+            near-best uniform approximation, respectively).
+        grid_step : float, optional
+            If given, the interpolation function is sampled once onto a dense
+            uniform zenith-angle grid with this spacing (degree), and
+            `calc_from_za` answers from the grid by linear blending.
+        use_cache : bool, optional
+            If True, the fitted interpolant is stored in and loaded from an
+            on-disk cache keyed by the lookup table's SHA-256 and the method.
+        cache_dir : str, optional
+            Directory of the interpolant cache. If None, a default path is used.
+        poly_degree : int, optional
+            Polynomial degree for 'chebyshev' and 'minimax'. If None,
+            `DEFAULT_POLY_DEGREE` is used.
         """
         self.logger = AdcLogger(__file__)
+        self.interp_cache = InterpCache(cache_dir) if use_cache else None
+        self.poly_degree = poly_degree
+        self._state = None
+        self._reload_lock = threading.Lock()
+        self._watch_thread = None
+        self._watch_stop = threading.Event()
 
         # 1) lookup_table이 None이면 _get_default_lookup_path()로 자동 설정
         if lookup_table is None:
@@ -65,10 +506,43 @@ class ADCCalc:
         # 2) 주어진(혹은 기본) lookup_table 경로로 Interpolation Function 생성
         self.create_interp_func(lookup_table, method)
 
+        # 3) grid_step이 주어지면 dense setpoint grid 생성
+        if grid_step is not None:
+            self.build_grid(grid_step)
+
+    @property
+    def fn_za_adc(self):
+        return self._state.fn_za_adc
+
+    @property
+    def za_min(self):
+        return self._state.za_min
+
+    @property
+    def za_max(self):
+        return self._state.za_max
+
+    @property
+    def grid_step(self):
+        grid = self._state.grid
+        return grid.step if grid is not None else None
+
+    @property
+    def grid_max_error(self):
+        grid = self._state.grid
+        return grid.max_error if grid is not None else None
+
+    @property
+    def inverse_max_error(self):
+        return self._state.inverse.max_error
+
     def create_interp_func(self, lookup_table, method):
         """
         Create the interpolation function using the given lookup table.
 
+        The inverse map (ADC angle to zenith angle) is rebuilt as well, and so
+        is the setpoint grid if one is active, before the swap.
+
         Parameters
         ----------
         lookup_table : str
@@ -77,7 +551,38 @@ class ADCCalc:
 
         method : str
             Interpolation method from the ADC lookup table
-            It should be either 'cubic', 'pchip', or 'akima'.
+            It should be either 'cubic', 'pchip', 'akima', 'chebyshev' or 'minimax'.
+        """
+        with self._reload_lock:
+            fn_za_adc, za_min, za_max, digest = self._load_interp(lookup_table, method)
+
+            grid = None
+            if self._state is not None and self._state.grid is not None:
+                grid = SetpointGrid(
+                    fn_za_adc, za_min, za_max, self._state.grid.requested_step
+                )
+
+            inverse = InverseMap(fn_za_adc, za_min, za_max)
+            self._state = _InterpState(fn_za_adc, za_min, za_max, grid, inverse, digest)
+            self.lookup_table = lookup_table
+            self.method = method
+            self._file_signature = self._stat_signature(lookup_table)
+            self._pending_signature = None
+
+        if inverse.n_dropped:
+            self.logger.warning(
+                f"Interpolation function is not monotone; {inverse.n_dropped} samples "
+                f"dropped from the inverse map."
+            )
+
+    def _load_interp(self, lookup_table, method):
+        """
+        Load or fit the interpolation function of a lookup table.
+
+        Returns
+        -------
+        tuple
+            (interpolation function, za_min, za_max, lookup table SHA-256)
         """
         # 경로 유효성 확인
         if not os.path.isfile(lookup_table):
@@ -85,27 +590,232 @@ class ADCCalc:
             raise FileNotFoundError(f"Lookup table cannot be found: {lookup_table}")
 
         self.logger.info(f"Lookup table found: {lookup_table}")
+        start_time = time.perf_counter()
+
+        digest = lookup_table_digest(lookup_table)
+        cache_key = method
+        if method in POLY_METHODS:
+            degree = (
+                DEFAULT_POLY_DEGREE if self.poly_degree is None else self.poly_degree
+            )
+            cache_key = f"{method}{degree}"
+
+        self.interp_cache_hit = None
+        self.fit_report = None
+        if self.interp_cache is not None:
+            try:
+                cached = self.interp_cache.load(digest, cache_key)
+            except Exception as e:
+                self.logger.warning(f"Failed to load interpolant cache: {e}")
+                cached = None
+
+            self.interp_cache_hit = cached is not None
+            if cached is not None:
+                breakpoints, coefficients = cached
+                if method in POLY_METHODS:
+                    fn_za_adc = ChebyshevSeries(coefficients, breakpoints)
+                else:
+                    fn_za_adc = PiecewisePolynomial(coefficients, breakpoints)
+                self.interp_load_time = time.perf_counter() - start_time
+                self.logger.info(
+                    f"Interpolation function using {method} method loaded from cache "
+                    f"in {self.interp_load_time * 1e3:.3f} ms."
+                )
+                return fn_za_adc, breakpoints[0], breakpoints[-1], digest
 
         try:
             adc_raw_data = np.genfromtxt(lookup_table, comments="#", delimiter=",")
             data_za, data_adc = adc_raw_data[:, 0], adc_raw_data[:, 1]
-            self.za_min, self.za_max = data_za.min(), data_za.max()
+            za_min, za_max = data_za.min(), data_za.max()
         except Exception as e:
             self.logger.error(f"Failed to read lookup table: {e}")
             raise ValueError(f"Failed to read lookup table: {e}")
 
         # Set interpolation function based on chosen method
-        if method == "cubic":
-            self.fn_za_adc = CubicSpline(data_za, data_adc)
-        elif method == "pchip":
-            self.fn_za_adc = PchipInterpolator(data_za, data_adc)
-        elif method == "akima":
-            self.fn_za_adc = Akima1DInterpolator(data_za, data_adc)
-        else:
+        if method not in INTERP_METHODS:
             self.logger.error(f"Invalid interpolation method: {method}")
             raise ValueError(f"Invalid interpolation method: {method}")
+        try:
+            fn_za_adc = fit_interpolant(data_za, data_adc, method, self.poly_degree)
+        except ValueError as e:
+            self.logger.error(f"Failed to fit interpolation function: {e}")
+            raise
+
+        if method in POLY_METHODS:
+            self.fit_report = poly_fit_report(fn_za_adc, data_za, data_adc)
+            self.logger.info(
+                f"{method} fit (degree {fn_za_adc.degree}) vs PCHIP: "
+                f"max |error| {self.fit_report['max_abs_error_deg']:.4g} deg "
+                f"({self.fit_report['max_abs_error_counts']:.3g} counts), "
+                f"RMS {self.fit_report['rms_error_deg']:.4g} deg, "
+                f"max table residual {self.fit_report['max_table_residual_deg']:.4g} deg."
+            )
+
+        if self.interp_cache is not None:
+            try:
+                self.interp_cache.store(digest, cache_key, fn_za_adc.x, fn_za_adc.c)
+            except Exception as e:
+                self.logger.warning(f"Failed to store interpolant cache: {e}")
+
+        self.interp_load_time = time.perf_counter() - start_time
+        self.logger.info(
+            f"Interpolation function using {method} method created "
+            f"in {self.interp_load_time * 1e3:.3f} ms."
+        )
+        return fn_za_adc, za_min, za_max, digest
+
+    def build_grid(self, grid_step):
+        """
+        Sample the interpolation function onto a dense uniform zenith-angle grid.
+
+        The maximum error of the linear blend against the exact interpolation
+        function is available as `grid_max_error` afterwards.
+
+        Parameters
+        ----------
+        grid_step : float
+            Requested grid spacing (degree). Must be positive.
+        """
+        if not grid_step > 0:
+            self.logger.error(f"Invalid grid step: {grid_step}")
+            raise ValueError(f"Invalid grid step: {grid_step}")
+
+        with self._reload_lock:
+            state = self._state
+            grid = SetpointGrid(state.fn_za_adc, state.za_min, state.za_max, grid_step)
+            self._state = state._replace(grid=grid)
+
+        self.logger.info(
+            f"Setpoint grid created: {grid.size} nodes, step {grid.step:.6g} deg, "
+            f"max error {grid.max_error:.3g} deg."
+        )
+
+    @staticmethod
+    def _stat_signature(path):
+        """
+        Return (mtime_ns, size) of a file, or None if it cannot be stat'ed.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def reload(self) -> bool:
+        """
+        Rebuild the interpolation function from the current lookup table and
+        swap it in atomically.
+
+        On failure the previous interpolation function stays in use.
+
+        Returns
+        -------
+        bool
+            True if the new interpolation function was swapped in.
+        """
+        start_time = time.perf_counter()
+        try:
+            self.create_interp_func(self.lookup_table, self.method)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to reload lookup table {self.lookup_table}; "
+                f"keeping the previous interpolation function: {e}"
+            )
+            return False
+
+        elapsed = time.perf_counter() - start_time
+        self.logger.info(
+            f"Lookup table {self.lookup_table} reloaded and swapped in "
+            f"{elapsed * 1e3:.3f} ms."
+        )
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the lookup table if its content changed since it was loaded.
+
+        A change in mtime/size must be observed on two consecutive calls before
+        the file is read, so that a table still being written is not picked up.
+        The SHA-256 is then compared, so touching the file without changing its
+        content does not trigger a rebuild.
+
+        Returns
+        -------
+        bool
+            True if a new interpolation function was swapped in.
+        """
+        signature = self._stat_signature(self.lookup_table)
+        if signature is None or signature == self._file_signature:
+            self._pending_signature = None
+            return False
+        if signature != self._pending_signature:
+            self._pending_signature = signature
+            return False
+
+        try:
+            digest = lookup_table_digest(self.lookup_table)
+        except OSError as e:
+            self.logger.warning(f"Failed to read lookup table for reload: {e}")
+            return False
+        if digest == self._state.digest:
+            self._file_signature = signature
+            self._pending_signature = None
+            return False
+
+        if not self.reload():
+            # 같은 파일로 반복 실패하지 않도록 현재 signature를 기억
+            self._file_signature = signature
+            self._pending_signature = None
+            return False
+        return True
 
-        self.logger.info(f"Interpolation function using {method} method created.")
+    def start_watching(self, interval=1.0):
+        """
+        Start a background thread that hot-reloads the lookup table on change.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Polling interval of the file mtime/size (seconds).
+        """
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            self.logger.info("Lookup table watcher is already running.")
+            return
+
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(interval,),
+            name="adc-lookup-watcher",
+            daemon=True,
+        )
+        self._watch_thread.start()
+        self.logger.info(
+            f"Watching lookup table {self.lookup_table} every {interval} s."
+        )
+
+    def stop_watching(self, timeout=None):
+        """
+        Stop the lookup table watcher thread.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for the thread to finish (seconds).
+        """
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watch_thread.join(timeout)
+        self._watch_thread = None
+        self.logger.info("Lookup table watcher stopped.")
+
+    def _watch_loop(self, interval):
+        while not self._watch_stop.wait(interval):
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                self.logger.error(f"Error in lookup table watcher: {e}")
 
     def calc_from_za(self, za):
         """
@@ -121,23 +831,26 @@ class ADCCalc:
         float or array-like
             The corresponding ADC angle(s) in degrees.
         """
+        state = self._state  # reload와 무관하게 한 번 읽은 state만 사용
         if isinstance(za, (int, float)):  # For single values
-            if za < self.za_min or za > self.za_max:
+            if za < state.za_min or za > state.za_max:
                 self.logger.error(
-                    f"Input zenith angle {za} is out of bounds ({self.za_min}, {self.za_max})"
+                    f"Input zenith angle {za} is out of bounds ({state.za_min}, {state.za_max})"
                 )
                 raise ValueError(f"Input zenith angle {za} is out of bounds.")
         elif hasattr(za, "min") and hasattr(za, "max"):  # For numpy arrays, etc.
-            if za.min() < self.za_min or za.max() > self.za_max:
+            if za.min() < state.za_min or za.max() > state.za_max:
                 self.logger.error(
-                    f"Input zenith angle array is out of bounds ({self.za_min}, {self.za_max})"
+                    f"Input zenith angle array is out of bounds ({state.za_min}, {state.za_max})"
                 )
                 raise ValueError("Input zenith angle array is out of bounds.")
         else:
             self.logger.error(f"Invalid type for zenith angle: {type(za)}")
             raise TypeError(f"Invalid type for zenith angle: {type(za)}")
 
-        return self.fn_za_adc(za)
+        if state.grid is not None:
+            return state.grid(za)
+        return state.fn_za_adc(za)
 
     def degree_to_count(self, degree):
         """
@@ -153,8 +866,106 @@ class ADCCalc:
         int
             The corresponding count value for the given degree.
         """
-        count_per_degree = 16200 / 360  # 360 degrees = 16200 counts
-        count = degree * count_per_degree
+        count = degree * COUNT_PER_DEGREE
 
         self.logger.debug(f"Converted {degree} degrees to {int(count)} counts.")
         return int(count)
+
+    def degrees_to_counts(self, degrees, dtype=np.int64, rounding="trunc"):
+        """
+        Convert an array of degree values to count values in one vectorized pass.
+
+        Parameters
+        ----------
+        degrees : array-like
+            The degree values to be converted.
+        dtype : {numpy.int64, numpy.int32}, optional
+            Integer type of the returned array.
+        rounding : {'trunc', 'nearest', 'floor'}, optional
+            Rounding mode. 'trunc' rounds toward zero like `degree_to_count`,
+            'nearest' rounds half to even, and 'floor' rounds toward -inf.
+
+        Returns
+        -------
+        numpy.ndarray
+            The corresponding count values.
+
+        See Also
+        --------
+        degrees_to_counts : The module-level conversion used here.
+        """
+        try:
+            return degrees_to_counts(degrees, dtype, rounding)
+        except ValueError as e:
+            self.logger.error(str(e))
+            raise
+
+    def za_to_counts(self, za, dtype=np.int64, rounding="trunc"):
+        """
+        Convert a zenith-angle series to encoder counts in one vectorized pass.
+
+        Parameters
+        ----------
+        za : array-like
+            Either a 1-D array of zenith angles (degree), or an (N, 2) array of
+            (time, zenith angle) pairs.
+        dtype : {numpy.int64, numpy.int32}, optional
+            Integer type of the returned counts.
+        rounding : {'trunc', 'nearest', 'floor'}, optional
+            Rounding mode, see `degrees_to_counts`.
+
+        Returns
+        -------
+        times : numpy.ndarray or None
+            The time column if (time, zenith angle) pairs were given, else None.
+        counts : numpy.ndarray
+            Encoder counts of the ADC angle for each zenith angle.
+        """
+        za = np.asarray(za, dtype=float)
+        times = None
+        if za.ndim == 2 and za.shape[1] == 2:
+            times, za = za[:, 0], za[:, 1]
+        elif za.ndim != 1:
+            self.logger.error(f"Invalid zenith angle series shape: {za.shape}")
+            raise ValueError(f"Invalid zenith angle series shape: {za.shape}")
+
+        counts = self.degrees_to_counts(self.calc_from_za(za), dtype, rounding)
+        self.logger.debug(f"Converted {counts.size} zenith angles to counts.")
+        return times, counts
+
+    def za_from_angle(self, angle):
+        """
+        Calculate the effective zenith angle of an ADC angle using the
+        precomputed inverse map.
+
+        Parameters
+        ----------
+        angle : float or array-like
+            ADC angle(s) in degrees.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The corresponding zenith angle(s) in degrees. Angles outside the
+            range covered by the lookup table map to NaN.
+        """
+        return self._state.inverse(angle)
+
+    def za_from_counts(self, counts):
+        """
+        Calculate the effective zenith angle of an encoder count value.
+
+        Parameters
+        ----------
+        counts : int or array-like
+            Encoder count value(s) of the ADC angle.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The corresponding zenith angle(s) in degrees, NaN outside the
+            lookup table range.
+        """
+        if isinstance(counts, (int, float)):
+            return self._state.inverse(counts / COUNT_PER_DEGREE)
+        return self._state.inverse(np.asarray(counts, dtype=float) / COUNT_PER_DEGREE)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_calc_atmosphere.py
+
+import itertools
+import os
+import time
+
+import numpy as np
+
+from .adc_logger import AdcLogger
+from .adc_calc_angle import (
+    INTERP_METHODS,
+    degrees_to_counts,
+    fit_interpolant,
+)
+
+__all__ = ["AtmosphericADCCalc"]
+
+DEFAULT_AXES = ("temperature", "pressure")
+DEFAULT_ZA_STEP = 0.05  # zenith-angle spacing of the precomputed grid (degree)
+
+
+class AtmosphericADCCalc:
+    """
+    A class to calculate the ADC angle from the zenith angle and the site
+    atmospheric conditions (e.g. temperature and pressure).
+
+    The lookup table is a regular grid over (ZA, condition axes...). Along the
+    zenith angle each condition slice is fitted with the 1-D interpolation
+    method and sampled once onto a dense uniform grid; along the condition
+    axes the grid keeps the table nodes. Queries are answered by vectorized
+    multilinear interpolation on this precomputed grid.
+
+    For the default single-curve lookup use `ADCCalc`, which remains the
+    faster path.
+
+    Attributes
+    ----------
+    axes : tuple of str
+        Names of the condition axes, in table column order
+    nodes : dict
+        Table nodes of each condition axis (name -> numpy.ndarray)
+    values : numpy.ndarray
+        Precomputed ADC angles (degree), shape (n_za, n_axis1, ...)
+    za_min : float
+        Minimum value of zenith angle in the lookup table (degree)
+    za_max : float
+        Maximum value of zenith angle in the lookup table (degree)
+    za_step : float
+        Actual zenith-angle spacing of the precomputed grid (degree)
+    method : str
+        Interpolation method used along the zenith angle
+    build_time : float
+        Time spent building the grid (seconds)
+    """
+
+    def __init__(
+        self,
+        lookup_table,
+        axes=DEFAULT_AXES,
+        method="pchip",
+        za_step=DEFAULT_ZA_STEP,
+    ):
+        """
+        Parameters
+        ----------
+        lookup_table : str
+            A path to the multi-column lookup CSV.
+            Column 1: zenith angle (degree) / Columns 2..: one column per
+            condition axis / Last column: ADC angle (degree).
+            Every (ZA, condition) combination must appear exactly once.
+        axes : sequence of str, optional
+            Names of the condition columns, e.g. ('temperature', 'pressure')
+            or ('temperature',).
+        method : {'cubic', 'pchip', 'akima', 'chebyshev', 'minimax'}, optional
+            The interpolation method used along the zenith angle.
+        za_step : float, optional
+            Zenith-angle spacing of the precomputed grid (degree).
+        """
+        self.logger = AdcLogger(__file__)
+        self.axes = tuple(axes)
+
+        if not os.path.isfile(lookup_table):
+            self.logger.error(f"Lookup table cannot be found: {lookup_table}")
+            raise FileNotFoundError(f"Lookup table cannot be found: {lookup_table}")
+        try:
+            data = np.genfromtxt(lookup_table, comments="#", delimiter=",", ndmin=2)
+        except Exception as e:
+            self.logger.error(f"Failed to read lookup table: {e}")
+            raise ValueError(f"Failed to read lookup table: {e}")
+        if data.shape[1] != len(self.axes) + 2:
+            self.logger.error(
+                f"Lookup table has {data.shape[1]} columns, expected {len(self.axes) + 2}"
+            )
+            raise ValueError(
+                f"Lookup table has {data.shape[1]} columns, expected {len(self.axes) + 2}"
+            )
+
+        self.lookup_table = lookup_table
+        self._build(data[:, :-1], data[:, -1], method, za_step)
+
+    @classmethod
+    def from_tables(
+        cls, tables, axes=DEFAULT_AXES, method="pchip", za_step=DEFAULT_ZA_STEP
+    ):
+        """
+        Create the calculator from one 1-D lookup table per atmospheric condition.
+
+        Parameters
+        ----------
+        tables : dict
+            Maps a tuple of condition values (one per axis) to the path of a
+            1-D ZA/ADC lookup CSV in the `ADCCalc` format.
+        axes : sequence of str, optional
+            Names of the condition axes.
+        method : str, optional
+            The interpolation method used along the zenith angle.
+        za_step : float, optional
+            Zenith-angle spacing of the precomputed grid (degree).
+
+        Returns
+        -------
+        AtmosphericADCCalc
+        """
+        self = cls.__new__(cls)
+        self.logger = AdcLogger(__file__)
+        self.axes = tuple(axes)
+        self.lookup_table = dict(tables)
+
+        rows = []
+        for conditions, path in self.lookup_table.items():
+            conditions = np.atleast_1d(np.asarray(conditions, dtype=float))
+            if conditions.size != len(self.axes):
+                self.logger.error(f"Invalid condition key {conditions} for axes {axes}")
+                raise ValueError(f"Invalid condition key {conditions} for axes {axes}")
+            if not os.path.isfile(path):
+                self.logger.error(f"Lookup table cannot be found: {path}")
+                raise FileNotFoundError(f"Lookup table cannot be found: {path}")
+            try:
+                data = np.genfromtxt(path, comments="#", delimiter=",", ndmin=2)
+            except Exception as e:
+                self.logger.error(f"Failed to read lookup table: {e}")
+                raise ValueError(f"Failed to read lookup table: {e}")
+            block = np.empty((len(data), len(self.axes) + 2))
+            block[:, 0] = data[:, 0]
+            block[:, 1:-1] = conditions
+            block[:, -1] = data[:, 1]
+            rows.append(block)
+
+        data = np.concatenate(rows)
+        self._build(data[:, :-1], data[:, -1], method, za_step)
+        return self
+
+    def _build(self, keys, adc, method, za_step):
+        """
+        Arrange the table points on the (ZA, axes...) grid and precompute the
+        dense zenith-angle sampling.
+        """
+        start_time = time.perf_counter()
+        if method not in INTERP_METHODS:
+            self.logger.error(f"Invalid interpolation method: {method}")
+            raise ValueError(f"Invalid interpolation method: {method}")
+        if not za_step > 0:
+            self.logger.error(f"Invalid zenith-angle step: {za_step}")
+            raise ValueError(f"Invalid zenith-angle step: {za_step}")
+
+        node_list = [np.unique(keys[:, k]) for k in range(keys.shape[1])]
+        shape = tuple(len(n) for n in node_list)
+        table = np.full(shape, np.nan)
+        index = tuple(
+            np.searchsorted(nodes, keys[:, k]) for k, nodes in enumerate(node_list)
+        )
+        table[index] = adc
+        if len(adc) != table.size or np.isnan(table).any():
+            self.logger.error(
+                f"Lookup table is not a regular grid: {len(adc)} rows for grid shape {shape}"
+            )
+            raise ValueError(
+                f"Lookup table is not a regular grid: {len(adc)} rows for grid shape {shape}"
+            )
+        if min(shape) < 2:
+            self.logger.error(f"Each lookup table axis needs two nodes: {shape}")
+            raise ValueError(f"Each lookup table axis needs two nodes: {shape}")
+
+        data_za = node_list[0]
+        za_min, za_max = float(data_za[0]), float(data_za[-1])
+        n_cells = max(1, int(np.ceil((za_max - za_min) / za_step)))
+        grid_za = np.linspace(za_min, za_max, n_cells + 1)
+
+        # condition slice마다 1-D fit 후 dense ZA grid에 샘플링
+        columns = table.reshape(shape[0], -1)
+        values = np.empty((n_cells + 1, columns.shape[1]))
+        for j in range(columns.shape[1]):
+            fn = fit_interpolant(data_za, columns[:, j], method)
+            values[:, j] = fn(grid_za)
+
+        self.values = np.ascontiguousarray(values.reshape((n_cells + 1,) + shape[1:]))
+        self.nodes = dict(zip(self.axes, node_list[1:]))
+        self.method = method
+        self.za_min = za_min
+        self.za_max = za_max
+        self.za_step = (za_max - za_min) / n_cells
+        self._inv_step = n_cells / (za_max - za_min)
+        self._last = n_cells - 1
+        self.build_time = time.perf_counter() - start_time
+
+        self.logger.info(
+            f"Atmospheric lookup grid using {method} method created: shape "
+            f"{self.values.shape} over (za, {', '.join(self.axes)}) "
+            f"in {self.build_time * 1e3:.3f} ms."
+        )
+
+    @property
+    def bounds(self):
+        """
+        Range covered by each axis, including 'za' (name -> (min, max)).
+        """
+        res = {"za": (self.za_min, self.za_max)}
+        for name, nodes in self.nodes.items():
+            res[name] = (float(nodes[0]), float(nodes[-1]))
+        return res
+
+    def _check_bounds(self, name, values, lo, hi):
+        if values.size and (values.min() < lo or values.max() > hi):
+            self.logger.error(f"Input {name} is out of bounds ({lo}, {hi})")
+            raise ValueError(f"Input {name} is out of bounds.")
+
+    def calc_from_za(self, za, **conditions):
+        """
+        Calculate the ADC angle from the zenith angle and atmospheric conditions.
+
+        Parameters
+        ----------
+        za : float or array-like
+            Input zenith angle(s) in degrees.
+        **conditions : float or array-like
+            One keyword per condition axis (e.g. ``temperature=..., pressure=...``).
+            All inputs are broadcast against each other.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            The corresponding ADC angle(s) in degrees.
+        """
+        if set(conditions) != set(self.axes):
+            self.logger.error(
+                f"Expected conditions {self.axes}, got {tuple(conditions)}"
+            )
+            raise TypeError(f"Expected conditions {self.axes}, got {tuple(conditions)}")
+
+        scalar = all(
+            np.ndim(v) == 0 for v in itertools.chain([za], conditions.values())
+        )
+        try:
+            arrays = np.broadcast_arrays(
+                np.asarray(za, dtype=float),
+                *(np.asarray(conditions[name], dtype=float) for name in self.axes),
+            )
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Invalid zenith angle or condition input: {e}")
+            raise
+
+        za = arrays[0]
+        self._check_bounds("zenith angle", za, self.za_min, self.za_max)
+        for name, x in zip(self.axes, arrays[1:]):
+            nodes = self.nodes[name]
+            self._check_bounds(name, x, nodes[0], nodes[-1])
+
+        # ZA축은 균일 grid라 index 계산이 O(1), 조건 축은 searchsorted
+        pos = (za - self.za_min) * self._inv_step
+        idx = [np.minimum(pos.astype(np.intp), self._last)]
+        weights = [pos - idx[0]]
+        for name, x in zip(self.axes, arrays[1:]):
+            nodes = self.nodes[name]
+            i = np.clip(np.searchsorted(nodes, x, side="right") - 1, 0, len(nodes) - 2)
+            idx.append(i)
+            weights.append((x - nodes[i]) / (nodes[i + 1] - nodes[i]))
+
+        # 2^d 꼭짓점을 flat index로 모아 한 번씩 gather
+        strides = np.array(self.values.strides) // self.values.itemsize
+        base = sum(i * st for i, st in zip(idx, strides))
+        flat = self.values.ravel()
+        result = np.zeros(za.shape)
+        for corner in itertools.product((0, 1), repeat=len(idx)):
+            w = None
+            for bit, wk in zip(corner, weights):
+                wk = wk if bit else 1.0 - wk
+                w = wk if w is None else w * wk
+            result += w * flat[base + int(np.dot(corner, strides))]
+
+        return float(result) if scalar else result
+
+    def calc_series(self, series):
+        """
+        Calculate ADC angles for a full environmental time series in one pass.
+
+        Parameters
+        ----------
+        series : array-like
+            Either an (N, 1 + n_axes) array of (za, conditions...) rows, or an
+            (N, 2 + n_axes) array of (time, za, conditions...) rows.
+
+        Returns
+        -------
+        times : numpy.ndarray or None
+            The time column if it was given, else None.
+        angles : numpy.ndarray
+            ADC angle (degree) of each row.
+        """
+        series = np.asarray(series, dtype=float)
+        n_cols = len(self.axes) + 1
+        if series.ndim != 2 or series.shape[1] not in (n_cols, n_cols + 1):
+            self.logger.error(f"Invalid series shape: {series.shape}")
+            raise ValueError(f"Invalid series shape: {series.shape}")
+
+        times = None
+        if series.shape[1] == n_cols + 1:
+            times, series = series[:, 0], series[:, 1:]
+
+        conditions = {name: series[:, k + 1] for k, name in enumerate(self.axes)}
+        angles = self.calc_from_za(series[:, 0], **conditions)
+        self.logger.debug(f"Calculated {len(angles)} ADC angles from series.")
+        return times, angles
+
+    def series_to_counts(self, series, dtype=np.int64, rounding="trunc"):
+        """
+        Convert an environmental time series to encoder counts in one pass.
+
+        Parameters
+        ----------
+        series : array-like
+            See `calc_series`.
+        dtype : {numpy.int64, numpy.int32}, optional
+            Integer type of the returned counts.
+        rounding : {'trunc', 'nearest', 'floor'}, optional
+            Rounding mode, see `adc_calc_angle.degrees_to_counts`.
+
+        Returns
+        -------
+        times : numpy.ndarray or None
+            The time column if it was given, else None.
+        counts : numpy.ndarray
+            Encoder counts of the ADC angle for each row.
+        """
+        times, angles = self.calc_series(series)
+        try:
+            return times, degrees_to_counts(angles, dtype, rounding)
+        except ValueError as e:
+            self.logger.error(str(e))
+            raise
@@ -7,14 +7,50 @@
 
 import os
 import json
+import math
 import time
 import asyncio
+import threading
+from collections import deque
+
+import numpy as np
 from nanotec_nanolib import Nanolib
 
+from .adc_bus_executor import (
+    PRIORITY_POLL,
+    PRIORITY_STOP,
+    SerializedAccessor,
+    get_bus_executor,
+)
 from .adc_logger import AdcLogger
+from .adc_motion import MotionHandle, MotionInterrupted, SetpointStream
+from .adc_motion_model import MotionTimeModel
+from .adc_od_registry import OdRegistry
+from .adc_position import COUNTS_PER_REV, shortest_delta, unwrap_position
+from .adc_recorder import NO_VALUE, TelemetryRecorder
+from .adc_telemetry import TelemetryPoller
+from .adc_topology import TopologyCache
 
 __all__ = ["AdcController"]
 max_position = 4_294_967_296
+counts_per_rev = COUNTS_PER_REV  # 1 revolution = 16200 counts
+
+# Profile Position controlword bits (CiA 402)
+CW_ENABLE_OPERATION = 0x0F
+CW_NEW_SETPOINT = 0x10  # bit 4
+CW_CHANGE_IMMEDIATELY = 0x20  # bit 5
+CW_CHANGE_ON_SETPOINT = 0x200  # bit 9
+SW_TARGET_REACHED = 0x0400  # statusword bit 10
+SW_SETPOINT_ACK = 0x1000  # statusword bit 12
+SW_STATE_MASK = 0x6F  # statusword state bits (CiA 402)
+SW_OPERATION_ENABLED = 0x27
+# 'operation enabled'로 남겨 두는 controlword: move, set-point stream
+_ENABLED_CONTROLWORDS = (
+    CW_ENABLE_OPERATION,
+    0x5F,
+    CW_ENABLE_OPERATION | CW_CHANGE_IMMEDIATELY,
+    CW_ENABLE_OPERATION | CW_CHANGE_ON_SETPOINT,
+)
 
 
 def _get_default_adc_config_path() -> str:
@@ -46,8 +82,11 @@ class AdcController:
         Path to the JSON configuration file.
     logger : logging.Logger
         Logger instance for logging messages.
-    nanolib_accessor : Nanolib.NanoLibAccessor
-        Instance for accessing the Nanolib API.
+    nanolib_accessor : SerializedAccessor
+        Nanolib accessor whose calls are serialized on the bus executor.
+    bus : BusExecutor
+        Executor of the selected bus; `bus.run` runs motion commands off the
+        event loop and `bus.metrics()` reports queue depth and latency.
     devices : dict
         Dictionary for managing device handles and connection states.
     selected_bus_index : int
@@ -56,8 +95,66 @@ class AdcController:
         Represents the home position of the motor. Default is False.
     max_position : int
         The maximum motor position. Default is 4,294,967,296.
+    approach_direction : int
+        Direction of the moves planned by homing, parking and zeroing: 0
+        takes the shortest rotation, 1 or -1 always moves in the positive or
+        negative count direction (e.g. to approach against backlash).
+    profile_acceleration : float or None
+        Profile acceleration (RPM/s) assumed when predicting move durations.
+        None means the ramps are neglected.
+    poll_interval : float
+        Statusword polling interval (seconds) once a move is predicted to be
+        nearly finished.
+    move_timeout_factor, move_timeout_margin, move_timeout_min : float
+        A move that has not completed after ``max(predicted * factor,
+        predicted + margin, min)`` seconds is stopped and fails with
+        `TimeoutError`.
+    motion_log : collections.deque
+        Recent moves with their predicted and actual durations.
+    motion_model : MotionTimeModel
+        Persistent per-motor model of move duration, fitted on every move.
+        It is stored at the config entry ``motion_model_path``, else in the
+        user cache directory, by a background thread; `close` flushes it.
+    od_write_stats : dict
+        Per-command counts of object-dictionary writes sent to the bus and
+        skipped because the shadow already held the value.
+    telemetry : TelemetryPoller or None
+        Background poller feeding `device_state`; None until
+        `start_telemetry` is called.
+    telemetry_autostart : bool
+        Whether `SessionRegistry` starts the poller when it opens the
+        session; config entry ``telemetry_autostart`` (default True).
+    telemetry_interval : float
+        Default polling period (seconds) of `start_telemetry`; config entry
+        ``telemetry_interval`` (default 0.2).
+    telemetry_max_staleness : float
+        Default maximum age (seconds) of a polled sample `device_state` may
+        answer from.
+    stop_command_slo : float
+        Target latency (seconds) from a stop request to the stop controlword
+        being written; slower stops are logged as warnings.
+    stop_latency_log : collections.deque
+        Command and confirmation latencies of recent stops.
+    setpoint_ack_timeout : float
+        Maximum wait (seconds) for the drive to take and acknowledge a
+        streamed set-point (`push_setpoint`).
+    topology_cache : TopologyCache
+        Cached bus hardware spec and device IDs used by `find_devices` to
+        skip the bus scan.
+    startup_timings : dict
+        Duration (seconds) of each phase of the last `find_devices` call,
+        with the topology ``source`` ('cache' or 'scan').
+    recorder : TelemetryRecorder
+        Ring buffer of statusword/position samples taken by the polling
+        paths; replace it with one given a ``chunk_dir`` to keep a whole
+        night on disk.
     """
 
+    DEFAULT_VELOCITY = 1000  # Default velocity (RPM) if not provided
+    PARKING_OFFSETS = (-250, -225)  # 225counts, 5 degree,
+    # 20250212 modifid by Mingyeong Yang
+    ZERO_OFFSETS = (7635, 1926)  # Adjust this value based on calibration.
+
     def __init__(self, config: str = None):
         """
         Initializes the AdcController.
@@ -75,7 +172,6 @@ class AdcController:
 
         self.CONFIG_FILE = config  # 내부에서 사용할 config 파일 경로
         self.logger = AdcLogger(__file__)
-        self.nanolib_accessor = Nanolib.getNanoLibAccessor()
         self.logger.debug("Initializing AdcController")
 
         self.devices = {
@@ -83,8 +179,72 @@ class AdcController:
             2: {"handle": None, "connected": False},
         }
         self.selected_bus_index = self._load_selected_bus_index()
+        # 같은 bus의 Nanolib 호출은 하나의 worker thread에서 순서대로 실행
+        self.bus = get_bus_executor(self.selected_bus_index)
+        self.nanolib_accessor = SerializedAccessor(
+            Nanolib.getNanoLibAccessor(), self.bus
+        )
         self.home_position = False
         self.max_position = max_position
+        self.approach_direction = 0
+
+        self.profile_acceleration = None
+        self.poll_interval = 0.01
+        self.move_timeout_factor = 2.0
+        self.move_timeout_margin = 5.0
+        self.move_timeout_min = 10.0
+        self.motion_log = deque(maxlen=1000)
+        self._od_shadow = {}  # motor_id -> {(index, subindex): last written value}
+        self.od_write_stats = {}  # command -> {"writes": n, "skipped": n}
+        # command pool, telemetry thread, event loop에서 함께 갱신되므로 lock으로 보호
+        self._od_lock = threading.Lock()
+        # config의 motion_model_path가 없으면 사용자 cache 디렉터리에 저장
+        motion_model_path = self._load_config_value("motion_model_path")
+        try:
+            self.motion_model = MotionTimeModel(motion_model_path)
+        except ValueError as e:
+            self.logger.warning(f"{e}. Starting with an empty motion-time model.")
+            self.motion_model = MotionTimeModel(motion_model_path, load=False)
+        self.telemetry = None
+        self.telemetry_autostart = bool(
+            self._load_config_value("telemetry_autostart", True)
+        )
+        self.telemetry_interval = self._load_config_value("telemetry_interval", 0.2)
+        self.telemetry_max_staleness = 1.0
+        self.recorder = TelemetryRecorder()
+        self.stop_command_slo = 0.1
+        self.setpoint_ack_timeout = 1.0
+        self.stop_latency_log = deque(maxlen=1000)
+        self._active_moves = {}  # motor_id -> 진행 중인 MotionHandle
+        self.topology_cache = TopologyCache()
+        self._bus_opened = False
+        self.startup_timings = {}
+        self._commanded_target = {}  # motor_id -> 마지막 절대 목표 위치
+
+        # OD entry는 load 시점에 한 번만 검증하고 OdIndex를 미리 만들어 둠
+        try:
+            self.od = OdRegistry(od_index_factory=Nanolib.OdIndex)
+            self._od_mode = self.od.require(0x6060, 0x00, "w")
+            self._od_controlword = self.od.require(0x6040, 0x00, "w")
+            self._od_statusword = self.od.require(0x6041, 0x00, "r")
+            self._od_profile_velocity = self.od.require(0x6081, 0x00, "w")
+            self._od_target_position = self.od.require(0x607A, 0x00, "w")
+            self._od_position_actual = self.od.require(0x6064, 0x00, "r")
+            self._od_inputs_raw = self.od.require(0x3240, 0x05, "r")
+        except (ValueError, KeyError, PermissionError) as e:
+            self.logger.error(f"Invalid object dictionary: {e}")
+            raise
+
+    def _load_config_value(self, key, default=None):
+        """
+        Return an optional entry of the JSON configuration file, or `default`
+        if the file or the entry is missing or unreadable.
+        """
+        try:
+            with open(self.CONFIG_FILE, "r") as file:
+                return json.load(file).get(key, default)
+        except (OSError, ValueError, AttributeError):
+            return default
 
     def _load_selected_bus_index(self) -> int:
         """
@@ -116,34 +276,70 @@ class AdcController:
             )
         return default_index
 
-    def find_devices(self):
+    def find_devices(self, use_cache=True, before_open=None):
         """
         Finds devices connected to the selected bus and initializes them.
 
+        If a topology cache exists for the selected bus, the bus is opened
+        and the cached devices are added directly, and each device is
+        verified by reading its statusword; the bus hardware listing and the
+        device scan are skipped. If the cache is missing or verification
+        fails, the full scan is run and its result is cached. The duration
+        of each phase is logged and kept in `startup_timings`.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            If False, always list the bus hardware and scan the bus.
+        before_open : callable, optional
+            Called as ``before_open(hardware_specifier)`` (e.g. the serial
+            port name) right before the bus hardware is opened; used by
+            `SessionRegistry` to lock the port.
+
         Raises
         ------
         Exception
             If no bus hardware IDs are found, or if there is an error during initialization.
         """
         self.logger.info("Starting the process to find devices...")
-        list_available_bus = self.nanolib_accessor.listAvailableBusHardware()
-        if list_available_bus.hasError():
-            raise Exception(
-                f"Error: listAvailableBusHardware() - {list_available_bus.getError()}"
-            )
+        timings = {}
+        started = time.perf_counter()
 
-        bus_hardware_ids = list_available_bus.getResult()
-        if not bus_hardware_ids.size():
-            raise Exception("No bus hardware IDs found.")
+        cached = (
+            self.topology_cache.load(self.selected_bus_index) if use_cache else None
+        )
+        source = "scan"
+        if cached is not None:
+            try:
+                self._add_cached_devices(cached, timings, before_open)
+                source = "cache"
+            except Exception as e:
+                self.logger.warning(
+                    f"Cached device topology failed verification ({e}); "
+                    "falling back to a full bus scan."
+                )
+                self._release_devices()
 
-        for i, bus_id in enumerate(bus_hardware_ids):
-            self.logger.info(
-                f"Found bus hardware ID {i}: {bus_id.toString() if hasattr(bus_id, 'toString') else str(bus_id)}"
-            )
+        if source == "scan":
+            self._scan_devices(timings, before_open)
 
-        ind = self.selected_bus_index
-        self.adc_motor_id = bus_hardware_ids[ind]
-        self.logger.info(f"Selected bus hardware ID: {self.adc_motor_id}")
+        timings["total"] = time.perf_counter() - started
+        self.startup_timings = {"source": source, **timings}
+        breakdown = ", ".join(
+            f"{phase}={seconds * 1e3:.1f} ms" for phase, seconds in timings.items()
+        )
+        self.logger.info(f"Startup timing ({source}): {breakdown}")
+
+    def _timed(self, timings, phase, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - t0
+
+    def _open_bus(self, before_open=None):
+        if before_open is not None:
+            before_open(self.adc_motor_id.getHardwareSpecifier())
 
         # Configure options
         self.adc_motor_options = Nanolib.BusHardwareOptions()
@@ -163,10 +359,55 @@ class AdcController:
             raise Exception(
                 f"Error: openBusHardwareWithProtocol() - {open_bus.getError()}"
             )
+        self._bus_opened = True
+
+    def _add_devices(self):
+        for i, device_id in enumerate(self.device_ids):
+            if i + 1 in self.devices:
+                handle_result = self.nanolib_accessor.addDevice(device_id)
+                if handle_result.hasError():
+                    raise Exception(
+                        f"Error adding device {i + 1}: {handle_result.getError()}"
+                    )
+                self.devices[i + 1]["handle"] = handle_result.getResult()
+                self.invalidate_od_cache(i + 1)
+                self.logger.info(f"Device {i + 1} added successfully.")
+
+    def _scan_devices(self, timings, before_open=None):
+        """
+        List the bus hardware, open the selected bus, scan it and add the
+        devices found; the result is written to the topology cache.
+        """
+        list_available_bus = self._timed(
+            timings, "list_bus", self.nanolib_accessor.listAvailableBusHardware
+        )
+        if list_available_bus.hasError():
+            raise Exception(
+                f"Error: listAvailableBusHardware() - {list_available_bus.getError()}"
+            )
+
+        bus_hardware_ids = list_available_bus.getResult()
+        if not bus_hardware_ids.size():
+            raise Exception("No bus hardware IDs found.")
+
+        for i, bus_id in enumerate(bus_hardware_ids):
+            self.logger.info(
+                f"Found bus hardware ID {i}: {bus_id.toString() if hasattr(bus_id, 'toString') else str(bus_id)}"
+            )
+
+        ind = self.selected_bus_index
+        self.adc_motor_id = bus_hardware_ids[ind]
+        self.logger.info(f"Selected bus hardware ID: {self.adc_motor_id}")
+
+        self._timed(timings, "open_bus", self._open_bus, before_open)
 
         # Scan devices
-        scan_devices = self.nanolib_accessor.scanDevices(
-            self.adc_motor_id, callbackScanBus
+        scan_devices = self._timed(
+            timings,
+            "scan",
+            self.nanolib_accessor.scanDevices,
+            self.adc_motor_id,
+            callbackScanBus,
         )
         if scan_devices.hasError():
             raise Exception(f"Error: scanDevices() - {scan_devices.getError()}")
@@ -175,15 +416,90 @@ class AdcController:
         if not self.device_ids.size():
             raise Exception("No devices found during scan.")
 
-        for i, device_id in enumerate(self.device_ids):
-            if i + 1 in self.devices:
-                handle_result = self.nanolib_accessor.addDevice(device_id)
-                if handle_result.hasError():
+        self._timed(timings, "add_devices", self._add_devices)
+        self._save_topology()
+
+    def _save_topology(self):
+        try:
+            bus = self.adc_motor_id
+            self.topology_cache.save(
+                self.selected_bus_index,
+                {
+                    "bus_hardware": bus.getBusHardware(),
+                    "protocol": bus.getProtocol(),
+                    "hardware_specifier": bus.getHardwareSpecifier(),
+                    "name": bus.getName(),
+                },
+                [
+                    {
+                        "device_id": device_id.getDeviceId(),
+                        "description": device_id.getDescription(),
+                    }
+                    for device_id in list(self.device_ids)[: len(self.devices)]
+                ],
+            )
+        except (OSError, AttributeError) as e:
+            self.logger.warning(f"Failed to save device topology cache: {e}")
+
+    def _add_cached_devices(self, cached, timings, before_open=None):
+        """
+        Open the cached bus and add the cached devices without scanning,
+        then verify each device by connecting and reading its statusword.
+        """
+        bus = cached["bus"]
+        self.adc_motor_id = Nanolib.BusHardwareId(
+            bus["bus_hardware"], bus["protocol"], bus["hardware_specifier"], bus["name"]
+        )
+        self.logger.info(f"Using cached bus hardware ID: {self.adc_motor_id}")
+        self._timed(timings, "open_bus", self._open_bus, before_open)
+
+        self.device_ids = [
+            Nanolib.DeviceId(self.adc_motor_id, d["device_id"], d["description"])
+            for d in cached["devices"]
+        ]
+        self._timed(timings, "add_devices", self._add_devices)
+        self._timed(timings, "verify", self._verify_devices)
+
+    def _verify_devices(self):
+        for motor, device in self.devices.items():
+            handle = device["handle"]
+            if handle is None:
+                raise Exception(f"Device {motor} is not in the cached topology.")
+            result = self.nanolib_accessor.connectDevice(handle)
+            if result.hasError():
+                raise Exception(
+                    f"Device {motor}: connectDevice() - {result.getError()}"
+                )
+            try:
+                status = self.nanolib_accessor.readNumber(
+                    handle, self._od_statusword.od_index
+                )
+                if status.hasError():
                     raise Exception(
-                        f"Error adding device {i + 1}: {handle_result.getError()}"
+                        f"Device {motor}: readNumber() - {status.getError()}"
                     )
-                self.devices[i + 1]["handle"] = handle_result.getResult()
-                self.logger.info(f"Device {i + 1} added successfully.")
+            finally:
+                self.nanolib_accessor.disconnectDevice(handle)
+
+    def _release_devices(self):
+        """
+        Undo a partial cached start-up so that the full scan starts clean.
+        """
+        for device in self.devices.values():
+            if device["handle"] is not None:
+                try:
+                    self.nanolib_accessor.removeDevice(device["handle"])
+                except Exception as e:
+                    self.logger.debug(f"removeDevice failed: {e}")
+                device["handle"] = None
+                device["connected"] = False
+        if self._bus_opened:
+            try:
+                self.nanolib_accessor.closeBusHardware(self.adc_motor_id)
+            except Exception as e:
+                self.logger.debug(f"closeBusHardware failed: {e}")
+            self._bus_opened = False
+        self.invalidate_od_cache()
 
     def connect(self, motor_number=0):
         """
@@ -245,6 +561,9 @@ class AdcController:
                                 f"Error: connectDevice() - {result.getError()}"
                             )
                         device["connected"] = True
+                        self.invalidate_od_cache(motor)
+                        self._commanded_target.pop(motor, None)
+                        self._invalidate_telemetry(motor)
                         self.logger.info(f"Device {motor} connected successfully.")
                 else:
                     if device["connected"]:
@@ -259,6 +578,9 @@ class AdcController:
                                 f"Error: disconnectDevice() - {result.getError()}"
                             )
                         device["connected"] = False
+                        self.invalidate_od_cache(motor)
+                        self._commanded_target.pop(motor, None)
+                        self._invalidate_telemetry(motor)
                         self.logger.info(f"Device {motor} disconnected successfully.")
                     else:
                         self.logger.info(f"Device {motor} was not connected.")
@@ -279,16 +601,168 @@ class AdcController:
             If there is an error during closing the bus hardware.
         """
         self.logger.debug("Closing all devices...")
+        try:
+            self.motion_model.flush()
+        except OSError as e:
+            self.logger.warning(f"Failed to save motion-time model: {e}")
+        try:
+            self.recorder.close()
+        except OSError as e:
+            self.logger.warning(f"Failed to write telemetry chunks: {e}")
         close_result = self.nanolib_accessor.closeBusHardware(self.adc_motor_id)
         if close_result.hasError():
             raise Exception(f"Error: closeBusHardware() - {close_result.getError()}")
         self.logger.info("Bus hardware closed successfully.")
 
+    def _write_od(self, motor_id, value, entry, command, force=False):
+        """
+        Write an object-dictionary entry through the per-device write shadow.
+
+        The write is skipped if the shadow holds the same value for the entry,
+        unless `force` is True. A write that fails leaves the entry unknown.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        value : int
+            Value to write.
+        entry : OdEntry
+            Registry entry to write; supplies the prebuilt OdIndex and bit length.
+        command : str
+            Name of the calling command, used for the write counters.
+        force : bool, optional
+            If True, the value is written even if the shadow already holds it.
+
+        Raises
+        ------
+        ValueError
+            If `value` does not fit the data type of the entry.
+        """
+        key = entry.key
+        with self._od_lock:
+            shadow = self._od_shadow.setdefault(motor_id, {})
+            stats = self.od_write_stats.setdefault(command, {"writes": 0, "skipped": 0})
+            if not force and key in shadow and shadow[key] == value:
+                stats["skipped"] += 1
+                return
+            entry.check_value(value)
+            shadow.pop(key, None)  # 실패 시 stale 값이 남지 않도록 먼저 제거
+
+        result = self.nanolib_accessor.writeNumber(
+            self.devices[motor_id]["handle"], value, entry.od_index, entry.bits
+        )
+        with self._od_lock:
+            stats["writes"] += 1
+            if not (hasattr(result, "hasError") and result.hasError()):
+                shadow[key] = value
+
+    def _enable_operation(self, motor_id, command, statusword=None):
+        """
+        Bring the drive to 'operation enabled' with bit 4 of the controlword cleared.
+
+        If the shadow shows that this controller left the drive enabled
+        (last controlword 0x0F, 0x5F, or 0x2F/0x20F of a set-point stream)
+        and the statusword confirms 'operation enabled', the
+        shutdown/switch-on steps (6, 7) are skipped; 0x0F is written only if
+        bit 4 is still set, so the next set-point write gives a rising edge.
+        Otherwise (e.g. after a quick stop, a fault reset, a power cycle or
+        a controlword written by another tool) the full 6, 7, 0x0F sequence
+        is written.
+
+        Parameters
+        ----------
+        statusword : int, optional
+            A statusword just read by the caller; if None it is read here.
+        """
+        last = self._shadowed_controlword(motor_id)
+        if last in _ENABLED_CONTROLWORDS:
+            if statusword is None:
+                statusword = self.nanolib_accessor.readNumber(
+                    self.devices[motor_id]["handle"], self._od_statusword.od_index
+                ).getResult()
+            if statusword & SW_STATE_MASK == SW_OPERATION_ENABLED:
+                with self._od_lock:
+                    stats = self.od_write_stats.setdefault(
+                        command, {"writes": 0, "skipped": 0}
+                    )
+                    stats["skipped"] += 2
+                if last & CW_NEW_SETPOINT:
+                    self._write_od(motor_id, 0x0F, self._od_controlword, command)
+                return
+            self.logger.warning(
+                f"Motor {motor_id} is not in operation enabled "
+                f"(statusword=0x{statusword:04X}); re-enabling."
+            )
+        for controlword in (6, 7, 0x0F):
+            self._write_od(
+                motor_id, controlword, self._od_controlword, command, force=True
+            )
+
+    def _shadowed_controlword(self, motor_id):
+        # 이 controller가 마지막으로 쓴 controlword (모르면 None)
+        with self._od_lock:
+            return self._od_shadow.get(motor_id, {}).get(self._od_controlword.key)
+
+    def invalidate_od_cache(self, motor_id=0):
+        """
+        Forget the shadowed object-dictionary values of a motor, so that the
+        next writes go to the bus unconditionally.
+
+        Parameters
+        ----------
+        motor_id : int, optional
+            The motor whose shadow is cleared; 0 (default) clears both.
+        """
+        motors = [motor_id] if motor_id in (1, 2) else [1, 2]
+        with self._od_lock:
+            for motor in motors:
+                self._od_shadow.pop(motor, None)
+        self.logger.debug(f"OD write cache invalidated for motor(s) {motors}.")
+
+    def move(self, motor_id, pos, vel=None) -> MotionHandle:
+        """
+        Start a relative move of the specified motor in Profile Position
+        mode and return a handle to it. Must be called from a running event
+        loop.
+
+        The set-up writes run as one transaction on the bus executor, and
+        the completion is polled with ``asyncio.sleep``, so no thread is
+        held while the motor moves. Cancelling the handle (or the task
+        awaiting it) sends the stop sequence before the handle resolves.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor to be moved.
+        pos : int
+            The relative target position in counts.
+        vel : int, optional
+            The velocity for the movement. If None, the default velocity is used.
+
+        Returns
+        -------
+        MotionHandle
+            Awaitable handle; awaiting it returns the same dictionary as
+            `move_motor` and raises the same errors (e.g. motor not
+            connected).
+        """
+        self.logger.debug(
+            f"Moving Motor {motor_id} to position {pos} with velocity {vel if vel else 'default velocity'}"
+        )
+        velocity = vel if vel is not None else self.DEFAULT_VELOCITY
+        handle = MotionHandle(motor_id, pos, velocity)
+        handle._attach(asyncio.get_running_loop().create_task(self._run_move(handle)))
+        return handle
+
     def move_motor(self, motor_id, pos, vel=None):
         """
         Synchronously move the specified motor to a target position
         at a given velocity in Profile Position mode.
 
+        Thin blocking wrapper of `move`; it cannot be called from a thread
+        that is running an event loop.
+
         Parameters
         ----------
         motor_id : int
@@ -309,84 +783,581 @@ class AdcController:
         Exception
             If the motor is not connected or an error occurs during movement.
         """
-        self.logger.debug(
-            f"Moving Motor {motor_id} to position {pos} with velocity {vel if vel else 'default velocity'}"
-        )
-        device = self.devices.get(motor_id)
 
+        async def _move():
+            return await self.move(motor_id, pos, vel)
+
+        return asyncio.run(_move())
+
+    async def move_to(self, motor_id, target, vel=None):
+        """
+        Move the specified motor to an absolute ADC position.
+
+        `target` is in ADC counts measured from the zero reference
+        (`zero_position`, the home position plus `ZERO_OFFSETS`), the same
+        -count frame as `activate` and `track`; the raw drive position
+        counter is not used as the frame, since homing does not reset it.
+
+        The move is planned against the commanded-position model: the last
+        absolute drive target of a completed move, or a position read if the
+        model holds nothing for the motor (first move, or after a stop, a
+        failed move, homing or a connection change). Only the shortest
+        rotational delta to `target` is moved, and no bus call is made at
+        all when the motor is already within one count of it.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor to be moved.
+        target : int or float
+            Target position in counts from the zero reference; rounded to
+            the nearest count.
+        vel : int, optional
+            The velocity for the movement. If None, the default velocity is used.
+
+        Returns
+        -------
+        dict
+            The `move_motor` result with ``skipped`` (True if no move was
+            needed) and the planned ``distance``.
+
+        Raises
+        ------
+        Exception
+            If homing has not been completed, so there is no zero reference.
+        """
+        target = int(round(target))
+        zero = self.zero_position(motor_id)
+        current = self._commanded_target.get(motor_id)
+        if current is None:
+            current = await self.bus.call_async(self.read_motor_position, motor_id)
+        distance = shortest_delta(current, zero + target)
+        if distance == 0:
+            self.logger.debug(
+                f"Motor {motor_id} already at {target} counts from zero; move skipped."
+            )
+            return {
+                "initial_position": current,
+                "final_position": current,
+                "position_change": 0,
+                "execution_time": 0.0,
+                "predicted_time": 0.0,
+                "move_time": 0.0,
+                "skipped": True,
+                "distance": 0,
+            }
+        result = await self.move(motor_id, distance, vel)
+        return {**result, "skipped": False, "distance": distance}
+
+    def setpoint_stream(self, motor_id, vel=None, buffered=False) -> SetpointStream:
+        """
+        Create a set-point stream for smooth tracking of the specified motor.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        vel : int, optional
+            Profile velocity (RPM). If None, the default velocity is used.
+        buffered : bool, optional
+            Queue set-points in the drive's buffer instead of replacing the
+            running one immediately.
+
+        Returns
+        -------
+        SetpointStream
+            Stream whose `push` sends targets in counts from the zero
+            reference; see `push_setpoint`.
+        """
+        velocity = vel if vel is not None else self.DEFAULT_VELOCITY
+        return SetpointStream(self, motor_id, velocity, buffered=buffered)
+
+    async def push_setpoint(self, motor_id, target, vel=None, buffered=False):
+        """
+        Hand a new target to the drive while it may still be moving.
+
+        Uses the Profile Position set-point handshake: lower controlword
+        bit 4 if a relative move left it high (the drive holds bit 12 while
+        it is), wait until the drive can take a set-point (statusword bit 12
+        clear), write the target,
+        raise controlword bit 4, wait for the set-point acknowledge (bit 12)
+        and lower bit 4 again. With "change set immediately" (bit 5) the new
+        target replaces the running one and the drive blends into it; with
+        `buffered` and "change on set-point" (bit 9) it is queued and run
+        after the current one without stopping. The call returns after the
+        acknowledge, not when the motor arrives.
+
+        As in `move_to`, `target` is in ADC counts from the zero reference
+        and is reached by the shortest rotation from the commanded position;
+        a target within one count of it is not sent.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        target : int or float
+            Target position in counts from the zero reference; rounded to
+            the nearest count.
+        vel : int, optional
+            Profile velocity (RPM). If None, the default velocity is used.
+        buffered : bool, optional
+            Queue the set-point instead of changing it immediately.
+
+        Returns
+        -------
+        dict
+            ``target`` (absolute drive position sent), ``distance`` from the
+            commanded position, ``skipped`` and ``ack_time`` (seconds from
+            raising bit 4 to the acknowledge).
+
+        Raises
+        ------
+        Exception
+            If the motor is not connected, homing has not been completed,
+            the drive reports a fault or the set-point is not acknowledged
+            within `setpoint_ack_timeout`.
+        """
+        device = self.devices.get(motor_id)
         if not device or not device["connected"]:
             raise Exception(
                 f"Error: Motor {motor_id} is not connected. Please connect it before moving."
             )
-
+        velocity = vel if vel is not None else self.DEFAULT_VELOCITY
+        target = int(round(target))
+        zero = self.zero_position(motor_id)
+        current = self._commanded_target.get(motor_id)
+        if current is None:
+            current = await self.bus.call_async(self.read_motor_position, motor_id)
+        distance = shortest_delta(current, zero + target)
+        absolute = unwrap_position(current) + distance
+        if distance == 0:
+            return {"target": absolute, "distance": 0, "skipped": True, "ack_time": 0.0}
+
+        control = CW_ENABLE_OPERATION | (
+            CW_CHANGE_ON_SETPOINT if buffered else CW_CHANGE_IMMEDIATELY
+        )
         try:
-            device_handle = device["handle"]
-            start_time = time.time()
-
-            # Set Profile Position mode
-            self.nanolib_accessor.writeNumber(
-                device_handle, 1, Nanolib.OdIndex(0x6060, 0x00), 8
+            if (self._shadowed_controlword(motor_id) or 0) & CW_NEW_SETPOINT:
+                # relative move가 남긴 0x5F: bit 4가 high인 동안 drive는 bit 12를 유지
+                await self.bus.call_async(
+                    self._write_od,
+                    motor_id,
+                    CW_ENABLE_OPERATION,
+                    self._od_controlword,
+                    "push_setpoint",
+                )
+            # 이전 set-point가 아직 buffer에 있으면 빌 때까지 대기
+            sw = await self._wait_statusword(motor_id, SW_SETPOINT_ACK, 0)
+            await asyncio.wrap_future(
+                self.bus.submit(
+                    self._write_setpoint, motor_id, absolute, velocity, control, sw
+                )
             )
+            sent = time.monotonic()
+            await self._wait_statusword(motor_id, SW_SETPOINT_ACK, SW_SETPOINT_ACK)
+            ack_time = time.monotonic() - sent
+            await self.bus.call_async(
+                self._write_od,
+                motor_id,
+                control,
+                self._od_controlword,
+                "push_setpoint",
+                force=True,
+            )
+        except Exception as e:
+            self._commanded_target.pop(motor_id, None)
+            self.logger.error(f"Failed to push set-point to Motor {motor_id}: {e}")
+            raise
+        self._commanded_target[motor_id] = absolute
+        self._invalidate_telemetry(motor_id)
+        self.logger.debug(
+            f"Motor {motor_id} set-point {absolute} acknowledged in {ack_time:.3f} s."
+        )
+        return {
+            "target": absolute,
+            "distance": distance,
+            "skipped": False,
+            "ack_time": ack_time,
+        }
 
-            # If velocity is provided, set it; otherwise, use a default value.
-            if vel is not None:
-                self.nanolib_accessor.writeNumber(
-                    device_handle, vel, Nanolib.OdIndex(0x6081, 0x00), 32
-                )
-            else:
-                default_velocity = 1000  # Default velocity if not provided
-                self.nanolib_accessor.writeNumber(
-                    device_handle, default_velocity, Nanolib.OdIndex(0x6081, 0x00), 32
+    def _write_setpoint(self, motor_id, absolute, velocity, control, statusword):
+        """
+        Write an absolute target and raise the new set-point bit; runs on
+        the bus worker as one transaction. `statusword` is the one just
+        read by `push_setpoint`, used to check the drive state.
+        """
+        self._write_od(motor_id, 1, self._od_mode, "push_setpoint")
+        self._write_od(motor_id, velocity, self._od_profile_velocity, "push_setpoint")
+        self._enable_operation(motor_id, "push_setpoint", statusword=statusword)
+        # 0x607A는 relative move의 거리로도 쓰이므로 shadow와 무관하게 씀
+        self._write_od(
+            motor_id, absolute, self._od_target_position, "push_setpoint", force=True
+        )
+        self._write_od(
+            motor_id,
+            control | CW_NEW_SETPOINT,
+            self._od_controlword,
+            "push_setpoint",
+            force=True,
+        )
+
+    async def _wait_statusword(self, motor_id, mask, value, timeout=None):
+        """
+        Poll the statusword at `poll_interval` until ``sw & mask == value``.
+
+        Returns
+        -------
+        int
+            The matching statusword.
+
+        Raises
+        ------
+        Exception
+            On a fault (bit 3) or after `timeout` (default
+            `setpoint_ack_timeout`) seconds.
+        """
+        if timeout is None:
+            timeout = self.setpoint_ack_timeout
+        device_handle = self.devices[motor_id]["handle"]
+        statusword = self._od_statusword.od_index
+        deadline = time.monotonic() + timeout
+        while True:
+            result = await self.bus.call_async(
+                self.nanolib_accessor.readNumber, device_handle, statusword
+            )
+            sw = result.getResult()
+            if sw & 0x0008:  # Fault
+                self.invalidate_od_cache(motor_id)
+                raise Exception(f"Motor {motor_id} fault (statusword=0x{sw:04X}).")
+            if sw & mask == value:
+                return sw
+            if time.monotonic() >= deadline:
+                raise Exception(
+                    f"Motor {motor_id}: timeout waiting for statusword "
+                    f"0x{value:04X}/0x{mask:04X} (statusword=0x{sw:04X})."
                 )
+            await asyncio.sleep(self.poll_interval)
+
+    async def wait_target_reached(self, motor_id, timeout=None):
+        """
+        Wait until the drive reports its last set-point reached (bit 10).
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        timeout : float, optional
+            Maximum wait in seconds; None allows a full revolution at
+            1 RPM plus 10 s.
 
-            initial_position = self.read_motor_position(motor_id)
-            self.nanolib_accessor.writeNumber(
-                device_handle, pos, Nanolib.OdIndex(0x607A, 0x00), 32
+        Returns
+        -------
+        float
+            Seconds waited.
+        """
+        if timeout is None:
+            timeout = self._kinematic_move_time(counts_per_rev, 1) + 10.0
+        start = time.monotonic()
+        with self.bus.priority(PRIORITY_POLL):
+            await self._wait_statusword(
+                motor_id, SW_TARGET_REACHED, SW_TARGET_REACHED, timeout
             )
+        self._invalidate_telemetry(motor_id)
+        return time.monotonic() - start
 
-            # Enable and execute movement
-            for command in [6, 7, 0xF]:
-                self.nanolib_accessor.writeNumber(
-                    device_handle, command, Nanolib.OdIndex(0x6040, 0x00), 16
-                )
-            self.nanolib_accessor.writeNumber(
-                device_handle, 0x5F, Nanolib.OdIndex(0x6040, 0x00), 16
+    def _start_move(self, motor_id, pos, velocity):
+        """
+        Write the set-up of a relative move and start it; runs on the bus
+        worker so the sequence is not interleaved with other bus calls.
+
+        Returns
+        -------
+        int
+            The position before the move.
+        """
+        # Set Profile Position mode
+        self._write_od(motor_id, 1, self._od_mode, "move_motor")
+        self._write_od(motor_id, velocity, self._od_profile_velocity, "move_motor")
+
+        initial_position = self.read_motor_position(motor_id)
+        self._commanded_target[motor_id] = initial_position + pos
+        self._write_od(motor_id, pos, self._od_target_position, "move_motor")
+
+        # Enable and execute movement
+        self._enable_operation(motor_id, "move_motor")
+        self._write_od(motor_id, 0x5F, self._od_controlword, "move_motor")
+        return initial_position
+
+    async def _run_move(self, handle):
+        motor_id = handle.motor_id
+        device = self.devices.get(motor_id)
+        if not device or not device["connected"]:
+            handle.state = "failed"
+            raise Exception(
+                f"Error: Motor {motor_id} is not connected. Please connect it before moving."
             )
 
-            # Wait for movement completion
-            while True:
-                status_word = self.nanolib_accessor.readNumber(
-                    device_handle, Nanolib.OdIndex(0x6041, 0x00)
-                )
-                if status_word.getResult() & 0x1400 == 0x1400:  # Move completed
-                    break
-                time.sleep(1)
+        self._active_moves[motor_id] = handle
+        start_time = time.time()
+        setup = None
+        try:
+            setup = self.bus.submit(
+                self._start_move, motor_id, handle.distance, handle.velocity
+            )
+            # cancel되어도 set-up 결과를 확인할 수 있도록 shield
+            handle.initial_position = await asyncio.shield(asyncio.wrap_future(setup))
+            handle.predicted_time = self.predict_move_time(
+                motor_id, handle.distance, handle.velocity
+            )
+            handle.state = "moving"
+            handle.moving_since = time.monotonic()
+
+            move_time = await self._wait_for_move_completion(handle)
+            self._record_move_time(
+                motor_id,
+                handle.distance,
+                handle.velocity,
+                handle.predicted_time,
+                move_time,
+            )
 
-            final_position = self.read_motor_position(motor_id)
+            final_position = await self.bus.call_async(
+                self.read_motor_position, motor_id
+            )
+            handle.state = "done"
             return {
-                "initial_position": initial_position,
+                "initial_position": handle.initial_position,
                 "final_position": final_position,
-                "position_change": final_position - initial_position,
+                "position_change": final_position - handle.initial_position,
                 "execution_time": time.time() - start_time,
+                "predicted_time": handle.predicted_time,
+                "move_time": move_time,
             }
 
+        except asyncio.CancelledError:
+            handle.state = "cancelled"
+            self._commanded_target.pop(motor_id, None)
+            await self._stop_cancelled_move(handle, setup)
+            if handle._stop_requested:
+                self.logger.warning(f"Move of Motor {motor_id} interrupted by stop.")
+                raise MotionInterrupted(f"Motor {motor_id} move interrupted by stop.")
+            raise
         except Exception as e:
+            handle.state = "failed"
+            # 어디서 멈췄는지 모르므로 commanded-position model을 버림
+            self._commanded_target.pop(motor_id, None)
             self.logger.error(f"Failed to move Motor {motor_id}: {e}")
             raise
+        finally:
+            if self._active_moves.get(motor_id) is handle:
+                del self._active_moves[motor_id]
+            # 이동 중에 poll된 위치는 더 이상 유효하지 않음
+            self._invalidate_telemetry(motor_id)
+
+    async def _stop_cancelled_move(self, handle, setup):
+        """
+        Stop the motor of a cancelled move, unless the move never reached
+        the bus or was already stopped by `stop_motor`.
+        """
+        motor_id = handle.motor_id
+        if self._active_moves.get(motor_id) is handle:
+            del self._active_moves[motor_id]
+        if setup is not None and setup.cancel():
+            self.logger.info(f"Move of Motor {motor_id} cancelled before start.")
+            return
+        if setup is not None and not setup.done():
+            try:
+                await asyncio.wrap_future(setup)
+            except Exception:
+                pass
+        if handle._stop_requested:
+            return
+        try:
+            await asyncio.shield(self.bus.run(self.stop_motor, motor_id))
+            self.logger.info(f"Move of Motor {motor_id} cancelled; motor stopped.")
+        except Exception as e:
+            self.logger.error(f"Failed to stop cancelled move of Motor {motor_id}: {e}")
+
+    def _kinematic_move_time(self, distance, vel):
+        """
+        Duration (seconds) of a relative move of `distance` counts at `vel` RPM,
+        from a trapezoidal profile if `profile_acceleration` is set, else at
+        constant velocity.
+        """
+        distance = abs(distance)
+        v = abs(vel) * counts_per_rev / 60.0  # counts/s
+        if distance == 0 or v == 0:
+            return 0.0
+        if not self.profile_acceleration:
+            return distance / v
+
+        a = self.profile_acceleration * counts_per_rev / 60.0  # counts/s^2
+        if distance >= v * v / a:
+            return distance / v + v / a
+        return 2.0 * math.sqrt(
+            distance / a
+        )  # 최고 속도에 도달하지 못하는 삼각형 profile
+
+    def predict_move_time(self, motor_id, distance, vel):
+        """
+        Predict the duration of a relative move.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        distance : int
+            Relative move distance in counts.
+        vel : int
+            Profile velocity (RPM).
+
+        Returns
+        -------
+        float
+            Predicted move duration in seconds, from the learned motion-time
+            model once it is trained, else from the kinematic profile.
+        """
+        predicted = self.motion_model.predict(motor_id, distance, vel)
+        if predicted is None:
+            predicted = self._kinematic_move_time(distance, vel)
+        return predicted
+
+    async def _wait_for_move_completion(self, handle):
+        """
+        Sleep until shortly before the predicted end of a move, then poll the
+        statusword at `poll_interval` until target reached (bit 10) and
+        set-point acknowledge (bit 12) are both set.
+
+        Returns
+        -------
+        float
+            Time (seconds) from the start of the wait to the detected completion.
+
+        Raises
+        ------
+        Exception
+            If the statusword reports a fault (bit 3); the OD write cache of
+            the motor is invalidated first.
+        TimeoutError
+            If the move has not completed by the deadline derived from the
+            predicted time; the motor is stopped and the OD write cache of
+            the motor is invalidated first.
+        """
+        motor_id = handle.motor_id
+        predicted_time = handle.predicted_time
+        start = time.monotonic()
+        timeout = max(
+            predicted_time * self.move_timeout_factor,
+            predicted_time + self.move_timeout_margin,
+            self.move_timeout_min,
+        )
+        deadline = start + timeout
+        margin = max(0.05, 0.1 * predicted_time)
+        if predicted_time - margin > 0:
+            await asyncio.sleep(predicted_time - margin)
+
+        device_handle = self.devices[motor_id]["handle"]
+        read_number = self.nanolib_accessor.readNumber
+        statusword = self._od_statusword.od_index
+        record = self.recorder.append
+        target = self._commanded_target.get(motor_id, NO_VALUE)
+        while True:
+            with self.bus.priority(PRIORITY_POLL):
+                result = await self.bus.call_async(
+                    read_number, device_handle, statusword
+                )
+            sw = result.getResult()
+            handle.statusword = sw
+            record(time.time(), motor_id, NO_VALUE, sw, target)
+            if sw & 0x1400 == 0x1400:  # Move completed
+                return time.monotonic() - start
+            if sw & 0x0008:  # Fault
+                self.invalidate_od_cache(motor_id)
+                raise Exception(f"Motor {motor_id} fault (statusword=0x{sw:04X}).")
+            if time.monotonic() >= deadline:
+                await self._stop_timed_out_move(handle, timeout, sw)
+            await asyncio.sleep(self.poll_interval)
+
+    async def _stop_timed_out_move(self, handle, timeout, sw):
+        """
+        Stop the motor of a move that missed its deadline and raise
+        `TimeoutError`.
+        """
+        motor_id = handle.motor_id
+        self.logger.error(
+            f"Motor {motor_id} move not completed within {timeout:.1f} s "
+            f"(statusword=0x{sw:04X}); stopping."
+        )
+        # stop_motor가 이 handle을 interrupt(cancel)하지 않도록 먼저 제거
+        if self._active_moves.get(motor_id) is handle:
+            del self._active_moves[motor_id]
+        try:
+            await asyncio.shield(self.bus.run(self.stop_motor, motor_id))
+        except Exception as e:
+            self.logger.error(f"Failed to stop timed-out move of Motor {motor_id}: {e}")
+        self.invalidate_od_cache(motor_id)
+        raise TimeoutError(
+            f"Motor {motor_id} move not completed within {timeout:.1f} s "
+            f"(statusword=0x{sw:04X})."
+        )
+
+    def _record_move_time(self, motor_id, distance, vel, predicted_time, move_time):
+        """
+        Log a finished move and add it to the motion-time model.
+        """
+        self.motion_log.append(
+            {
+                "motor_id": motor_id,
+                "distance": distance,
+                "velocity": vel,
+                "predicted_time": predicted_time,
+                "move_time": move_time,
+            }
+        )
+        self.motion_model.update(motor_id, distance, vel, move_time)
+        if self.motion_model.save_error is not None:
+            self.logger.warning(
+                f"Failed to save motion-time model: {self.motion_model.save_error}"
+            )
+        self.logger.debug(
+            f"Motor {motor_id} move of {distance} counts: predicted {predicted_time:.3f} s, "
+            f"actual {move_time:.3f} s."
+        )
 
     def stop_motor(
-        self, motor_id: int, timeout_s: float = 2.0, poll_s: float = 0.1
+        self,
+        motor_id: int,
+        timeout_s: float = 2.0,
+        poll_s: float = 0.1,
+        requested_at: float = None,
     ) -> dict:
         """
         Stop the specified motor using your existing controlword sequence and confirm stop by Statusword polling.
 
+        All bus calls of the stop run at `PRIORITY_STOP`, ahead of queued
+        motion setup and status polls.
+
         Confirmation condition:
         - statusword bit6 (0x0040) is set  (your logs show 0x1240 after stop, which includes 0x0040)
 
+        Parameters
+        ----------
+        requested_at : float, optional
+            ``time.monotonic()`` at which the stop request was received; the
+            latencies are measured from it. If None, from the call.
+
         Returns:
-        {"status": "success"|"failed", "error_code": <last statusword or None>}
+        {"status": "success"|"failed", "error_code": <last statusword or None>,
+         "latency": {"command": <s until controlword written>,
+                     "confirm": <s until stop confirmed, or None>}}
         """
+        if requested_at is None:
+            requested_at = time.monotonic()
         self.logger.debug(f"Stopping Motor {motor_id}")
+        self._commanded_target.pop(motor_id, None)  # 목표에 도달하지 못함
+        active = self._active_moves.get(motor_id)
+        if active is not None:
+            active._interrupt()
 
         device = self.devices.get(motor_id)
         if not device or not device.get("connected"):
@@ -400,49 +1371,178 @@ class AdcController:
             raise ValueError(f"Motor {motor_id} not connected.")
 
         try:
-            # Send your existing stop command sequence (kept as-is)
-            self.nanolib_accessor.writeNumber(
-                device_handle, 0x1F, Nanolib.OdIndex(0x6040, 0x00), 16
-            )
-            self.nanolib_accessor.writeNumber(
-                device_handle, 0x01, Nanolib.OdIndex(0x6040, 0x00), 16
+            with self.bus.priority(PRIORITY_STOP):
+                return self._stop_and_confirm(
+                    motor_id, device_handle, timeout_s, poll_s, requested_at
+                )
+        except Exception:
+            self.logger.error(
+                f"Motor {motor_id}: Error during stopping.", exc_info=True
             )
+            raise
 
-            self.logger.info(f"Motor {motor_id} stopped successfully.")
-            self.logger.info(
-                f"Motor {motor_id}: Polling statusword for STOP (0x0040)..."
+    def _stop_and_confirm(
+        self, motor_id, device_handle, timeout_s, poll_s, requested_at
+    ):
+        # Send your existing stop command sequence (kept as-is)
+        # stop은 shadow와 무관하게 항상 bus에 씀
+        self._write_od(motor_id, 0x1F, self._od_controlword, "stop_motor", force=True)
+        self._write_od(motor_id, 0x01, self._od_controlword, "stop_motor", force=True)
+        command_latency = time.monotonic() - requested_at
+        self._invalidate_telemetry(motor_id)
+
+        self.logger.info(f"Motor {motor_id} stopped successfully.")
+        self.logger.info(f"Motor {motor_id}: Polling statusword for STOP (0x0040)...")
+
+        STOP_CONFIRMED = 0x0040  # matches your observed post-stop statusword 0x1240
+
+        deadline = time.time() + timeout_s
+        last_status = None
+
+        read_number = self.nanolib_accessor.readNumber
+        statusword = self._od_statusword.od_index
+        record = self.recorder.append
+        target = self._commanded_target.get(motor_id, NO_VALUE)
+        while time.time() < deadline:
+            sw = read_number(device_handle, statusword).getResult()
+            record(time.time(), motor_id, NO_VALUE, sw, target)
+            last_status = sw
+
+            if sw & STOP_CONFIRMED:
+                latency = self._record_stop_latency(
+                    motor_id, command_latency, time.monotonic() - requested_at
+                )
+                self.logger.info(
+                    f"Motor {motor_id} stop confirmed. (statusword=0x{sw:04X})"
+                )
+                return {"status": "success", "error_code": None, "latency": latency}
+
+            time.sleep(poll_s)
+
+        latency = self._record_stop_latency(motor_id, command_latency, None)
+        self.logger.error(
+            f"Motor {motor_id} stop timeout. Last statusword=0x{(last_status or 0):04X}"
+        )
+        return {"status": "failed", "error_code": last_status, "latency": latency}
+
+    def _record_stop_latency(self, motor_id, command_latency, confirm_latency):
+        """
+        Log the latencies of a stop and warn if the command latency exceeds
+        `stop_command_slo`.
+        """
+        latency = {"command": command_latency, "confirm": confirm_latency}
+        self.stop_latency_log.append({"motor_id": motor_id, **latency})
+        if command_latency > self.stop_command_slo:
+            self.logger.warning(
+                f"Motor {motor_id} stop command took {command_latency * 1e3:.1f} ms "
+                f"(SLO {self.stop_command_slo * 1e3:.1f} ms)."
             )
+        return latency
 
-            STOP_CONFIRMED = 0x0040  # matches your observed post-stop statusword 0x1240
+    def stop_latency_stats(self) -> dict:
+        """
+        Summarize the logged stop latencies.
 
-            deadline = time.time() + timeout_s
-            last_status = None
+        Returns
+        -------
+        dict
+            ``count``, ``timeouts``, and the median, 95th percentile and
+            maximum (seconds) of the ``command`` (request to controlword
+            written) and ``confirm`` (request to stop confirmed) latencies;
+            None where no sample exists.
+        """
+        stats = {"count": len(self.stop_latency_log)}
+        confirm = [
+            e["confirm"] for e in self.stop_latency_log if e["confirm"] is not None
+        ]
+        stats["timeouts"] = stats["count"] - len(confirm)
+        for name, values in (
+            ("command", [e["command"] for e in self.stop_latency_log]),
+            ("confirm", confirm),
+        ):
+            if values:
+                p50, p95 = np.percentile(values, [50, 95])
+                stats[name] = {"p50": float(p50), "p95": float(p95), "max": max(values)}
+            else:
+                stats[name] = None
+        return stats
 
-            while time.time() < deadline:
-                sw_obj = self.nanolib_accessor.readNumber(
-                    device_handle, Nanolib.OdIndex(0x6041, 0x00)
-                )
-                sw = sw_obj.getResult()
-                last_status = sw
+    def zero_position(self, motor_id) -> int:
+        """
+        Drive position of the ADC zero angle of a motor.
 
-                if sw & STOP_CONFIRMED:
-                    self.logger.info(
-                        f"Motor {motor_id} stop confirmed. (statusword=0x{sw:04X})"
-                    )
-                    return {"status": "success", "error_code": None}
+        Homing and zeroing do not reset the drive's position counter, so the
+        zero angle is the recorded home position plus `ZERO_OFFSETS`; ADC
+        counts (the -count frame of `activate` and `track`) are measured
+        from it.
 
-                time.sleep(poll_s)
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor (1 or 2).
 
-            self.logger.error(
-                f"Motor {motor_id} stop timeout. Last statusword=0x{(last_status or 0):04X}"
-            )
-            return {"status": "failed", "error_code": last_status}
+        Returns
+        -------
+        int
+            The zero position in counts, unwrapped as a signed 32-bit value.
 
-        except Exception:
-            self.logger.error(
-                f"Motor {motor_id}: Error during stopping.", exc_info=True
+        Raises
+        ------
+        Exception
+            If homing has not been completed.
+        """
+        if not self.home_position:
+            self.logger.error("The ADC zero reference requires a completed homing.")
+            raise Exception("The ADC zero reference requires a completed homing.")
+        home = (self.home_position_motor1, self.home_position_motor2)[motor_id - 1]
+        return unwrap_position(home + self.ZERO_OFFSETS[motor_id - 1])
+
+    def _relative_target(self, current_pos, target_pos):
+        """
+        Relative move from `current_pos` to the prism angle of `target_pos`.
+
+        Positions are unwrapped as signed 32-bit values and compared modulo
+        one revolution; the move follows `approach_direction` (the shortest
+        rotation by default).
+        """
+        return shortest_delta(current_pos, target_pos, self.approach_direction)
+
+    def _predict_offset_move(self, offsets, vel):
+        """
+        Predict the per-motor durations of a move to home + `offsets`.
+        """
+        if not self.home_position:
+            raise Exception("Motion prediction requires a completed homing.")
+        homes = (self.home_position_motor1, self.home_position_motor2)
+        res = {}
+        for motor_id, home, offset in zip((1, 2), homes, offsets):
+            distance = self._relative_target(
+                self.read_motor_position(motor_id), home + offset
             )
-            raise
+            res[motor_id] = self.predict_move_time(motor_id, distance, vel)
+        return res
+
+    def predict_parking_time(self, parking_vel=1):
+        """
+        Predict how long `parking` would take from the current positions.
+
+        Returns
+        -------
+        dict
+            Predicted move duration (seconds) of each motor, keyed by motor id.
+        """
+        return self._predict_offset_move(self.PARKING_OFFSETS, parking_vel)
+
+    def predict_zeroing_time(self, zeroing_vel=1):
+        """
+        Predict how long `zeroing` would take from the current positions.
+
+        Returns
+        -------
+        dict
+            Predicted move duration (seconds) of each motor, keyed by motor id.
+        """
+        return self._predict_offset_move(self.ZERO_OFFSETS, zeroing_vel)
 
     async def parking(self, parking_vel=1):
         """
@@ -457,8 +1557,7 @@ class AdcController:
             Exception: If homing has not been completed before parking.
             Exception: If an error occurs while moving the motors to the parking position.
         """
-        parking_offset_motor1 = -250  # 225counts, 5 degree,
-        parking_offset_motor2 = -225
+        parking_offset_motor1, parking_offset_motor2 = self.PARKING_OFFSETS
 
         if not self.home_position:
             self.logger.error("Parking must be performed after homing.")
@@ -480,50 +1579,12 @@ class AdcController:
                 f"Motor 2: {self.home_position_motor2 + parking_offset_motor2}"
             )
 
-            if current_pos_1 < 1_000_000 and current_pos_2 < 1_000_000:
-                # Both positions are less than 1,000,000
-                target_pos_1 = (
-                    self.home_position_motor1 + parking_offset_motor1 - current_pos_1
-                )
-                target_pos_2 = (
-                    self.home_position_motor2 + parking_offset_motor2 - current_pos_2
-                )
-            elif current_pos_1 < 1_000_000:
-                # Only current_pos_1 is less than 1,000,000
-                target_pos_1 = (
-                    self.home_position_motor1 + parking_offset_motor1 - current_pos_1
-                )
-                target_pos_2 = (
-                    max_position
-                    - current_pos_2
-                    + self.home_position_motor2
-                    + parking_offset_motor2
-                )
-            elif current_pos_2 < 1_000_000:
-                # Only current_pos_2 is less than 1,000,000
-                target_pos_1 = (
-                    max_position
-                    - current_pos_1
-                    + self.home_position_motor1
-                    + parking_offset_motor1
-                )
-                target_pos_2 = (
-                    self.home_position_motor2 + parking_offset_motor2 - current_pos_2
-                )
-            else:
-                # Both positions are greater than or equal to 1,000,000
-                target_pos_1 = (
-                    max_position
-                    - current_pos_1
-                    + self.home_position_motor1
-                    + parking_offset_motor1
-                )
-                target_pos_2 = (
-                    max_position
-                    - current_pos_2
-                    + self.home_position_motor2
-                    + parking_offset_motor2
-                )
+            target_pos_1 = self._relative_target(
+                current_pos_1, self.home_position_motor1 + parking_offset_motor1
+            )
+            target_pos_2 = self._relative_target(
+                current_pos_2, self.home_position_motor2 + parking_offset_motor2
+            )
 
             # Allow a small threshold for position tolerance
             threshold = 10  # Define an acceptable threshold for small positional errors
@@ -536,12 +1597,8 @@ class AdcController:
 
                 try:
                     await asyncio.gather(
-                        asyncio.to_thread(
-                            self.move_motor, 1, target_pos_1, parking_vel
-                        ),
-                        asyncio.to_thread(
-                            self.move_motor, 2, target_pos_2, parking_vel
-                        ),
+                        self.move(1, target_pos_1, parking_vel),
+                        self.move(2, target_pos_2, parking_vel),
                     )
                     self.logger.info("Motors moved to parking positions successfully.")
                 except Exception as e:
@@ -567,9 +1624,7 @@ class AdcController:
             Exception: If homing has not been completed.
             Exception: If an error occurs while moving the motors to the zero position.
         """
-        # 20250212 modifid by Mingyeong Yang
-        zero_offset_motor1 = 7635  # Adjust this value based on calibration.
-        zero_offset_motor2 = 1926  # Adjust this value based on calibration.
+        zero_offset_motor1, zero_offset_motor2 = self.ZERO_OFFSETS
 
         if not self.home_position:
             self.logger.error("Zeroing must be performed after homing.")
@@ -590,50 +1645,12 @@ class AdcController:
                 f"Motor 2: {self.home_position_motor2 + zero_offset_motor2}"
             )
 
-            if current_pos_1 < 1_000_000 and current_pos_2 < 1_000_000:
-                # Both positions are less than 1,000,000
-                target_pos_1 = (
-                    self.home_position_motor1 + zero_offset_motor1 - current_pos_1
-                )
-                target_pos_2 = (
-                    self.home_position_motor2 + zero_offset_motor2 - current_pos_2
-                )
-            elif current_pos_1 < 1_000_000:
-                # Only current_pos_1 is less than 1,000,000
-                target_pos_1 = (
-                    self.home_position_motor1 + zero_offset_motor1 - current_pos_1
-                )
-                target_pos_2 = (
-                    max_position
-                    - current_pos_2
-                    + self.home_position_motor2
-                    + zero_offset_motor2
-                )
-            elif current_pos_2 < 1_000_000:
-                # Only current_pos_2 is less than 1,000,000
-                target_pos_1 = (
-                    max_position
-                    - current_pos_1
-                    + self.home_position_motor1
-                    + zero_offset_motor1
-                )
-                target_pos_2 = (
-                    self.home_position_motor2 + zero_offset_motor2 - current_pos_2
-                )
-            else:
-                # Both positions are greater than or equal to 1,000,000
-                target_pos_1 = (
-                    max_position
-                    - current_pos_1
-                    + self.home_position_motor1
-                    + zero_offset_motor1
-                )
-                target_pos_2 = (
-                    max_position
-                    - current_pos_2
-                    + self.home_position_motor2
-                    + zero_offset_motor2
-                )
+            target_pos_1 = self._relative_target(
+                current_pos_1, self.home_position_motor1 + zero_offset_motor1
+            )
+            target_pos_2 = self._relative_target(
+                current_pos_2, self.home_position_motor2 + zero_offset_motor2
+            )
 
             # Allow a small threshold for position tolerance
             threshold = 10  # Define an acceptable threshold for small positional errors
@@ -642,8 +1659,8 @@ class AdcController:
             else:
                 self.logger.info("Moving motors to Zero positions...")
                 await asyncio.gather(
-                    asyncio.to_thread(self.move_motor, 1, target_pos_1, zeroing_vel),
-                    asyncio.to_thread(self.move_motor, 2, target_pos_2, zeroing_vel),
+                    self.move(1, target_pos_1, zeroing_vel),
+                    self.move(2, target_pos_2, zeroing_vel),
                 )
                 self.logger.info("Motors moved to Zero positions successfully.")
         except Exception as e:
@@ -684,10 +1701,10 @@ class AdcController:
                 busstop = 192  # Bus stop value for homing
                 self.logger.info("Initializing homing process for both motors.")
                 raw_val_motor1 = self.nanolib_accessor.readNumber(
-                    device_handle_motor1, Nanolib.OdIndex(0x3240, 5)
+                    device_handle_motor1, self._od_inputs_raw.od_index
                 ).getResult()
                 raw_val_motor2 = self.nanolib_accessor.readNumber(
-                    device_handle_motor2, Nanolib.OdIndex(0x3240, 5)
+                    device_handle_motor2, self._od_inputs_raw.od_index
                 ).getResult()
                 self.logger.debug(
                     f"Raw value Motor 1: {raw_val_motor1}, Raw value Motor 2: {raw_val_motor2}"
@@ -723,30 +1740,12 @@ class AdcController:
                     f"Motor 2: {self.home_position_motor2}"
                 )
 
-                if current_pos_1 < 1_000_000 and current_pos_2 < 1_000_000:
-                    # Both positions are less than 1,000,000
-                    target_pos_1 = self.home_position_motor1 - current_pos_1
-                    target_pos_2 = self.home_position_motor2 - current_pos_2
-                elif current_pos_1 < 1_000_000:
-                    # Only current_pos_1 is less than 1,000,000
-                    target_pos_1 = self.home_position_motor1 - current_pos_1
-                    target_pos_2 = (
-                        max_position - current_pos_2 + self.home_position_motor2
-                    )
-                elif current_pos_2 < 1_000_000:
-                    # Only current_pos_2 is less than 1,000,000
-                    target_pos_1 = (
-                        max_position - current_pos_1 + self.home_position_motor1
-                    )
-                    target_pos_2 = self.home_position_motor2 - current_pos_2
-                else:
-                    # Both positions are greater than or equal to 1,000,000
-                    target_pos_1 = (
-                        max_position - current_pos_1 + self.home_position_motor1
-                    )
-                    target_pos_2 = (
-                        max_position - current_pos_2 + self.home_position_motor2
-                    )
+                target_pos_1 = self._relative_target(
+                    current_pos_1, self.home_position_motor1
+                )
+                target_pos_2 = self._relative_target(
+                    current_pos_2, self.home_position_motor2
+                )
 
                 # Allow a small threshold for position tolerance
                 threshold = (
@@ -757,8 +1756,8 @@ class AdcController:
                 else:
                     self.logger.info("Moving motors to home positions...")
                     await asyncio.gather(
-                        asyncio.to_thread(self.move_motor, 1, target_pos_1, homing_vel),
-                        asyncio.to_thread(self.move_motor, 2, target_pos_2, homing_vel),
+                        self.move(1, target_pos_1, homing_vel),
+                        self.move(2, target_pos_2, homing_vel),
                     )
                     self.logger.info("Motors moved to home positions successfully.")
 
@@ -804,30 +1803,24 @@ class AdcController:
 
         try:
             initial_raw_value = self.nanolib_accessor.readNumber(
-                device_handle, Nanolib.OdIndex(0x3240, 5)
+                device_handle, self._od_inputs_raw.od_index
             ).getResult()
             # print(f"Initial raw value: {initial_raw_value}")
 
             # Configure the motor for homing
-            self.nanolib_accessor.writeNumber(
-                device_handle, 1, Nanolib.OdIndex(0x6060, 0x00), 8
-            )
-            self.nanolib_accessor.writeNumber(
-                device_handle, homing_vel, Nanolib.OdIndex(0x6081, 0x00), 32
+            self._write_od(motor_id, 1, self._od_mode, "find_home_position")
+            self._write_od(
+                motor_id, homing_vel, self._od_profile_velocity, "find_home_position"
             )
             pos = 16200  # Example value for 1 revolution
-            self.nanolib_accessor.writeNumber(
-                device_handle, pos, Nanolib.OdIndex(0x607A, 0x00), 32
+            self._commanded_target.pop(motor_id, None)
+            self._write_od(
+                motor_id, pos, self._od_target_position, "find_home_position"
             )
 
             # Enable motor and start movement
-            for command in [6, 7, 0xF]:
-                self.nanolib_accessor.writeNumber(
-                    device_handle, command, Nanolib.OdIndex(0x6040, 0x00), 16
-                )
-            self.nanolib_accessor.writeNumber(
-                device_handle, 0x5F, Nanolib.OdIndex(0x6040, 0x00), 16
-            )
+            self._enable_operation(motor_id, "find_home_position")
+            self._write_od(motor_id, 0x5F, self._od_controlword, "find_home_position")
 
             self.logger.info(
                 f"Motor {motor_id} homing initiated. Monitoring position changes..."
@@ -836,9 +1829,10 @@ class AdcController:
             start_time = time.time()
 
             while True:
-                raw_value = self.nanolib_accessor.readNumber(
-                    device_handle, Nanolib.OdIndex(0x3240, 5)
-                ).getResult()
+                with self.bus.priority(PRIORITY_POLL):
+                    raw_value = self.nanolib_accessor.readNumber(
+                        device_handle, self._od_inputs_raw.od_index
+                    ).getResult()
                 # print(f"Raw value: {raw_value}")
                 if initial_raw_value != raw_value:
                     self.stop_motor(motor_id)
@@ -892,7 +1886,7 @@ class AdcController:
         try:
             device_handle = device["handle"]
             position_result = self.nanolib_accessor.readNumber(
-                device_handle, Nanolib.OdIndex(0x6064, 0x00)
+                device_handle, self._od_position_actual.od_index
             )
             if position_result.hasError():
                 raise Exception(f"Error: readNumber() - {position_result.getError()}")
@@ -908,10 +1902,80 @@ class AdcController:
             self.logger.error(f"Failed to read position for Motor {motor_id}: {e}")
             raise
 
-    def device_state(self, motor_id=0):
+    def start_telemetry(self, interval=None, max_staleness=None):
+        """
+        Start the background poller reading position, statusword and
+        connection state of both motors into a timestamped snapshot.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Polling period in seconds. If None, `telemetry_interval` is used.
+        max_staleness : float, optional
+            Default maximum sample age (seconds) for `device_state`. If None,
+            `telemetry_max_staleness` is kept.
+        """
+        if max_staleness is not None:
+            self.telemetry_max_staleness = max_staleness
+        if interval is None:
+            interval = self.telemetry_interval
+        if self.telemetry is not None and self.telemetry.running:
+            self.telemetry.stop()
+        self.telemetry = TelemetryPoller(
+            self._read_telemetry, motors=(1, 2), interval=interval
+        )
+        self.telemetry.start()
+
+    def stop_telemetry(self):
+        """
+        Stop the background poller; `device_state` reads live again.
+        """
+        if self.telemetry is not None:
+            self.telemetry.stop()
+            self.telemetry = None
+
+    def _invalidate_telemetry(self, motor_id=0):
+        if self.telemetry is not None:
+            self.telemetry.invalidate(motor_id)
+
+    def _read_connection_state(self, motor_id):
+        device = self.devices.get(motor_id)
+        if not device or not device.get("handle"):
+            return None
+        result = self.nanolib_accessor.checkConnectionState(device["handle"])
+        connection_state = result.getResult() if result else None
+        return bool(connection_state) if connection_state is not None else None
+
+    def _read_telemetry(self, motor_id):
+        """
+        Live read of (position, statusword, connection state) used by the poller.
+        """
+        with self.bus.priority(PRIORITY_POLL):
+            position = self.read_motor_position(motor_id)
+            result = self.nanolib_accessor.readNumber(
+                self.devices[motor_id]["handle"], self._od_statusword.od_index
+            )
+            connection_state = self._read_connection_state(motor_id)
+        if result.hasError():
+            raise Exception(f"Error: readNumber() - {result.getError()}")
+        sw = result.getResult()
+        self.recorder.append(
+            time.time(),
+            motor_id,
+            position,
+            sw,
+            self._commanded_target.get(motor_id, NO_VALUE),
+        )
+        return position, sw, connection_state
+
+    def device_state(self, motor_id=0, max_staleness=None):
         """
         Retrieve the state of the specified motor or both motors.
 
+        While the telemetry poller runs, the state is answered from its
+        snapshot; a motor whose sample is missing or older than
+        `max_staleness` is read live from the bus.
+
         Parameters
         ----------
         motor_id : int, optional
@@ -919,6 +1983,9 @@ class AdcController:
             - 0 to check the state of both motors,
             - 1 for motor 1,
             - 2 for motor 2.
+        max_staleness : float, optional
+            Maximum age (seconds) of a polled sample. If None,
+            `telemetry_max_staleness` is used; 0 forces a live read.
 
         Returns
         -------
@@ -934,29 +2001,26 @@ class AdcController:
             raise ValueError(
                 "Invalid motor number. Use 0 for both motors, 1 for motor 1, or 2 for motor 2."
             )
+        if max_staleness is None:
+            max_staleness = self.telemetry_max_staleness
 
         res = {}
         motors = [motor_id] if motor_id in [1, 2] else [1, 2]
         for motor in motors:
-            position_state = self.read_motor_position(motor)
-            device = self.devices.get(motor)
-            connection_state = None
+            sample = None
+            if self.telemetry is not None and max_staleness > 0:
+                sample = self.telemetry.get(motor, max_staleness)
 
-            if device and device.get("handle"):
-                connection_state_result = self.nanolib_accessor.checkConnectionState(
-                    device["handle"]
-                )
-                connection_state = (
-                    connection_state_result.getResult()
-                    if connection_state_result
-                    else None
-                )
+            if sample is not None:
+                position_state = sample.position_state
+                connection_state = sample.connection_state
+            else:
+                position_state = self.read_motor_position(motor)
+                connection_state = self._read_connection_state(motor)
 
             res[f"motor{motor}"] = {
                 "position_state": position_state,
-                "connection_state": bool(connection_state)
-                if connection_state is not None
-                else None,
+                "connection_state": connection_state,
             }
 
         self.logger.info(f"Device states: {res}")
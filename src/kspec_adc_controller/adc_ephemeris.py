@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_ephemeris.py
+
+import numpy as np
+
+__all__ = [
+    "days_since_j2000",
+    "local_sidereal_time",
+    "zenith_distance",
+    "zenith_distance_at",
+    "tracking_schedule",
+]
+
+_J2000_UNIX = 946728000.0  # 2000-01-01T12:00:00 UTC in Unix seconds
+_SECONDS_PER_DAY = 86400.0
+
+
+def days_since_j2000(utc):
+    """
+    Convert UTC time stamps to days since J2000.0.
+
+    Parameters
+    ----------
+    utc : array-like
+        Either numpy ``datetime64`` values or Unix time stamps (seconds).
+
+    Returns
+    -------
+    numpy.ndarray
+        Days since 2000-01-01T12:00:00 (UTC is used for UT1; the difference
+        is below one second).
+    """
+    utc = np.asarray(utc)
+    if np.issubdtype(utc.dtype, np.datetime64):
+        seconds = (utc - np.datetime64("2000-01-01T12:00:00", "us")) / np.timedelta64(
+            1, "s"
+        )
+    else:
+        seconds = utc.astype(float) - _J2000_UNIX
+    return seconds / _SECONDS_PER_DAY
+
+
+def local_sidereal_time(utc, longitude):
+    """
+    Calculate the local mean sidereal time.
+
+    Parameters
+    ----------
+    utc : array-like
+        Either numpy ``datetime64`` values or Unix time stamps (seconds).
+    longitude : float
+        Site longitude in degrees, east positive.
+
+    Returns
+    -------
+    numpy.ndarray
+        Local mean sidereal time in degrees, in [0, 360).
+    """
+    d = days_since_j2000(utc)
+    t = d / 36525.0
+    gmst = 280.46061837 + 360.98564736629 * d + 0.000387933 * t**2 - t**3 / 38710000.0
+    return np.mod(gmst + longitude, 360.0)
+
+
+def zenith_distance(ra, dec, latitude, lst):
+    """
+    Calculate the geometric zenith distance of a target.
+
+    Parameters
+    ----------
+    ra, dec : float or array-like
+        Right ascension and declination of the target in degrees.
+    latitude : float
+        Site latitude in degrees, north positive.
+    lst : float or array-like
+        Local sidereal time in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Zenith distance in degrees (0 at the zenith, above 90 below the horizon).
+    """
+    ha = np.radians(np.asarray(lst, dtype=float) - np.asarray(ra, dtype=float))
+    dec = np.radians(np.asarray(dec, dtype=float))
+    lat = np.radians(latitude)
+    cos_z = np.sin(lat) * np.sin(dec) + np.cos(lat) * np.cos(dec) * np.cos(ha)
+    return np.degrees(np.arccos(np.clip(cos_z, -1.0, 1.0)))
+
+
+def zenith_distance_at(ra, dec, latitude, longitude, utc):
+    """
+    Calculate the zenith distance of a target at the given UTC time stamps.
+
+    Parameters
+    ----------
+    ra, dec : float or array-like
+        Right ascension and declination of the target in degrees.
+    latitude, longitude : float
+        Site latitude (north positive) and longitude (east positive) in degrees.
+    utc : array-like
+        Either numpy ``datetime64`` values or Unix time stamps (seconds).
+
+    Returns
+    -------
+    numpy.ndarray
+        Zenith distance in degrees.
+    """
+    return zenith_distance(ra, dec, latitude, local_sidereal_time(utc, longitude))
+
+
+def tracking_schedule(
+    calc, ra, dec, latitude, longitude, utc, dtype=np.int64, rounding="trunc"
+):
+    """
+    Precompute time-stamped count setpoints of a target in one pass.
+
+    Samples whose zenith distance lies outside the lookup table range of
+    `calc` (e.g. the target is too low) are left out of the schedule.
+
+    Parameters
+    ----------
+    calc : ADCCalc
+        The calculator converting zenith distances to ADC counts.
+    ra, dec : float
+        Right ascension and declination of the target in degrees.
+    latitude, longitude : float
+        Site latitude (north positive) and longitude (east positive) in degrees.
+    utc : array-like
+        1-D array of ``datetime64`` values or Unix time stamps (seconds).
+    dtype : {numpy.int64, numpy.int32}, optional
+        Integer type of the returned counts.
+    rounding : {'trunc', 'nearest', 'floor'}, optional
+        Rounding mode, see `ADCCalc.degrees_to_counts`.
+
+    Returns
+    -------
+    times : numpy.ndarray
+        The time stamps of the scheduled samples.
+    za : numpy.ndarray
+        Zenith distance (degree) of each scheduled sample.
+    counts : numpy.ndarray
+        Encoder counts of the ADC angle of each scheduled sample.
+    """
+    utc = np.atleast_1d(np.asarray(utc))
+    za = zenith_distance_at(ra, dec, latitude, longitude, utc)
+    valid = (za >= calc.za_min) & (za <= calc.za_max)
+    _, counts = calc.za_to_counts(za[valid], dtype=dtype, rounding=rounding)
+    return utc[valid], za[valid], counts
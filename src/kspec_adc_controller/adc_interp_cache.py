@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_interp_cache.py
+
+import hashlib
+import os
+
+import numpy as np
+
+from .adc_cache import get_cache_dir
+
+__all__ = ["InterpCache", "lookup_table_digest"]
+
+
+def _get_default_cache_dir() -> str:
+    """
+    Returns the default interpolant cache directory in the user cache directory.
+    """
+    return os.path.join(get_cache_dir(), "interp")
+
+
+def lookup_table_digest(lookup_table: str) -> str:
+    """
+    Return the SHA-256 hex digest of a lookup table file's content.
+
+    Parameters
+    ----------
+    lookup_table : str
+        Path to the lookup table file.
+
+    Returns
+    -------
+    str
+        Hex digest of the raw file bytes.
+    """
+    sha = hashlib.sha256()
+    with open(lookup_table, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class InterpCache:
+    """
+    On-disk cache of fitted piecewise-polynomial interpolants.
+
+    Each entry is a pair of `.npy` files holding the breakpoints and the
+    coefficient matrix, keyed by (lookup table SHA-256, method). Entries are
+    loaded by memory-mapping, so a hit skips both CSV parsing and fitting.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding the cached `.npy` files.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Parameters
+        ----------
+        cache_dir : str, optional
+            Directory for cache files. If None, a default path is used.
+        """
+        if cache_dir is None:
+            cache_dir = _get_default_cache_dir()
+        self.cache_dir = cache_dir
+
+    def _paths(self, digest: str, method: str):
+        stem = os.path.join(self.cache_dir, f"{digest}_{method}")
+        return f"{stem}.x.npy", f"{stem}.c.npy"
+
+    def load(self, digest: str, method: str):
+        """
+        Load a cached interpolant.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 digest of the lookup table.
+        method : str
+            Interpolation method name.
+
+        Returns
+        -------
+        tuple of numpy.ndarray or None
+            Memory-mapped (breakpoints, coefficients), or None on a cache miss.
+        """
+        x_path, c_path = self._paths(digest, method)
+        if not (os.path.isfile(x_path) and os.path.isfile(c_path)):
+            return None
+        x = np.load(x_path, mmap_mode="r")
+        c = np.load(c_path, mmap_mode="r")
+        if x.ndim != 1 or c.ndim < 2 or c.shape[1] != x.size - 1:
+            raise ValueError(f"Corrupt interpolant cache entry: {x_path}")
+        return x, c
+
+    def store(self, digest: str, method: str, x, c) -> None:
+        """
+        Store an interpolant's breakpoints and coefficients.
+
+        Files are written to a temporary name first and then renamed, so
+        concurrent readers never see a partially written entry.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 digest of the lookup table.
+        method : str
+            Interpolation method name.
+        x : numpy.ndarray
+            Breakpoints of the piecewise polynomial.
+        c : numpy.ndarray
+            Coefficient matrix of the piecewise polynomial.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for path, arr in zip(self._paths(digest, method), (x, c)):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(arr))
+            os.replace(tmp_path, path)
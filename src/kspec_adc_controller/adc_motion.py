@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_motion.py
+
+import asyncio
+import time
+
+__all__ = ["MotionHandle", "MotionInterrupted", "SetpointStream"]
+
+
+class MotionInterrupted(Exception):
+    """
+    Raised by a motion handle whose move was ended by an external stop.
+    """
+
+
+class MotionHandle:
+    """
+    Awaitable handle of a move started with `AdcController.move`.
+
+    Awaiting the handle returns the move result dictionary. `cancel` stops
+    the motor and makes the awaiting side raise ``asyncio.CancelledError``
+    once the stop is issued; a stop sent by `AdcController.stop_motor`
+    ends the move with `MotionInterrupted` instead.
+
+    Attributes
+    ----------
+    motor_id : int
+        The identifier of the motor.
+    distance : int
+        Relative move distance in counts.
+    velocity : int
+        Profile velocity (RPM).
+    state : str
+        One of 'setup', 'moving', 'done', 'cancelled' or 'failed'.
+    initial_position : int or None
+        Position read before the move was started.
+    predicted_time : float or None
+        Predicted duration of the move in seconds.
+    statusword : int or None
+        Last polled statusword.
+    """
+
+    def __init__(self, motor_id, distance, velocity):
+        self.motor_id = motor_id
+        self.distance = distance
+        self.velocity = velocity
+        self.state = "setup"
+        self.initial_position = None
+        self.predicted_time = None
+        self.statusword = None
+        self.moving_since = None
+        self._stop_requested = False
+        self._task = None
+        self._loop = None
+
+    def _attach(self, task):
+        self._task = task
+        self._loop = task.get_loop()
+
+    @property
+    def future(self) -> asyncio.Future:
+        """
+        The completion future (the task running the move).
+        """
+        return self._task
+
+    def done(self) -> bool:
+        return self._task.done()
+
+    def cancelled(self) -> bool:
+        return self._task.cancelled()
+
+    def result(self):
+        """
+        Return the move result; raises like ``asyncio.Future.result``.
+        """
+        return self._task.result()
+
+    def cancel(self) -> bool:
+        """
+        Request cancellation of the move; the motor is stopped before the
+        handle resolves. Safe to call from any thread.
+
+        Returns
+        -------
+        bool
+            False if the move already finished.
+        """
+        if self._task.done():
+            return False
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._task.cancel()
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:  # loop가 이미 닫힘
+                return False
+        return True
+
+    def _interrupt(self):
+        # 외부 stop_motor 호출: stop은 이미 나가므로 handle은 stop을 다시 보내지 않음
+        if self.state in ("setup", "moving"):
+            self._stop_requested = True
+            self.cancel()
+
+    def progress(self) -> dict:
+        """
+        Return the progress of the move.
+
+        Returns
+        -------
+        dict
+            ``state``, ``elapsed`` (seconds since the move was started),
+            ``predicted_time``, ``fraction`` (elapsed over predicted time,
+            capped at 0.99 until the drive reports completion; None if
+            unknown) and the last ``statusword``.
+        """
+        elapsed = (
+            time.monotonic() - self.moving_since
+            if self.moving_since is not None
+            else 0.0
+        )
+        if self.state == "done":
+            fraction = 1.0
+        elif self.predicted_time:
+            fraction = min(0.99, elapsed / self.predicted_time)
+        else:
+            fraction = None
+        return {
+            "state": self.state,
+            "elapsed": elapsed,
+            "predicted_time": self.predicted_time,
+            "fraction": fraction,
+            "statusword": self.statusword,
+        }
+
+    def __await__(self):
+        return self._task.__await__()
+
+    def __repr__(self):
+        return (
+            f"MotionHandle(motor_id={self.motor_id}, distance={self.distance}, "
+            f"state={self.state!r})"
+        )
+
+
+class SetpointStream:
+    """
+    Stream of set-points of one motor, created by
+    `AdcController.setpoint_stream`.
+
+    Each `push` hands a new target to the drive with the set-point
+    handshake and returns as soon as the drive acknowledged it, without
+    waiting for the motor to arrive, so successive corrections blend into
+    one continuous motion instead of stop-start moves. Pushes of one stream
+    are sent one at a time.
+
+    Attributes
+    ----------
+    motor_id : int
+        The identifier of the motor.
+    velocity : int
+        Profile velocity (RPM).
+    buffered : bool
+        False: a new set-point replaces the running one at once ("change set
+        immediately"). True: it is queued in the drive's set-point buffer
+        and started when the running one is reached, without stopping.
+    pushed : int
+        Number of set-points sent to the drive.
+    skipped : int
+        Number of pushes within one count of the commanded position.
+    closed : bool
+        True after `close`; further pushes raise RuntimeError.
+    """
+
+    def __init__(self, controller, motor_id, velocity, buffered=False):
+        self._controller = controller
+        self.motor_id = motor_id
+        self.velocity = velocity
+        self.buffered = buffered
+        self.pushed = 0
+        self.skipped = 0
+        self._ack_time_sum = 0.0
+        self._lock = asyncio.Lock()
+        self.closed = False
+
+    async def push(self, target) -> dict:
+        """
+        Send a new target (counts from the zero reference); see
+        `AdcController.push_setpoint`.
+
+        Raises
+        ------
+        RuntimeError
+            If the stream is closed.
+        """
+        async with self._lock:
+            if self.closed:
+                raise RuntimeError(
+                    f"Set-point stream of Motor {self.motor_id} is closed."
+                )
+            result = await self._controller.push_setpoint(
+                self.motor_id, target, self.velocity, buffered=self.buffered
+            )
+        if result["skipped"]:
+            self.skipped += 1
+        else:
+            self.pushed += 1
+            self._ack_time_sum += result["ack_time"]
+        return result
+
+    async def settle(self, timeout=None) -> float:
+        """
+        Wait until the drive reports the last set-point reached.
+
+        Returns
+        -------
+        float
+            Seconds waited.
+        """
+        return await self._controller.wait_target_reached(self.motor_id, timeout)
+
+    async def close(self, settle=True, timeout=None):
+        """
+        Close the stream after the push in flight, if any.
+
+        Parameters
+        ----------
+        settle : bool, optional
+            Also wait until the drive reports the last set-point reached;
+            skipped if nothing was pushed.
+        timeout : float, optional
+            Maximum settle time in seconds; see `settle`.
+
+        Returns
+        -------
+        float or None
+            Seconds waited for the drive to settle, or None if not waited.
+        """
+        async with self._lock:
+            self.closed = True
+        if settle and self.pushed:
+            return await self.settle(timeout)
+        return None
+
+    @property
+    def mean_ack_time(self):
+        """
+        Mean time (seconds) from sending a set-point to its acknowledge, or
+        None before the first push.
+        """
+        return self._ack_time_sum / self.pushed if self.pushed else None
+
+    def __repr__(self):
+        return (
+            f"SetpointStream(motor_id={self.motor_id}, buffered={self.buffered}, "
+            f"pushed={self.pushed})"
+        )
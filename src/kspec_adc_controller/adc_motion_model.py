@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_motion_model.py
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from .adc_cache import get_cache_dir
+
+__all__ = ["MotionTimeModel"]
+
+N_FEATURES = 3
+MIN_SAMPLES = 5  # 이보다 적으면 fit을 쓰지 않고 fallback 사용
+
+
+def _get_default_model_path() -> str:
+    """
+    Returns the default motion-time model path in the user cache directory.
+    """
+    return os.path.join(get_cache_dir(), "motion_model.json")
+
+
+def _features(distance, vel):
+    """
+    Regression features of a move: [1, |distance| / velocity, velocity].
+
+    For a trapezoidal profile the duration is d/v + v/a, so the fit recovers
+    the cruise time, the ramp time and a constant command overhead.
+    """
+    vel = abs(float(vel))
+    return np.array([1.0, abs(float(distance)) / vel, vel])
+
+
+class MotionTimeModel:
+    """
+    Persistent per-motor model of move duration versus distance and velocity.
+
+    Each motor keeps the normal equations (sum of x x^T and x y) of an online
+    least-squares fit of the measured duration y on the features
+    [1, |counts| / velocity, velocity]. Updates are O(1) and the fit is
+    solved on demand; the sums are stored as JSON so the model survives
+    restarts.
+
+    Attributes
+    ----------
+    path : str
+        JSON file the model is stored in.
+    save_interval : float
+        Minimum time (seconds) between two autosaves.
+    save_error : OSError or None
+        Error of the last failed background save.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        autosave: bool = True,
+        load: bool = True,
+        save_interval: float = 30.0,
+    ):
+        """
+        Parameters
+        ----------
+        path : str, optional
+            Path of the JSON model file. If None, a default path is used.
+        autosave : bool, optional
+            If True, updates are written to `path` by a background thread,
+            at most once per `save_interval`; `flush` writes the rest.
+        load : bool, optional
+            If True and `path` exists, the stored model is loaded.
+        save_interval : float, optional
+            Minimum time (seconds) between two autosaves.
+
+        Raises
+        ------
+        ValueError
+            If the stored model cannot be parsed.
+        """
+        if path is None:
+            path = _get_default_model_path()
+        self.path = path
+        self.autosave = autosave
+        self.save_interval = save_interval
+        self.save_error = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 동시에 두 번 쓰지 않도록
+        self._motors = {}
+        self._dirty = False
+        self._last_save = None
+        self._save_thread = None
+        if load and os.path.isfile(path):
+            self.load()
+
+    def _stats(self, motor_id):
+        key = str(motor_id)
+        if key not in self._motors:
+            self._motors[key] = {
+                "n": 0,
+                "xtx": np.zeros((N_FEATURES, N_FEATURES)),
+                "xty": np.zeros(N_FEATURES),
+            }
+        return self._motors[key]
+
+    def n_samples(self, motor_id) -> int:
+        """
+        Number of moves the model of a motor was fitted on.
+        """
+        stats = self._motors.get(str(motor_id))
+        return stats["n"] if stats else 0
+
+    def update(self, motor_id, distance, vel, duration):
+        """
+        Add one measured move to the model of a motor.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        distance : int
+            Relative move distance in counts.
+        vel : float
+            Profile velocity (RPM).
+        duration : float
+            Measured move duration in seconds.
+        """
+        if distance == 0 or vel == 0:
+            return
+        x = _features(distance, vel)
+        with self._lock:
+            stats = self._stats(motor_id)
+            stats["n"] += 1
+            stats["xtx"] += np.outer(x, x)
+            stats["xty"] += x * duration
+            self._dirty = True
+        if self.autosave:
+            self._schedule_save()
+
+    def _schedule_save(self):
+        # event loop를 막지 않도록 파일 쓰기는 background thread에서, 간격을 두고
+        with self._lock:
+            if self._save_thread is not None and self._save_thread.is_alive():
+                return
+            if (
+                self._last_save is not None
+                and time.monotonic() - self._last_save < self.save_interval
+            ):
+                return
+            self._save_thread = threading.Thread(
+                target=self._autosave, name="adc-motion-model-save", daemon=True
+            )
+            self._save_thread.start()
+
+    def _autosave(self):
+        try:
+            self.save()
+            self.save_error = None
+        except OSError as e:
+            self.save_error = e
+
+    def flush(self):
+        """
+        Wait for a running autosave and write any updates not saved yet.
+
+        Raises
+        ------
+        OSError
+            If the model cannot be written.
+        """
+        thread = self._save_thread
+        if thread is not None:
+            thread.join()
+        if self._dirty:
+            self.save()
+
+    def coefficients(self, motor_id):
+        """
+        Least-squares coefficients [overhead, cruise scale, ramp scale] of a
+        motor, or None if it has fewer than `MIN_SAMPLES` moves.
+        """
+        stats = self._motors.get(str(motor_id))
+        if stats is None or stats["n"] < MIN_SAMPLES:
+            return None
+        coef, *_ = np.linalg.lstsq(stats["xtx"], stats["xty"], rcond=None)
+        return coef
+
+    def predict(self, motor_id, distance, vel):
+        """
+        Predict the duration of a move.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        distance : int
+            Relative move distance in counts.
+        vel : float
+            Profile velocity (RPM).
+
+        Returns
+        -------
+        float or None
+            Predicted duration in seconds, or None if the motor's model is
+            not trained yet.
+        """
+        if distance == 0 or vel == 0:
+            return 0.0
+        coef = self.coefficients(motor_id)
+        if coef is None:
+            return None
+        return max(0.0, float(_features(distance, vel) @ coef))
+
+    def save(self):
+        """
+        Write the model to `path`, replacing the file atomically.
+        """
+        with self._save_lock:
+            self._write()
+
+    def _write(self):
+        with self._lock:
+            data = {
+                key: {
+                    "n": stats["n"],
+                    "xtx": stats["xtx"].tolist(),
+                    "xty": stats["xty"].tolist(),
+                }
+                for key, stats in self._motors.items()
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"features": ["1", "|counts|/vel", "vel"], "motors": data}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            self._dirty = True  # 다음 save에서 다시 시도
+            raise
+
+    def load(self):
+        """
+        Load the model from `path`.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid motion-time model.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            motors = {
+                key: {
+                    "n": int(stats["n"]),
+                    "xtx": np.array(stats["xtx"], dtype=float).reshape(
+                        N_FEATURES, N_FEATURES
+                    ),
+                    "xty": np.array(stats["xty"], dtype=float).reshape(N_FEATURES),
+                }
+                for key, stats in data["motors"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid motion-time model {self.path}: {e}")
+        with self._lock:
+            self._motors = motors
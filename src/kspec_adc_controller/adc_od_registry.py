@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_od_registry.py
+
+import configparser
+import os
+import re
+
+__all__ = ["OdEntry", "OdRegistry"]
+
+# CiA 301 data type code -> (name, bit length, signed)
+DATA_TYPES = {
+    0x0001: ("BOOLEAN", 1, False),
+    0x0002: ("INTEGER8", 8, True),
+    0x0003: ("INTEGER16", 16, True),
+    0x0004: ("INTEGER32", 32, True),
+    0x0005: ("UNSIGNED8", 8, False),
+    0x0006: ("UNSIGNED16", 16, False),
+    0x0007: ("UNSIGNED32", 32, False),
+    0x0015: ("INTEGER64", 64, True),
+    0x001B: ("UNSIGNED64", 64, False),
+}
+
+_READ_ACCESS = {"ro", "rw", "rwr", "rww", "const"}
+_WRITE_ACCESS = {"wo", "rw", "rwr", "rww"}
+_SECTION_RE = re.compile(r"^([0-9A-Fa-f]{4})(?:sub([0-9A-Fa-f]+))?$")
+
+
+def _get_default_od_paths():
+    """
+    Returns the default EDS-style object dictionary files of the package.
+    """
+    etc_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "etc")
+    return [os.path.join(etc_dir, "home.txt"), os.path.join(etc_dir, "motion.txt")]
+
+
+class OdEntry:
+    """
+    One object-dictionary entry with a prebuilt OdIndex handle.
+
+    Attributes
+    ----------
+    index, subindex : int
+        Object-dictionary address.
+    key : tuple of int
+        (index, subindex).
+    name : str
+        Parameter name.
+    data_type : str
+        CiA 301 data type name, e.g. 'UNSIGNED16'.
+    bits : int
+        Bit length used for `writeNumber`.
+    access : str
+        EDS access type ('ro', 'rw', 'rww', ...).
+    default : str
+        Default value as written in the definition file.
+    od_index : object
+        Prebuilt ``Nanolib.OdIndex`` (or None if no factory was given).
+    """
+
+    __slots__ = (
+        "index",
+        "subindex",
+        "key",
+        "name",
+        "data_type",
+        "bits",
+        "access",
+        "default",
+        "od_index",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, index, subindex, name, data_type, access, default, od_index):
+        type_name, bits, signed = DATA_TYPES[data_type]
+        self.index = index
+        self.subindex = subindex
+        self.key = (index, subindex)
+        self.name = name
+        self.data_type = type_name
+        self.bits = bits
+        self.access = access
+        self.default = default
+        self.od_index = od_index
+        if signed:
+            self._min, self._max = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+        else:
+            self._min, self._max = 0, (1 << bits) - 1
+
+    @property
+    def readable(self) -> bool:
+        return self.access in _READ_ACCESS
+
+    @property
+    def writable(self) -> bool:
+        return self.access in _WRITE_ACCESS
+
+    def check_value(self, value):
+        """
+        Raise ValueError if `value` does not fit the entry's data type.
+        """
+        if not self._min <= value <= self._max:
+            raise ValueError(
+                f"Value {value} out of range for {self.name} "
+                f"(0x{self.index:04X}:{self.subindex:02X}, {self.data_type})"
+            )
+
+    def __repr__(self):
+        return (
+            f"OdEntry(0x{self.index:04X}:{self.subindex:02X} {self.name!r}, "
+            f"{self.data_type}, {self.access})"
+        )
+
+
+class OdRegistry:
+    """
+    Registry of object-dictionary entries loaded from EDS-style files.
+
+    Each section ``[IIII]`` or ``[IIIIsubS]`` (hexadecimal) with a
+    ``DataType`` becomes an `OdEntry`; record/array headers without a data
+    type are skipped. The OdIndex handle of every entry is built once at load
+    time, so callers can reuse it in polling loops.
+    """
+
+    def __init__(self, paths=None, od_index_factory=None):
+        """
+        Parameters
+        ----------
+        paths : sequence of str, optional
+            Definition files to load. If None, the package's etc/home.txt and
+            etc/motion.txt are used.
+        od_index_factory : callable, optional
+            Called as ``od_index_factory(index, subindex)`` to prebuild the
+            handle of each entry, normally ``Nanolib.OdIndex``.
+
+        Raises
+        ------
+        ValueError
+            If a definition file cannot be parsed or uses an unknown data type.
+        """
+        if paths is None:
+            paths = _get_default_od_paths()
+        self._entries = {}
+        for path in paths:
+            self._load(path, od_index_factory)
+
+    def _load(self, path, od_index_factory):
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.optionxform = str  # key 대소문자 유지
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                parser.read_file(f)
+        except (OSError, configparser.Error) as e:
+            raise ValueError(f"Failed to read object dictionary {path}: {e}")
+
+        for section in parser.sections():
+            match = _SECTION_RE.match(section)
+            if match is None:
+                continue
+            fields = parser[section]
+            if "DataType" not in fields:
+                continue  # record/array header
+
+            index = int(match.group(1), 16)
+            subindex = int(match.group(2), 16) if match.group(2) else 0
+            data_type = int(fields["DataType"], 0)
+            if data_type not in DATA_TYPES:
+                raise ValueError(
+                    f"Unsupported data type 0x{data_type:04X} in {path} [{section}]"
+                )
+            od_index = od_index_factory(index, subindex) if od_index_factory else None
+            self._entries[(index, subindex)] = OdEntry(
+                index,
+                subindex,
+                fields.get("ParameterName", section),
+                data_type,
+                fields.get("AccessType", "ro").lower(),
+                fields.get("DefaultValue", ""),
+                od_index,
+            )
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def entry(self, index, subindex=0x00) -> OdEntry:
+        """
+        Return the entry at (index, subindex).
+
+        Raises
+        ------
+        KeyError
+            If the registry has no such entry.
+        """
+        try:
+            return self._entries[(index, subindex)]
+        except KeyError:
+            raise KeyError(
+                f"Object 0x{index:04X}:{subindex:02X} is not in the object dictionary"
+            ) from None
+
+    def require(self, index, subindex=0x00, access="r") -> OdEntry:
+        """
+        Return the entry at (index, subindex), checking its access rights.
+
+        Parameters
+        ----------
+        index, subindex : int
+            Object-dictionary address.
+        access : {'r', 'w', 'rw'}, optional
+            Required access.
+
+        Raises
+        ------
+        KeyError
+            If the registry has no such entry.
+        PermissionError
+            If the entry does not allow the required access.
+        """
+        entry = self.entry(index, subindex)
+        if ("r" in access and not entry.readable) or (
+            "w" in access and not entry.writable
+        ):
+            raise PermissionError(f"{entry!r} does not allow '{access}' access")
+        return entry
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_position.py
+
+__all__ = [
+    "COUNTS_PER_REV",
+    "unwrap_position",
+    "wrap_position",
+    "shortest_delta",
+]
+
+COUNTS_PER_REV = 16200  # 1 revolution = 16200 counts
+_POSITION_RANGE = 1 << 32  # 0x6064 / 0x607A는 INTEGER32
+
+
+def unwrap_position(raw) -> int:
+    """
+    Interpret a position read from the drive as a signed 32-bit value.
+
+    Nanolib returns the 32-bit position register as an unsigned number, so
+    a motor a few counts below zero reads as just under 2**32.
+
+    Parameters
+    ----------
+    raw : int
+        Position as returned by ``readNumber``.
+
+    Returns
+    -------
+    int
+        The position in counts, in [-2**31, 2**31).
+    """
+    raw = int(raw) % _POSITION_RANGE
+    return raw - _POSITION_RANGE if raw >= _POSITION_RANGE // 2 else raw
+
+
+def wrap_position(position) -> int:
+    """
+    Reduce a position to the prism angle within one revolution.
+
+    Returns
+    -------
+    int
+        The position modulo `COUNTS_PER_REV`, in [0, COUNTS_PER_REV).
+    """
+    return unwrap_position(position) % COUNTS_PER_REV
+
+
+def shortest_delta(current, target, direction=0) -> int:
+    """
+    Relative move that brings the prism from `current` to the angle of `target`.
+
+    Both positions are unwrapped first and compared modulo one revolution,
+    so the move never exceeds one revolution and, by default, never exceeds
+    half a revolution.
+
+    Parameters
+    ----------
+    current : int
+        Current position in counts (raw or unwrapped).
+    target : int
+        Target position in counts (raw or unwrapped).
+    direction : {0, 1, -1}, optional
+        0 takes the shortest way (+half a revolution on a tie); 1 or -1
+        forces the approach from the negative or positive side, i.e. the
+        move is always in the positive or negative count direction.
+
+    Returns
+    -------
+    int
+        Relative move in counts.
+
+    Raises
+    ------
+    ValueError
+        If `direction` is not 0, 1 or -1.
+    """
+    if direction not in (0, 1, -1):
+        raise ValueError(f"direction must be 0, 1 or -1, got {direction}.")
+    forward = (unwrap_position(target) - unwrap_position(current)) % COUNTS_PER_REV
+    if forward == 0:
+        return 0
+    backward = forward - COUNTS_PER_REV
+    if direction == 1:
+        return forward
+    if direction == -1:
+        return backward
+    return forward if forward <= -backward else backward
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_recorder.py
+
+import glob
+import os
+import queue
+import re
+import threading
+
+import numpy as np
+
+__all__ = ["RECORD_DTYPE", "NO_VALUE", "TelemetryRecorder", "load_chunks"]
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "f8"),  # Unix time (s)
+        ("motor_id", "u1"),
+        ("position", "i8"),
+        ("statusword", "u2"),
+        ("target", "i8"),  # 마지막으로 명령한 절대 목표 위치
+    ]
+)
+NO_VALUE = np.iinfo(np.int64).min  # position/target을 모를 때의 sentinel
+
+
+class TelemetryRecorder:
+    """
+    Fixed-capacity ring buffer of motor samples backed by a preallocated
+    NumPy structured array.
+
+    `append` only writes scalars into views created at construction, so
+    recording allocates no arrays per sample. Once `capacity` samples are
+    stored the oldest are overwritten. If `chunk_dir` is given, every block
+    of `chunk_size` samples is also written to a memory-mapped ``.npy``
+    file as soon as it is complete, so a whole night can be kept on disk
+    while the buffer holds only the most recent samples. Complete chunks
+    are copied and written by a background thread, so `append` never
+    waits for the disk; call `flush` or `close` to wait for them.
+
+    Chunk numbering continues after the highest chunk already in
+    `chunk_dir`, so a new recorder (e.g. after a restart) never overwrites
+    an earlier session and `load_chunks` returns both in order.
+
+    Attributes
+    ----------
+    capacity : int
+        Number of samples held in memory.
+    chunk_size : int
+        Number of samples per flushed ``.npy`` chunk.
+    chunk_dir : str or None
+        Directory of the flushed chunks; None disables flushing.
+    total : int
+        Number of samples appended since construction.
+    chunks_written : int
+        Number of chunk files written by this recorder.
+    write_error : OSError or None
+        Error of the last failed chunk write, if any.
+    """
+
+    def __init__(self, capacity=65536, chunk_dir=None, chunk_size=4096, prefix="adc"):
+        """
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of samples held in memory.
+        chunk_dir : str, optional
+            Directory for memory-mapped ``.npy`` chunks. If None, nothing is
+            written to disk.
+        chunk_size : int, optional
+            Samples per chunk; must divide `capacity`.
+        prefix : str, optional
+            File name prefix of the chunks (``<prefix>_<n>.npy``).
+
+        Raises
+        ------
+        ValueError
+            If `capacity` or `chunk_size` is not positive, or `chunk_size`
+            does not divide `capacity`.
+        """
+        if capacity <= 0 or chunk_size <= 0 or capacity % chunk_size:
+            raise ValueError(
+                f"capacity ({capacity}) must be a positive multiple of "
+                f"chunk_size ({chunk_size})."
+            )
+        self.capacity = int(capacity)
+        self.chunk_size = int(chunk_size)
+        self.chunk_dir = chunk_dir
+        self.prefix = prefix
+        self._buf = np.zeros(self.capacity, dtype=RECORD_DTYPE)
+        # field view는 한 번만 만들어 두고 append에서는 scalar만 씀
+        self._timestamp = self._buf["timestamp"]
+        self._motor_id = self._buf["motor_id"]
+        self._position = self._buf["position"]
+        self._statusword = self._buf["statusword"]
+        self._target = self._buf["target"]
+        self._lock = threading.Lock()
+        self.total = 0
+        self.chunks_written = 0
+        self.write_error = None
+        self._pending = queue.Queue()
+        self._writer = None
+        self._next_chunk = 0
+        if chunk_dir is not None:
+            os.makedirs(chunk_dir, exist_ok=True)
+            self._next_chunk = _last_chunk_index(chunk_dir, prefix) + 1
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, timestamp, motor_id, position, statusword, target=NO_VALUE):
+        """
+        Record one sample.
+
+        Parameters
+        ----------
+        timestamp : float
+            Unix time of the sample.
+        motor_id : int
+            The identifier of the motor.
+        position : int
+            Actual position in counts, or `NO_VALUE` if not read.
+        statusword : int
+            Statusword (0x6041).
+        target : int, optional
+            Last commanded absolute target in counts, or `NO_VALUE`.
+        """
+        with self._lock:
+            i = self.total % self.capacity
+            self._timestamp[i] = timestamp
+            self._motor_id[i] = motor_id
+            self._position[i] = position
+            self._statusword[i] = statusword
+            self._target[i] = target
+            self.total += 1
+            if self.chunk_dir is not None and self.total % self.chunk_size == 0:
+                start = i + 1 - self.chunk_size
+                # 완성된 chunk는 복사해서 writer thread로 넘김 (disk I/O 없음)
+                self._submit_chunk(self._buf[start : start + self.chunk_size].copy())
+
+    def _submit_chunk(self, chunk):
+        index = self._next_chunk
+        self._next_chunk += 1
+        self._pending.put((index, chunk))
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._write_chunks, name="adc-recorder-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _write_chunks(self):
+        while True:
+            item = self._pending.get()
+            try:
+                if item is None:
+                    return
+                self._write_chunk(*item)
+                self.chunks_written += 1
+            except OSError as e:
+                self.write_error = e
+            finally:
+                self._pending.task_done()
+
+    def _write_chunk(self, index, data):
+        path = os.path.join(self.chunk_dir, f"{self.prefix}_{index:06d}.npy")
+        chunk = np.lib.format.open_memmap(
+            path, mode="w+", dtype=RECORD_DTYPE, shape=(self.chunk_size,)
+        )
+        chunk[:] = data
+        chunk.flush()
+        del chunk
+
+    def flush(self):
+        """
+        Wait until every complete chunk has been written to disk.
+
+        Raises
+        ------
+        OSError
+            If a chunk could not be written.
+        """
+        self._pending.join()
+        if self.write_error is not None:
+            raise self.write_error
+
+    def close(self):
+        """
+        Write the pending chunks and stop the writer thread.
+
+        Raises
+        ------
+        OSError
+            If a chunk could not be written.
+        """
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._pending.put(None)
+            writer.join()
+        self._writer = None
+        if self.write_error is not None:
+            raise self.write_error
+
+    def snapshot(self, t_start=None, t_end=None, motor_id=None):
+        """
+        Return the buffered samples in chronological order.
+
+        Parameters
+        ----------
+        t_start, t_end : float, optional
+            Inclusive time window (Unix time). None leaves the side open.
+        motor_id : int, optional
+            Only return samples of this motor.
+
+        Returns
+        -------
+        numpy.ndarray
+            A copy with dtype `RECORD_DTYPE`; access columns by field name,
+            e.g. ``snap["position"]``.
+        """
+        with self._lock:
+            n = len(self)
+            start = self.total % self.capacity if self.total > self.capacity else 0
+            data = np.roll(self._buf[:n], -start) if start else self._buf[:n].copy()
+
+        mask = np.ones(n, dtype=bool)
+        if t_start is not None:
+            mask &= data["timestamp"] >= t_start
+        if t_end is not None:
+            mask &= data["timestamp"] <= t_end
+        if motor_id is not None:
+            mask &= data["motor_id"] == motor_id
+        return data[mask]
+
+
+def _last_chunk_index(chunk_dir, prefix) -> int:
+    # chunk_dir에 이미 있는 <prefix>_<n>.npy 중 가장 큰 n, 없으면 -1
+    pattern = re.compile(rf"{re.escape(prefix)}_(\d+)\.npy")
+    indices = [
+        int(match.group(1))
+        for match in map(pattern.fullmatch, os.listdir(chunk_dir))
+        if match
+    ]
+    return max(indices, default=-1)
+
+
+def load_chunks(chunk_dir, prefix="adc"):
+    """
+    Concatenate the ``.npy`` chunks written by a `TelemetryRecorder`.
+
+    Parameters
+    ----------
+    chunk_dir : str
+        Directory of the chunks.
+    prefix : str, optional
+        File name prefix of the chunks.
+
+    Returns
+    -------
+    numpy.ndarray
+        All recorded samples in file order, with dtype `RECORD_DTYPE`.
+    """
+    paths = sorted(glob.glob(os.path.join(chunk_dir, f"{prefix}_*.npy")))
+    if not paths:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.concatenate([np.load(path, mmap_mode="r") for path in paths])
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_session.py
+
+import os
+import re
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+from .adc_cache import get_cache_dir
+from .adc_logger import AdcLogger
+
+__all__ = [
+    "SessionBusyError",
+    "SessionLease",
+    "SessionRegistry",
+    "get_session_registry",
+]
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def _get_default_lock_dir() -> str:
+    """
+    Returns the default directory of the bus lock files in the user cache directory.
+    """
+    return os.path.join(get_cache_dir(), "locks")
+
+
+def _lock_name(hardware_specifier) -> str:
+    """
+    Lock file name of a bus hardware specifier (e.g. ``/dev/ttyUSB0``).
+
+    Device paths are resolved first, so a ``/dev/serial/by-id`` link and
+    the port it points to share one lock.
+    """
+    spec = str(hardware_specifier)
+    if os.path.isabs(spec):
+        spec = os.path.realpath(spec)
+    return "bus-" + (re.sub(r"[^\w.-]+", "_", spec).strip("_") or "default") + ".lock"
+
+
+class SessionBusyError(RuntimeError):
+    """
+    Raised when another process holds the bus of a session.
+    """
+
+
+class _Session:
+    def __init__(self, key, controller, lock_file):
+        self.key = key
+        self.controller = controller
+        self.lock_file = lock_file
+        self.refs = 0
+
+
+class SessionLease:
+    """
+    One user's claim on a shared controller session.
+
+    Attributes
+    ----------
+    controller : AdcController
+        The controller of the session, with its bus opened and devices added.
+    key : str
+        Key of the session in its registry (the controller config path).
+    """
+
+    def __init__(self, registry, session):
+        self._registry = registry
+        self._session = session
+        self.controller = session.controller
+        self.key = session.key
+        self.released = False
+
+    @property
+    def users(self) -> int:
+        """
+        Number of unreleased leases on the session, including this one.
+        """
+        return self._session.refs
+
+    def release(self) -> bool:
+        """
+        Give up the lease; the last lease of a session closes the bus.
+
+        Returns
+        -------
+        bool
+            True if this was the last lease and the bus was closed.
+
+        Raises
+        ------
+        RuntimeError
+            If the lease was already released.
+        """
+        return self._registry.release(self)
+
+
+class SessionRegistry:
+    """
+    Reference-counted registry of opened controller sessions.
+
+    Every `acquire` for the same configuration returns a lease on the same
+    controller, so the Nanolib accessor is created and the bus is opened and
+    scanned only once per process. Once the devices are found, the
+    telemetry poller is started unless the controller's
+    ``telemetry_autostart`` is False, so `status` answers from its snapshot
+    instead of reading the bus. When the last lease is released the
+    telemetry poller is stopped, the devices are disconnected and the bus
+    hardware is closed.
+
+    While a session is open the registry holds an exclusive ``flock`` on a
+    lock file named after the bus hardware specifier (the serial port), so
+    a second process trying to open the same port, from any install of the
+    package, fails with `SessionBusyError` instead of colliding on it. If
+    the lock file cannot be created, the session is opened without the
+    inter-process lock and a warning is logged.
+    """
+
+    def __init__(self, lock_dir=None, lock_timeout=5.0):
+        """
+        Parameters
+        ----------
+        lock_dir : str, optional
+            Directory of the bus lock files. If None, ``locks`` in the
+            user cache directory is used.
+        lock_timeout : float, optional
+            Seconds to wait for another process to release the bus.
+        """
+        self.logger = AdcLogger(__file__)
+        self.lock_dir = lock_dir if lock_dir is not None else _get_default_lock_dir()
+        self.lock_timeout = lock_timeout
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def acquire(self, factory, config=None) -> SessionLease:
+        """
+        Lease the session of a configuration, opening it on first use.
+
+        Parameters
+        ----------
+        factory : callable
+            Called as ``factory()`` (or ``factory(config)`` when `config` is
+            given) to build the controller of a new session, normally
+            `AdcController`.
+        config : str, optional
+            Controller configuration path; sessions are shared per path.
+
+        Returns
+        -------
+        SessionLease
+            A lease whose ``controller`` has its devices found and, by
+            default, its telemetry poller running.
+
+        Raises
+        ------
+        SessionBusyError
+            If another process holds the bus.
+        Exception
+            Whatever `find_devices` raises; no session is kept in that case.
+        """
+        key = os.path.abspath(config) if config is not None else "default"
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._open(key, factory, config)
+                self._sessions[key] = session
+            session.refs += 1
+            self.logger.debug(f"Session {key} leased ({session.refs} users).")
+            return SessionLease(self, session)
+
+    def _open(self, key, factory, config):
+        controller = factory() if config is None else factory(config)
+        held = {}  # hardware specifier -> lock file
+
+        def _before_open(hardware_specifier):
+            # cache 검증 실패 후 재scan으로 다른 port가 선택되면 lock을 옮김
+            if hardware_specifier in held:
+                return
+            for lock_file in held.values():
+                self._unlock_bus(lock_file)
+            held.clear()
+            held[hardware_specifier] = self._lock_bus(hardware_specifier)
+
+        try:
+            controller.find_devices(before_open=_before_open)
+            if controller.telemetry_autostart:
+                controller.start_telemetry()
+        except Exception:
+            for lock_file in held.values():
+                self._unlock_bus(lock_file)
+            raise
+        port, lock_file = next(iter(held.items()), (None, None))
+        self.logger.info(f"Session {key} opened on bus {port}.")
+        return _Session(key, controller, lock_file)
+
+    def release(self, lease) -> bool:
+        """
+        Release a lease; see `SessionLease.release`.
+        """
+        with self._lock:
+            if lease.released:
+                self.logger.error(f"Session lease {lease.key} already released.")
+                raise RuntimeError(f"Session lease {lease.key} already released.")
+            lease.released = True
+            session = lease._session
+            session.refs -= 1
+            if session.refs > 0:
+                self.logger.debug(
+                    f"Session {session.key} released ({session.refs} users left)."
+                )
+                return False
+            # 마지막 사용자: bus를 닫고, 실패하더라도 session은 정리
+            try:
+                self._close(session.controller)
+            finally:
+                del self._sessions[session.key]
+                self._unlock_bus(session.lock_file)
+            self.logger.info(f"Session {session.key} closed.")
+            return True
+
+    @staticmethod
+    def _close(controller):
+        controller.stop_telemetry()
+        controller.disconnect()
+        controller.close()
+
+    def _lock_bus(self, hardware_specifier):
+        if fcntl is None:
+            return None
+        path = os.path.join(self.lock_dir, _lock_name(hardware_specifier))
+        try:
+            os.makedirs(self.lock_dir, exist_ok=True)
+            lock_file = open(path, "a")
+        except OSError as e:
+            self.logger.warning(
+                f"Cannot create bus lock file {path} ({e}); "
+                "opening the bus without the inter-process lock."
+            )
+            return None
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return lock_file
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    lock_file.close()
+                    self.logger.error(
+                        f"Bus {hardware_specifier} is in use by another process."
+                    )
+                    raise SessionBusyError(
+                        f"Bus {hardware_specifier} is in use by another process ({path})."
+                    )
+                time.sleep(0.05)
+
+    @staticmethod
+    def _unlock_bus(lock_file):
+        if lock_file is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+
+def get_session_registry() -> SessionRegistry:
+    """
+    Return the process-wide session registry, creating it on first use.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SessionRegistry()
+        return _registry
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_telemetry.py
+
+import threading
+import time
+from collections import namedtuple
+
+from .adc_logger import AdcLogger
+
+__all__ = ["MotorTelemetry", "TelemetryPoller"]
+
+MotorTelemetry = namedtuple(
+    "MotorTelemetry", ["timestamp", "position_state", "statusword", "connection_state"]
+)
+MotorTelemetry.__doc__ = """
+One telemetry sample of a motor; `timestamp` is ``time.monotonic()`` at the
+end of the read.
+"""
+
+
+class TelemetryPoller:
+    """
+    Background thread reading the state of the motors at a fixed rate.
+
+    The latest sample of every motor is kept in a snapshot dictionary that is
+    replaced as a whole on each update, so readers never see a partially
+    written state and need no lock.
+    """
+
+    def __init__(self, read_fn, motors=(1, 2), interval=0.2):
+        """
+        Parameters
+        ----------
+        read_fn : callable
+            Called as ``read_fn(motor_id)`` in the poller thread; returns
+            ``(position_state, statusword, connection_state)`` or raises.
+        motors : sequence of int, optional
+            The motors to poll.
+        interval : float, optional
+            Polling period in seconds.
+
+        Raises
+        ------
+        ValueError
+            If `interval` is not positive.
+        """
+        self.logger = AdcLogger(__file__)
+        if interval <= 0:
+            self.logger.error(f"Invalid telemetry interval: {interval}")
+            raise ValueError(f"Telemetry interval must be positive, got {interval}.")
+        self._read_fn = read_fn
+        self.motors = tuple(motors)
+        self.interval = interval
+        self._snapshot = {}
+        self._generation = dict.fromkeys(self.motors, 0)
+        self._lock = threading.Lock()  # snapshot 교체와 invalidate 사이 경합 방지
+        self._stop = threading.Event()
+        self._thread = None
+        self.cycles = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Start the poller thread; does nothing if it is already running.
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="adc-telemetry", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Telemetry poller started (interval={self.interval} s).")
+
+    def stop(self, timeout=None):
+        """
+        Stop the poller thread and wait for it to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            self.logger.info("Telemetry poller stopped.")
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.poll_once()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def poll_once(self):
+        """
+        Read every motor once and publish the samples.
+
+        A motor whose read fails is dropped from the snapshot, so queries for
+        it fall back to a live read.
+        """
+        for motor in self.motors:
+            generation = self._generation[motor]
+            try:
+                position, statusword, connection = self._read_fn(motor)
+                sample = MotorTelemetry(
+                    time.monotonic(), position, statusword, connection
+                )
+            except Exception as e:
+                self.logger.debug(f"Telemetry read failed for motor {motor}: {e}")
+                sample = None
+            with self._lock:
+                # 읽는 도중 invalidate 되었다면 오래된 값을 올리지 않음
+                if self._generation[motor] != generation:
+                    continue
+                snapshot = dict(self._snapshot)
+                if sample is None:
+                    snapshot.pop(motor, None)
+                else:
+                    snapshot[motor] = sample
+                self._snapshot = snapshot
+        self.cycles += 1
+
+    def get(self, motor_id, max_staleness=None):
+        """
+        Return the latest sample of a motor.
+
+        Parameters
+        ----------
+        motor_id : int
+            The identifier of the motor.
+        max_staleness : float, optional
+            Maximum age (seconds) of an acceptable sample. If None, any age
+            is accepted.
+
+        Returns
+        -------
+        MotorTelemetry or None
+            The sample, or None if there is none or it is too old.
+        """
+        sample = self._snapshot.get(motor_id)
+        if sample is None:
+            return None
+        if max_staleness is not None and time.monotonic() - sample.timestamp > (
+            max_staleness
+        ):
+            return None
+        return sample
+
+    def invalidate(self, motor_id=0):
+        """
+        Drop the sample of a motor (0 for all motors), e.g. after it moved.
+        """
+        motors = [motor_id] if motor_id in self.motors else list(self.motors)
+        with self._lock:
+            snapshot = dict(self._snapshot)
+            for motor in motors:
+                self._generation[motor] += 1
+                snapshot.pop(motor, None)
+            self._snapshot = snapshot
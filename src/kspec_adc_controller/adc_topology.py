@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-16
+# @Filename: adc_topology.py
+
+import json
+import os
+
+from .adc_cache import get_cache_dir
+
+__all__ = ["TopologyCache"]
+
+_BUS_KEYS = ("bus_hardware", "protocol", "hardware_specifier", "name")
+
+
+def _get_default_topology_path() -> str:
+    """
+    Returns the default device-topology cache path in the user cache directory.
+    """
+    return os.path.join(get_cache_dir(), "topology.json")
+
+
+class TopologyCache:
+    """
+    Persistent record of the selected bus hardware and the devices found on it.
+
+    The cache stores plain values (bus hardware spec, device IDs and
+    descriptions) so that the controller can rebuild the Nanolib IDs and
+    add the devices without listing the bus hardware or scanning the bus.
+
+    Attributes
+    ----------
+    path : str
+        JSON file the topology is stored in.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Parameters
+        ----------
+        path : str, optional
+            Path of the JSON cache file. If None, a default path is used.
+        """
+        if path is None:
+            path = _get_default_topology_path()
+        self.path = path
+
+    def load(self, selected_bus_index):
+        """
+        Load the cached topology of a bus.
+
+        Parameters
+        ----------
+        selected_bus_index : int
+            Bus index of the current configuration; a cache written for
+            another index is ignored.
+
+        Returns
+        -------
+        dict or None
+            ``{"bus": {...}, "devices": [{"device_id", "description"}, ...]}``,
+            or None if there is no usable cache.
+        """
+        if not os.path.isfile(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["selected_bus_index"] != selected_bus_index:
+                return None
+            bus = {key: str(data["bus"][key]) for key in _BUS_KEYS}
+            devices = [
+                {"device_id": int(d["device_id"]), "description": str(d["description"])}
+                for d in data["devices"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not devices:
+            return None
+        return {"bus": bus, "devices": devices}
+
+    def save(self, selected_bus_index, bus, devices):
+        """
+        Write the topology, replacing the file atomically.
+
+        Parameters
+        ----------
+        selected_bus_index : int
+            Bus index of the current configuration.
+        bus : dict
+            Bus hardware spec with the keys bus_hardware, protocol,
+            hardware_specifier and name.
+        devices : list of dict
+            Devices in handle order, each with device_id and description.
+        """
+        data = {
+            "selected_bus_index": selected_bus_index,
+            "bus": {key: bus[key] for key in _BUS_KEYS},
+            "devices": [
+                {"device_id": d["device_id"], "description": d["description"]}
+                for d in devices
+            ],
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """
+        Remove the cache file, if any.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
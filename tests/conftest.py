@@ -83,3 +83,9 @@ def reset_adc_logger_registry():
     AdcLogger._initialized_loggers.clear()
     yield
     AdcLogger._initialized_loggers.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    # 기본 cache 경로(topology, motion model, interpolant)를 테스트마다 tmp로
+    monkeypatch.setenv("KSPEC_ADC_CACHE_DIR", str(tmp_path / "adc_cache"))
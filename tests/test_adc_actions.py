@@ -1,6 +1,8 @@
 import asyncio
 import importlib
+import time
 
+import numpy as np
 import pytest
 
 
@@ -24,17 +26,59 @@ class DummyLogger:
         self.errors.append(msg)
 
 
+class FakeBus:
+    """BusExecutor.run 대역: 같은 thread에서 바로 실행"""
+
+    def __init__(self):
+        self.run_calls = []
+
+    async def run(self, fn, *args, **kwargs):
+        self.run_calls.append(fn.__name__)
+        return fn(*args, **kwargs)
+
+
+class FakeStream:
+    """SetpointStream 대역: push된 target을 controller에 기록"""
+
+    def __init__(self, controller, motor_id, vel):
+        self.controller = controller
+        self.motor_id = motor_id
+        self.vel = vel
+
+    async def push(self, target):
+        if self.motor_id in self.controller.push_raises_for:
+            raise RuntimeError(f"push fail {self.motor_id}")
+        self.controller.setpoint_calls.append((self.motor_id, target, self.vel))
+        return {"target": target, "skipped": False}
+
+    async def close(self, settle=True):
+        self.controller.stream_closes.append((self.motor_id, settle))
+        if settle and self.controller.settle_raises:
+            raise self.controller.settle_raises
+
+
 class FakeController:
     def __init__(self, logger):
         self.logger = logger
+        self.bus = FakeBus()
 
         self.find_devices_called = 0
         self.connect_called = 0
         self.disconnect_called = 0
         self.close_called = 0
+        self.start_telemetry_called = 0
+        self.stop_telemetry_called = 0
+        self.telemetry_autostart = True
 
         self.device_state_called = []
         self.move_motor_calls = []
+        self.home_position = True
+        self.zero_positions = {1: 0, 2: 0}
+        self.move_to_calls = []
+        self.setpoint_calls = []
+        self.stream_closes = []
+        self.push_raises_for = set()
+        self.settle_raises = None
         self.stop_motor_calls = []
 
         self.homing_calls = []
@@ -56,8 +100,10 @@ class FakeController:
         self.parking_raises = None
         self.zeroing_raises = None
 
-    def find_devices(self):
+    def find_devices(self, before_open=None):
         self.find_devices_called += 1
+        if before_open is not None:
+            before_open("/dev/ttyFAKE")
         if self.find_devices_raises:
             raise self.find_devices_raises
 
@@ -76,6 +122,15 @@ class FakeController:
         if self.close_raises:
             raise self.close_raises
 
+    def start_telemetry(self):
+        self.start_telemetry_called += 1
+
+    def stop_telemetry(self):
+        self.stop_telemetry_called += 1
+
+    def zero_position(self, motor_id):
+        return self.zero_positions[motor_id]
+
     def device_state(self, motor_num):
         self.device_state_called.append(motor_num)
         if self.device_state_raises:
@@ -100,12 +155,34 @@ class FakeController:
         self.move_motor_calls.append((motor_id, pos, vel))
         return {"motor_id": motor_id, "pos": pos, "vel": vel}
 
-    def stop_motor(self, motor_id):
+    async def move(self, motor_id, pos, vel):
+        return self.move_motor(motor_id, pos, vel)
+
+    def setpoint_stream(self, motor_id, vel):
+        return FakeStream(self, motor_id, vel)
+
+    async def move_to(self, motor_id, target, vel):
+        self.move_to_calls.append((motor_id, target, vel))
+        return {"motor_id": motor_id, "target": target, "skipped": False}
+
+    def stop_motor(self, motor_id, requested_at=None):
+        self.stop_requested_at = requested_at
         if motor_id in self.stop_motor_raises_for:
             raise RuntimeError(f"stop fail motor {motor_id}")
         self.stop_motor_calls.append(motor_id)
         return {"motor_id": motor_id, "stopped": True}
 
+    def predict_move_time(self, motor_id, distance, vel):
+        return abs(distance) / (100.0 * vel) + motor_id
+
+    def predict_parking_time(self, vel):
+        if self.parking_raises:
+            raise self.parking_raises
+        return {1: 1.5, 2: 2.5}
+
+    def predict_zeroing_time(self, vel):
+        return {1: 4.0, 2: 3.0}
+
     async def homing(self, vel):
         if self.homing_raises:
             raise self.homing_raises
@@ -131,6 +208,9 @@ class FakeCalc:
         # failure injection
         self.calc_from_za_raises = None
         self.degree_to_count_raises = None
+        self.za_from_counts_raises = None
+        self.za_min = 0.0
+        self.za_max = 60.0
 
     def calc_from_za(self, za):
         if self.calc_from_za_raises:
@@ -144,15 +224,35 @@ class FakeCalc:
         self.degree_to_count_calls.append(degree)
         return 100  # counts
 
+    def za_from_counts(self, counts):
+        if self.za_from_counts_raises:
+            raise self.za_from_counts_raises
+        # -200 counts -> 20 deg; anything beyond 4000 counts is out of range
+        return counts / -10.0 if abs(counts) <= 4000 else float("nan")
+
+    def za_to_counts(self, za, dtype="int64", rounding="trunc"):
+        if self.calc_from_za_raises:
+            raise self.calc_from_za_raises
+        za = np.asarray(za, dtype=float)
+        if za.ndim == 2:
+            return za[:, 0], np.full(len(za), 100, dtype=dtype)
+        return None, np.full(len(za), 100, dtype=dtype)
+
 
 @pytest.fixture
-def actions_module(monkeypatch):
+def actions_module(monkeypatch, tmp_path):
     """
     AdcActions 모듈 import 후, 내부에서 참조하는 AdcLogger/AdcController/ADCCalc를 fake로 교체.
     """
     mod = importlib.import_module("kspec_adc_controller.adc_actions")
     mod = importlib.reload(mod)
 
+    # test마다 새 session registry (bus lock 파일은 tmp_path에)
+    session_mod = importlib.import_module("kspec_adc_controller.adc_session")
+    monkeypatch.setattr(session_mod, "AdcLogger", lambda *_a, **_kw: DummyLogger())
+    registry = session_mod.SessionRegistry(lock_dir=str(tmp_path))
+    monkeypatch.setattr(mod, "get_session_registry", lambda: registry)
+
     # ✅ AdcActions는 AdcLogger(__file__) 를 부르므로 그대로 DummyLogger 반환
     monkeypatch.setattr(mod, "AdcLogger", lambda *_args, **_kwargs: DummyLogger())
 
@@ -196,6 +296,8 @@ def test_init_creates_controller_and_calls_find_devices(actions):
     assert isinstance(actions.calculator, FakeCalc)
 
     assert actions.controller.find_devices_called == 1
+    # status가 bus 대신 snapshot으로 답하도록 poller를 시작
+    assert actions.controller.start_telemetry_called == 1
     assert any("Initializing AdcActions class" in m for m in actions.logger.debugs)
 
 
@@ -246,6 +348,59 @@ def test_status_success(actions):
     assert "Motor 2 status retrieved" in res["message"]
 
 
+def test_status_reports_effective_za(actions):
+    res = actions.status(0)
+    assert res["effective_za"] == {"motor1": 20.0, "motor2": 20.0}
+
+
+def test_status_effective_za_out_of_range_or_failing(actions, monkeypatch):
+    monkeypatch.setattr(
+        actions.controller,
+        "device_state",
+        lambda n: {
+            "motor1": {"position_state": 999999, "connection_state": True},
+            "motor2": {"position_state": 200, "connection_state": True},
+        },
+    )
+    res = actions.status(0)
+    assert res["status"] == "success"
+    assert res["effective_za"] == {"motor1": None, "motor2": 20.0}
+
+    actions.calculator.za_from_counts_raises = RuntimeError("no map")
+    res = actions.status(0)
+    assert res["status"] == "success"
+    assert res["effective_za"] == {"motor1": None, "motor2": None}
+    assert any("Cannot compute effective ZA" in m for m in actions.logger.warnings)
+
+
+def test_status_effective_za_unwraps_and_uses_zero_reference(actions, monkeypatch):
+    # activate된 위치 -200은 unsigned 0x6064로 2**32 - 200으로 읽힘
+    monkeypatch.setattr(
+        actions.controller,
+        "device_state",
+        lambda n: {
+            "motor1": {"position_state": 2**32 - 200, "connection_state": True},
+            "motor2": {"position_state": 7435, "connection_state": True},
+        },
+    )
+    actions.controller.zero_positions = {1: 0, 2: 7635}
+    res = actions.status(0)
+    # 두 motor 모두 zero 기준 -200 counts (FakeCalc: za = counts / -10)
+    assert res["effective_za"] == {"motor1": -20.0, "motor2": -20.0}
+
+
+def test_status_effective_za_without_homing(actions, monkeypatch):
+    def _no_zero(motor_id):
+        raise AssertionError("zero_position must not be called before homing")
+
+    actions.controller.home_position = False
+    monkeypatch.setattr(actions.controller, "zero_position", _no_zero)
+    res = actions.status(0)
+    assert res["status"] == "success"
+    assert res["effective_za"] == {"motor1": None, "motor2": None}
+    assert actions.logger.warnings == [] and actions.logger.errors == []
+
+
 def test_status_error(actions):
     actions.controller.device_state_raises = ValueError("bad")
     res = actions.status(1)
@@ -328,6 +483,7 @@ async def test_stop_both(actions):
 
     assert actions.controller.stop_motor_calls.count(1) == 1
     assert actions.controller.stop_motor_calls.count(2) == 1
+    assert actions.controller.bus.run_calls == ["stop_motor", "stop_motor"]
     assert res["status"] == "success"
     assert "Both motors stopped successfully" in res["message"]
 
@@ -346,6 +502,7 @@ async def test_stop_single(actions):
     res = await actions.stop(2)
 
     assert actions.controller.stop_motor_calls[-1] == 2
+    assert actions.controller.stop_requested_at <= time.monotonic()
     assert res["status"] == "success"
     assert "Motor 2 stopped successfully" in res["message"]
 
@@ -381,6 +538,26 @@ async def test_activate_caps_velocity_and_uses_calculator(actions):
     assert any("exceeds the limit of 5 RPM" in m for m in actions.logger.warnings)
 
 
+@pytest.mark.asyncio
+async def test_activate_takes_shortest_rotation(actions):
+    actions.calculator.degree_to_count = lambda ang: 9000  # 반 바퀴 이상
+
+    res = await actions.activate(za=12.3, vel_set=1)
+
+    assert res["status"] == "success"
+    assert (1, 16200 - 9000, 1) in actions.controller.move_motor_calls
+    assert (2, 16200 - 9000, 1) in actions.controller.move_motor_calls
+
+
+@pytest.mark.asyncio
+async def test_activate_absolute_uses_move_to(actions):
+    res = await actions.activate(za=12.3, vel_set=2, absolute=True)
+
+    assert res["status"] == "success"
+    assert actions.controller.move_to_calls == [(1, -100, 2), (2, -100, 2)]
+    assert actions.controller.move_motor_calls == []
+
+
 @pytest.mark.asyncio
 async def test_activate_negative_velocity_sets_default_1(actions):
     res = await actions.activate(za=1.0, vel_set=-3)
@@ -525,11 +702,42 @@ def test_disconnect_error(actions):
 
 def test_power_off_success(actions):
     res = actions.power_off()
+    assert actions.controller.stop_telemetry_called == 1
     assert actions.controller.disconnect_called == 1
     assert actions.controller.close_called == 1
     assert res["status"] == "success"
 
 
+def test_instances_share_one_session(actions_module):
+    first = actions_module.AdcActions()
+    second = actions_module.AdcActions()
+
+    assert second.controller is first.controller
+    assert first.controller.find_devices_called == 1
+    assert first.controller.start_telemetry_called == 1
+
+    res = first.power_off()
+    assert res["status"] == "success"
+    assert "still used by 1 users" in res["message"]
+    assert first.controller.close_called == 0
+
+    res = second.power_off()
+    assert res["status"] == "success"
+    assert first.controller.close_called == 1
+
+    # 마지막 사용자가 떠난 뒤에는 새 session을 열어야 함
+    third = actions_module.AdcActions()
+    assert third.controller is not first.controller
+
+
+def test_power_off_twice_returns_error(actions):
+    assert actions.power_off()["status"] == "success"
+    res = actions.power_off()
+    assert res["status"] == "error"
+    assert "already released" in res["message"]
+    assert actions.controller.close_called == 1
+
+
 def test_power_off_disconnect_raises(actions):
     actions.controller.disconnect_raises = RuntimeError("disc fail")
     res = actions.power_off()
@@ -571,3 +779,295 @@ def test_degree_to_count_error(actions):
     res = actions.degree_to_count(180.0)
     assert res["status"] == "error"
     assert "deg fail" in res["message"]
+
+
+def test_calc_trajectory_success_uses_activate_sign(actions):
+    res = actions.calc_trajectory(np.array([1.0, 2.0, 3.0]))
+    assert res["status"] == "success"
+    assert res["time"] is None
+    assert res["motor_1"].tolist() == [-100, -100, -100]
+    assert res["motor_2"].tolist() == [-100, -100, -100]
+
+
+def test_calc_trajectory_time_pairs(actions):
+    res = actions.calc_trajectory(np.array([[10.0, 1.0], [20.0, 2.0]]), dtype="int32")
+    assert res["status"] == "success"
+    assert res["time"].tolist() == [10.0, 20.0]
+    assert res["motor_1"].dtype == np.int32
+
+
+def test_calc_trajectory_error(actions):
+    actions.calculator.calc_from_za_raises = ValueError("out of bounds")
+    res = actions.calc_trajectory(np.array([100.0]))
+    assert res["status"] == "error"
+    assert "out of bounds" in res["message"]
+
+
+def test_calc_schedule_skips_samples_out_of_range(actions):
+    # 적도 위 관측자, 적경 0 천체: LST 0h 부근에서 천정을 지남
+    utc = np.datetime64("2026-03-20T12:00:00") + np.arange(0, 24 * 3600, 3600).astype(
+        "timedelta64[s]"
+    )
+    res = actions.calc_schedule(0.0, 0.0, 0.0, 0.0, utc)
+
+    assert res["status"] == "success"
+    assert 0 < len(res["time"]) < len(utc)
+    assert np.all(res["za"] <= 60.0)
+    assert res["motor_1"].tolist() == [-100] * len(res["time"])
+    assert "of 24 samples" in res["message"]
+
+
+def test_calc_schedule_error(actions):
+    actions.calculator.calc_from_za_raises = ValueError("boom")
+    res = actions.calc_schedule(0.0, 0.0, 0.0, 0.0, np.array([1.7e9]))
+    assert res["status"] == "error"
+    assert "boom" in res["message"]
+
+
+# -------------------------
+# track() coverage
+# -------------------------
+@pytest.fixture
+def tracking_actions(actions, monkeypatch):
+    # target 위치 = -int(za) 가 되도록 calculator 단순화
+    monkeypatch.setattr(actions.calculator, "calc_from_za", lambda za: za)
+    monkeypatch.setattr(actions.calculator, "degree_to_count", lambda deg: int(deg))
+    return actions
+
+
+async def _aiter(values):
+    for v in values:
+        yield v
+
+
+@pytest.mark.asyncio
+async def test_track_moves_only_outside_deadband(tracking_actions):
+    actions = tracking_actions
+    # 시작 위치 200 (FakeController)
+    res = await actions.track(_aiter([-200, -201, -202, -205, -205.5]), deadband=2)
+
+    assert res["status"] == "success"
+    assert (res["samples"], res["moves"], res["skipped"]) == (5, 1, 0)
+    assert res["max_residual"] == 2
+    assert actions.controller.move_motor_calls == [(1, 5, 1), (2, 5, 1)]
+
+
+@pytest.mark.asyncio
+async def test_track_unwraps_negative_start_position(tracking_actions, monkeypatch):
+    actions = tracking_actions
+    # -900에서 시작: unsigned 0x6064로는 2**32 - 900
+    wrapped = {"position_state": 2**32 - 900, "connection_state": True}
+    monkeypatch.setattr(
+        actions.controller,
+        "device_state",
+        lambda n: {"motor1": dict(wrapped), "motor2": dict(wrapped)},
+    )
+
+    res = await actions.track(_aiter([900, 901, 905]), deadband=2)
+
+    assert res["status"] == "success"
+    assert (res["samples"], res["moves"]) == (3, 1)
+    assert res["max_residual"] == 1
+    assert actions.controller.move_motor_calls == [(1, -5, 1), (2, -5, 1)]
+
+
+@pytest.mark.asyncio
+async def test_track_measures_from_zero_reference(tracking_actions):
+    actions = tracking_actions
+    # drive 위치 200, zero reference 1000 → zero 기준 -800
+    actions.controller.zero_positions = {1: 1000, 2: 1000}
+
+    res = await actions.track(_aiter([800, 805]), deadband=2)
+
+    assert res["status"] == "success"
+    assert (res["samples"], res["moves"]) == (2, 1)
+    assert actions.controller.move_motor_calls == [(1, -5, 1), (2, -5, 1)]
+
+
+@pytest.mark.asyncio
+async def test_track_requires_homing(tracking_actions, monkeypatch):
+    actions = tracking_actions
+
+    def _no_zero(motor_id):
+        raise Exception("requires a completed homing")
+
+    monkeypatch.setattr(actions.controller, "zero_position", _no_zero)
+    res = await actions.track(_aiter([800]), deadband=2)
+
+    assert res["status"] == "error"
+    assert "homing" in res["message"]
+    assert actions.controller.move_motor_calls == []
+
+
+@pytest.mark.asyncio
+async def test_track_streaming_pushes_setpoints(tracking_actions):
+    actions = tracking_actions
+    res = await actions.track(
+        _aiter([-200, -205, -209, -209.5]), deadband=2, vel_set=3, streaming=True
+    )
+
+    assert res["status"] == "success"
+    assert (res["samples"], res["moves"]) == (4, 2)
+    assert actions.controller.setpoint_calls == [
+        (1, 205, 3),
+        (2, 205, 3),
+        (1, 209, 3),
+        (2, 209, 3),
+    ]
+    assert actions.controller.move_motor_calls == []
+    # 끝나면 마지막 set-point 도달까지 기다린 뒤 stream을 닫음
+    assert actions.controller.stream_closes == [(1, True), (2, True)]
+
+
+@pytest.mark.asyncio
+async def test_track_streaming_abort_closes_streams(tracking_actions):
+    actions = tracking_actions
+    actions.controller.push_raises_for = {2}
+
+    res = await actions.track(_aiter([-200, -205]), deadband=2, streaming=True)
+
+    assert res["status"] == "error"
+    assert "push fail 2" in res["message"]
+    assert actions.controller.stream_closes == [(1, False), (2, False)]
+
+
+@pytest.mark.asyncio
+async def test_track_streaming_settle_failure(tracking_actions):
+    actions = tracking_actions
+    actions.controller.settle_raises = RuntimeError("settle timeout")
+
+    res = await actions.track(_aiter([-200, -205]), deadband=2, streaming=True)
+
+    assert res["status"] == "error"
+    assert "settle timeout" in res["message"]
+    assert res["moves"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_during_startup_is_kept(tracking_actions, monkeypatch):
+    actions = tracking_actions
+    device_state = actions.controller.device_state
+
+    def _stop_while_reading(n):
+        actions.stop_tracking()  # 위치 읽는 중에 도착한 stop
+        return device_state(n)
+
+    monkeypatch.setattr(actions.controller, "device_state", _stop_while_reading)
+    res = await actions.track(lambda: -205, interval=30)
+
+    assert res["status"] == "success"
+    assert res["samples"] == 0
+    assert actions.controller.move_motor_calls == []
+
+
+@pytest.mark.asyncio
+async def test_track_callable_source_with_max_samples(tracking_actions):
+    actions = tracking_actions
+    calls = []
+
+    def source():
+        calls.append(1)
+        return -210
+
+    res = await actions.track(source, deadband=1, interval=0, vel_set=9, max_samples=3)
+
+    assert res["status"] == "success"
+    assert len(calls) == 3
+    assert res["moves"] == 1
+    assert actions.controller.move_motor_calls == [(1, 10, 5), (2, 10, 5)]
+
+
+@pytest.mark.asyncio
+async def test_track_async_callable_ends_on_none(tracking_actions):
+    values = iter([-200, -230, None])
+
+    async def source():
+        return next(values)
+
+    res = await tracking_actions.track(source, interval=0)
+    assert res["status"] == "success"
+    assert (res["samples"], res["moves"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_stop_tracking_ends_polling_loop(tracking_actions):
+    actions = tracking_actions
+    task = asyncio.create_task(actions.track(lambda: -200, interval=30))
+    await asyncio.sleep(0.01)
+    actions.stop_tracking()
+
+    res = await asyncio.wait_for(task, timeout=1)
+    assert res["status"] == "success"
+    assert res["samples"] == 1
+
+
+@pytest.mark.asyncio
+async def test_track_skips_failed_calculation(tracking_actions, monkeypatch):
+    actions = tracking_actions
+
+    def calc(za):
+        if za > 90:
+            raise ValueError("out of bounds")
+        return za
+
+    monkeypatch.setattr(actions.calculator, "calc_from_za", calc)
+    res = await actions.track(_aiter([100, -200]))
+
+    assert res["status"] == "success"
+    assert (res["samples"], res["skipped"], res["moves"]) == (2, 1, 0)
+    assert any("Skipping tracking sample" in m for m in actions.logger.warnings)
+
+
+@pytest.mark.asyncio
+async def test_track_move_failure_aborts(tracking_actions):
+    actions = tracking_actions
+    actions.controller.move_motor_raises_for.add(2)
+
+    res = await actions.track(_aiter([-300, -400]))
+    assert res["status"] == "error"
+    assert "Motor 2 failed" in res["message"]
+    assert res["samples"] == 1
+
+
+@pytest.mark.asyncio
+async def test_track_position_read_failure(tracking_actions):
+    tracking_actions.controller.device_state_raises = RuntimeError("bus down")
+    res = await tracking_actions.track(_aiter([-200]))
+    assert res["status"] == "error"
+    assert "Failed to start tracking" in res["message"]
+
+
+@pytest.mark.asyncio
+async def test_track_invalid_deadband(tracking_actions):
+    res = await tracking_actions.track(_aiter([-200]), deadband=-1)
+    assert res["status"] == "error"
+
+
+# -------------------------
+# motion-time prediction
+# -------------------------
+def test_predict_activate_uses_slower_motor(actions):
+    res = actions.predict_activate(12.3, vel_set=1)
+
+    assert res["status"] == "success"
+    # |-100| / 100 + motor_id
+    assert (res["motor_1"], res["motor_2"]) == (2.0, 3.0)
+    assert res["duration"] == 3.0
+    assert actions.controller.move_motor_calls == []
+
+
+def test_predict_activate_error(actions):
+    actions.calculator.calc_from_za_raises = ValueError("out of bounds")
+    res = actions.predict_activate(99.0)
+    assert res["status"] == "error"
+    assert "out of bounds" in res["message"]
+
+
+def test_predict_parking_and_zeroing(actions):
+    assert actions.predict_parking()["duration"] == 2.5
+    assert actions.predict_zeroing(zeroing_vel=9)["duration"] == 4.0
+
+    actions.controller.parking_raises = Exception("homing first")
+    res = actions.predict_parking()
+    assert res["status"] == "error"
+    assert "homing first" in res["message"]
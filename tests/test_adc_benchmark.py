@@ -0,0 +1,114 @@
+import pytest
+
+from kspec_adc_controller import adc_benchmark
+
+
+class DummyLogger:
+    def info(self, msg):
+        pass
+
+    def debug(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def quiet_calc(monkeypatch):
+    import kspec_adc_controller.adc_calc_angle as mod
+
+    monkeypatch.setattr(mod, "AdcLogger", lambda *_a, **_kw: DummyLogger())
+
+
+def test_benchmark_grid_lookup_reports_both_paths():
+    res = adc_benchmark.benchmark_grid_lookup(grid_step=0.05, n_calls=200)
+
+    assert res["method"] == "pchip"
+    assert res["n_calls"] == 200
+    assert res["exact_us_per_call"] > 0
+    assert res["grid_us_per_call"] > 0
+    assert res["speedup"] > 0
+    assert res["grid_step"] <= 0.05
+    assert 0 <= res["grid_max_error"] < 1e-2
+
+
+def test_benchmark_startup_reports_cold_and_hot():
+    res = adc_benchmark.benchmark_startup(repeats=2)
+
+    assert res["repeats"] == 2
+    for key in ("cold_init_ms", "cold_interp_ms", "hot_init_ms", "hot_interp_ms"):
+        assert res[key] > 0
+
+
+def test_leave_one_out_reports_interior_errors():
+    res = adc_benchmark.leave_one_out(method="pchip")
+
+    assert len(res["error_deg"]) == len(res["za"])
+    assert res["max_abs_error_deg"] >= res["rms_error_deg"] >= 0
+    assert res["max_abs_error_counts"] == pytest.approx(res["max_abs_error_deg"] * 45)
+
+
+def test_run_suite_is_json_serializable():
+    import json
+
+    report = adc_benchmark.run_suite(
+        methods=["pchip", "chebyshev"], sizes=[1, 100], n_scalar=50
+    )
+    report = json.loads(json.dumps(report))
+
+    assert set(report["methods"]) == {"pchip", "chebyshev"}
+    batch = report["methods"]["pchip"]["batch"]
+    assert [b["size"] for b in batch] == [1, 100]
+    assert all(b["seconds"] > 0 and b["peak_memory_bytes"] >= 0 for b in batch)
+
+
+def test_compare_reports_flags_slowdowns_only():
+    def report(scalar, seconds):
+        return {
+            "methods": {
+                "pchip": {
+                    "scalar_us_per_call": scalar,
+                    "batch": [{"size": 10, "seconds": seconds}],
+                }
+            }
+        }
+
+    baseline = report(1.0, 1.0)
+    assert (
+        adc_benchmark.compare_reports(report(1.2, 0.5), baseline, tolerance=1.5) == []
+    )
+
+    regressions = adc_benchmark.compare_reports(
+        report(2.0, 2.0), baseline, tolerance=1.5
+    )
+    assert len(regressions) == 2
+    assert "scalar" in regressions[0] and "size 10" in regressions[1]
+
+
+def test_main_writes_report_and_detects_regression(tmp_path):
+    import json
+
+    out = tmp_path / "report.json"
+    argv = [
+        "--methods",
+        "pchip",
+        "--max-size",
+        "10",
+        "--scalar-calls",
+        "20",
+        "--output",
+        str(out),
+    ]
+    assert adc_benchmark.main(argv) == 0
+    report = json.loads(out.read_text())
+    assert [b["size"] for b in report["methods"]["pchip"]["batch"]] == [1, 10]
+
+    for b in report["methods"]["pchip"]["batch"]:
+        b["seconds"] = 1e-12
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    assert adc_benchmark.main(argv + ["--baseline", str(baseline)]) == 1
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kspec_adc_controller.adc_bus_executor import (
+    PRIORITY_MOTION,
+    PRIORITY_POLL,
+    PRIORITY_STOP,
+    BusExecutor,
+    SerializedAccessor,
+    get_bus_executor,
+)
+
+
+@pytest.fixture
+def bus():
+    bus = BusExecutor(name="test")
+    yield bus
+    bus.shutdown()
+
+
+class FakeAccessor:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.threads = set()
+        self.version = "1.0"
+
+    def readNumber(self, handle, index):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.001)
+        self.active -= 1
+        return (handle, index)
+
+
+def test_calls_from_many_threads_are_serialized(bus):
+    accessor = FakeAccessor()
+    proxy = SerializedAccessor(accessor, bus)
+
+    threads = [
+        threading.Thread(target=lambda h=h: [proxy.readNumber(h, i) for i in range(5)])
+        for h in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert accessor.max_active == 1
+    assert accessor.threads == {"adc-test-io"}
+    assert proxy.readNumber("H", 1) == ("H", 1)
+    assert proxy.version == "1.0"
+
+    m = bus.metrics()
+    assert m["submitted"] == m["completed"] == 21
+    assert m["max_queue_depth"] >= 1
+    assert m["max_service"] >= m["mean_service"] > 0
+    assert m["max_wait"] >= m["mean_wait"] >= 0
+
+
+def test_errors_propagate_and_are_counted(bus):
+    def fail():
+        raise RuntimeError("bus error")
+
+    with pytest.raises(RuntimeError, match="bus error"):
+        bus.call(fail)
+    assert bus.metrics()["failed"] == 1
+
+    bus.reset_metrics()
+    assert bus.metrics()["completed"] == 0
+
+
+def test_nested_call_on_worker_runs_inline(bus):
+    assert bus.call(lambda: bus.call(lambda: 42)) == 42
+
+
+@pytest.mark.asyncio
+async def test_async_call_and_run(bus):
+    assert await bus.call_async(lambda x: x + 1, 1) == 2
+
+    # run은 command pool에서 실행되고, 내부의 bus 호출은 worker로 감
+    def command(x):
+        assert threading.current_thread().name.startswith("adc-test-cmd")
+        return bus.call(lambda: x * 2)
+
+    results = await asyncio.gather(bus.run(command, 1), bus.run(command, 2))
+    assert results == [2, 4]
+
+
+def test_shutdown_rejects_new_calls():
+    bus = BusExecutor(name="closing")
+    bus.shutdown()
+    with pytest.raises(RuntimeError):
+        bus.call(lambda: None)
+
+
+def test_executor_is_shared_per_bus():
+    bus = get_bus_executor("shared-test")
+    try:
+        assert get_bus_executor("shared-test") is bus
+        assert get_bus_executor("other-test") is not bus
+    finally:
+        get_bus_executor("other-test").shutdown()
+        bus.shutdown()
+    assert get_bus_executor("shared-test") is not bus
+    get_bus_executor("shared-test").shutdown()
+
+
+def test_queued_calls_are_served_by_priority(bus):
+    gate = threading.Event()
+    order = []
+
+    # worker를 막아 둔 상태에서 poll -> motion -> stop 순서로 queue에 넣음
+    blocker = bus.submit(gate.wait)
+    futures = []
+    for level, name in (
+        (PRIORITY_POLL, "poll1"),
+        (PRIORITY_MOTION, "motion"),
+        (PRIORITY_POLL, "poll2"),
+        (PRIORITY_STOP, "stop"),
+    ):
+        with bus.priority(level):
+            futures.append(bus.submit(order.append, name))
+    gate.set()
+    for f in [blocker, *futures]:
+        f.result(timeout=2)
+
+    assert order == ["stop", "motion", "poll1", "poll2"]
+    by_priority = bus.metrics()["by_priority"]
+    assert by_priority["stop"]["completed"] == 1
+    assert by_priority["poll"]["completed"] == 2
+    assert by_priority["poll"]["max_wait"] >= by_priority["stop"]["max_wait"]
+
+
+def test_method_wrappers_are_cached(bus, monkeypatch):
+    accessor = FakeAccessor()
+    proxy = SerializedAccessor(accessor, bus)
+
+    read = proxy.readNumber
+    lookups = []
+    original = SerializedAccessor.__getattr__
+    monkeypatch.setattr(
+        SerializedAccessor,
+        "__getattr__",
+        lambda self, name: lookups.append(name) or original(self, name),
+    )
+    assert proxy.readNumber is read
+    assert read("H", 1) == ("H", 1)
+    assert proxy.version == "1.0"
+    assert lookups == ["version"]
+
+
+@pytest.mark.asyncio
+async def test_run_carries_priority_to_command_pool(bus):
+    accessor = FakeAccessor()
+    proxy = SerializedAccessor(accessor, bus)
+
+    with bus.priority(PRIORITY_STOP):
+        await bus.run(proxy.readNumber, "H", 1)
+    assert bus.metrics()["by_priority"]["stop"]["completed"] == 1
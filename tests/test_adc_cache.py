@@ -0,0 +1,24 @@
+import os
+
+from kspec_adc_controller.adc_cache import get_cache_dir
+
+
+def test_cache_dir_env_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("KSPEC_ADC_CACHE_DIR", str(tmp_path / "adc"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert get_cache_dir() == str(tmp_path / "adc")
+
+
+def test_cache_dir_xdg(monkeypatch, tmp_path):
+    monkeypatch.delenv("KSPEC_ADC_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == str(tmp_path / "kspec_adc_controller")
+
+
+def test_cache_dir_home_fallback(monkeypatch, tmp_path):
+    monkeypatch.delenv("KSPEC_ADC_CACHE_DIR", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert get_cache_dir() == os.path.join(
+        str(tmp_path), ".cache", "kspec_adc_controller"
+    )
@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from kspec_adc_controller.adc_calc_angle import ADCCalc
+from kspec_adc_controller.adc_calc_angle import ADCCalc, degrees_to_counts
 
 
 class DummyLogger:
@@ -210,3 +210,569 @@ def test_degree_to_count_non_numeric_raises_type_error(logger, lookup_csv, adc_f
 
     with pytest.raises(TypeError):
         adc.degree_to_count("90")
+
+
+# -------------------------
+# grid mode
+# -------------------------
+def test_grid_mode_disabled_by_default(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    assert adc.grid_step is None
+    assert adc.grid_max_error is None
+
+
+def test_grid_mode_scalar_and_array_match_linear_table(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip", grid_step=0.5)
+
+    assert adc.grid_step == pytest.approx(0.5)
+    assert adc.calc_from_za(15.25) == pytest.approx(30.5, abs=1e-9)
+    assert adc.calc_from_za(30) == pytest.approx(60.0, abs=1e-9)
+
+    za = np.array([0.0, 7.3, 30.0])
+    assert np.allclose(adc.calc_from_za(za), 2.0 * za, atol=1e-9)
+    assert adc.grid_max_error == pytest.approx(0.0, abs=1e-9)
+    assert any("Setpoint grid created" in m for m in logger.infos)
+
+
+def test_grid_mode_step_adjusted_to_cover_range(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip", grid_step=0.7)
+    # 30 / 0.7 -> 43 cells, both ends on grid nodes
+    assert adc.grid_step == pytest.approx(30 / 43)
+    assert adc.grid_step <= 0.7
+
+
+@pytest.mark.parametrize("method", ["pchip", "cubic", "akima"])
+def test_grid_mode_error_bounded_on_default_table(method, logger, adc_factory):
+    exact = adc_factory(method=method)
+    grid = adc_factory(method=method, grid_step=0.01)
+
+    za = np.linspace(exact.za_min, exact.za_max, 5001)
+    diff = np.abs(grid.calc_from_za(za) - exact.calc_from_za(za))
+
+    assert diff.max() <= grid.grid_max_error + 1e-9
+    assert grid.grid_max_error < 1e-3
+
+
+def test_grid_mode_out_of_bounds_still_raises(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip", grid_step=0.5)
+    with pytest.raises(ValueError):
+        adc.calc_from_za(30.5)
+
+
+@pytest.mark.parametrize("step", [0, -1.0])
+def test_grid_mode_invalid_step_raises(step, logger, lookup_csv, adc_factory):
+    with pytest.raises(ValueError):
+        adc_factory(lookup_table=lookup_csv, method="pchip", grid_step=step)
+
+    assert any("Invalid grid step" in m for m in logger.errors)
+
+
+# -------------------------
+# batch conversion
+# -------------------------
+@pytest.mark.parametrize(
+    "rounding, expected",
+    [
+        ("trunc", [0, 45, -5, 4, 13]),
+        ("nearest", [0, 45, -5, 4, 14]),
+        ("floor", [0, 45, -6, 4, 13]),
+    ],
+)
+def test_degrees_to_counts_rounding_modes(
+    rounding, expected, logger, lookup_csv, adc_factory
+):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    degrees = np.array([0.0, 1.0, -0.12, 0.1, 0.31])
+
+    out = adc.degrees_to_counts(degrees, rounding=rounding)
+
+    assert out.dtype == np.int64
+    assert out.tolist() == expected
+
+
+def test_degrees_to_counts_trunc_matches_scalar(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    degrees = np.linspace(-400, 400, 1001)
+
+    out = adc.degrees_to_counts(degrees, dtype=np.int32)
+
+    assert out.dtype == np.int32
+    assert out.tolist() == [adc.degree_to_count(d) for d in degrees.tolist()]
+
+
+def test_degrees_to_counts_invalid_options_raise(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+
+    with pytest.raises(ValueError):
+        adc.degrees_to_counts([1.0], rounding="ceil")
+    with pytest.raises(ValueError):
+        adc.degrees_to_counts([1.0], dtype=np.float64)
+
+    assert any("Invalid rounding mode" in m for m in logger.errors)
+    assert any("Invalid count dtype" in m for m in logger.errors)
+
+
+def test_module_degrees_to_counts_matches_method(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    degrees = [-1.01, 0.5, 359.99]
+
+    for rounding in ("trunc", "nearest", "floor"):
+        assert (
+            degrees_to_counts(degrees, rounding=rounding).tolist()
+            == adc.degrees_to_counts(degrees, rounding=rounding).tolist()
+        )
+    with pytest.raises(ValueError, match="rounding"):
+        degrees_to_counts([1.0], rounding="ceil")
+    assert logger.errors == []
+
+
+def test_za_to_counts_series_single_debug_log(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    za = np.array([0.0, 10.0, 15.0, 30.0])
+
+    times, counts = adc.za_to_counts(za)
+
+    assert times is None
+    assert counts.tolist() == [0, 900, 1350, 2700]  # 2*za deg * 45 counts/deg
+    assert len(logger.debugs) == 1
+
+
+def test_za_to_counts_time_pairs(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    pairs = np.array([[100.0, 0.0], [160.0, 10.0]])
+
+    times, counts = adc.za_to_counts(pairs, dtype=np.int32)
+
+    assert times.tolist() == [100.0, 160.0]
+    assert counts.dtype == np.int32
+    assert counts.tolist() == [0, 900]
+
+
+def test_za_to_counts_out_of_bounds_raises(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    with pytest.raises(ValueError):
+        adc.za_to_counts(np.array([0.0, 31.0]))
+
+
+def test_za_to_counts_invalid_shape_raises(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    with pytest.raises(ValueError):
+        adc.za_to_counts(np.zeros((2, 3)))
+
+    assert any("Invalid zenith angle series shape" in m for m in logger.errors)
+
+
+# -------------------------
+# interpolant cache
+# -------------------------
+def test_cache_disabled_by_default(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    assert adc.interp_cache is None
+    assert adc.interp_cache_hit is None
+    assert adc.interp_load_time >= 0
+
+
+@pytest.mark.parametrize("method", ["pchip", "cubic", "akima"])
+def test_cache_miss_then_hit_gives_same_values(method, logger, tmp_path, adc_factory):
+    cache_dir = str(tmp_path / "cache")
+    cold = adc_factory(method=method, use_cache=True, cache_dir=cache_dir)
+    hot = adc_factory(method=method, use_cache=True, cache_dir=cache_dir)
+
+    assert cold.interp_cache_hit is False
+    assert hot.interp_cache_hit is True
+    assert hot.za_min == cold.za_min and hot.za_max == cold.za_max
+
+    za = np.linspace(cold.za_min, cold.za_max, 241)
+    assert np.array_equal(hot.calc_from_za(za), cold.calc_from_za(za))
+    assert any("loaded from cache" in m for m in logger.infos)
+
+
+def test_cache_hit_skips_csv_parsing(
+    logger, lookup_csv, tmp_path, monkeypatch, adc_factory
+):
+    import kspec_adc_controller.adc_calc_angle as mod
+
+    cache_dir = str(tmp_path / "cache")
+    adc_factory(lookup_table=lookup_csv, use_cache=True, cache_dir=cache_dir)
+
+    def boom(*_a, **_kw):
+        raise AssertionError("genfromtxt must not be called on a cache hit")
+
+    monkeypatch.setattr(mod.np, "genfromtxt", boom)
+    hot = adc_factory(lookup_table=lookup_csv, use_cache=True, cache_dir=cache_dir)
+
+    assert hot.interp_cache_hit is True
+    assert float(hot.calc_from_za(15.0)) == pytest.approx(30.0, abs=1e-6)
+
+
+def test_cache_is_keyed_by_table_content(logger, lookup_csv, tmp_path, adc_factory):
+    cache_dir = str(tmp_path / "cache")
+    adc_factory(lookup_table=lookup_csv, use_cache=True, cache_dir=cache_dir)
+
+    with open(lookup_csv, "a", encoding="utf-8") as f:
+        f.write("40,80\n")
+    changed = adc_factory(lookup_table=lookup_csv, use_cache=True, cache_dir=cache_dir)
+
+    assert changed.interp_cache_hit is False
+    assert changed.za_max == 40
+
+
+def test_cache_load_failure_falls_back_to_fit(
+    logger, lookup_csv, tmp_path, monkeypatch, adc_factory
+):
+    import kspec_adc_controller.adc_calc_angle as mod
+
+    def boom(*_a, **_kw):
+        raise OSError("disk fail")
+
+    monkeypatch.setattr(mod.InterpCache, "load", boom)
+    monkeypatch.setattr(mod.InterpCache, "store", boom)
+    adc = adc_factory(lookup_table=lookup_csv, use_cache=True, cache_dir=str(tmp_path))
+
+    assert adc.interp_cache_hit is False
+    assert float(adc.calc_from_za(15.0)) == pytest.approx(30.0, abs=1e-6)
+    assert any("Failed to load interpolant cache" in m for m in logger.warnings)
+    assert any("Failed to store interpolant cache" in m for m in logger.warnings)
+
+
+# -------------------------
+# NumPy evaluator / lazy SciPy import
+# -------------------------
+@pytest.mark.parametrize(
+    "method, scipy_cls",
+    [
+        ("cubic", "CubicSpline"),
+        ("pchip", "PchipInterpolator"),
+        ("akima", "Akima1DInterpolator"),
+    ],
+)
+def test_numpy_evaluator_matches_scipy(method, scipy_cls, logger, adc_factory):
+    import scipy.interpolate
+
+    from kspec_adc_controller.adc_calc_angle import _get_default_lookup_path
+
+    data = np.genfromtxt(_get_default_lookup_path(), comments="#", delimiter=",")
+    ref = getattr(scipy.interpolate, scipy_cls)(data[:, 0], data[:, 1])
+    adc = adc_factory(method=method)
+
+    za = np.linspace(0, 60, 1201)
+    assert np.allclose(adc.calc_from_za(za), ref(za), rtol=0, atol=1e-12)
+    for z in (0, 0.5, 5.0, 37.25, 60):
+        out = adc.calc_from_za(z)
+        assert isinstance(out, float)
+        assert out == pytest.approx(float(ref(z)), abs=1e-12)
+
+
+def test_piecewise_polynomial_extrapolates_with_end_pieces():
+    from kspec_adc_controller.adc_calc_angle import PiecewisePolynomial
+
+    # [0,1): y = 1 + 2*dx, [1,2]: y = 3 - dx
+    pp = PiecewisePolynomial(np.array([[2.0, -1.0], [1.0, 3.0]]), np.array([0, 1, 2.0]))
+
+    assert pp(-1.0) == pytest.approx(-1.0)
+    assert pp(0.5) == pytest.approx(2.0)
+    assert pp(3.0) == pytest.approx(1.0)
+    assert np.allclose(pp(np.array([-1.0, 0.5, 1.0, 3.0])), [-1.0, 2.0, 3.0, 1.0])
+
+
+def test_fit_interpolant_invalid_method_raises():
+    from kspec_adc_controller.adc_calc_angle import fit_interpolant
+
+    with pytest.raises(ValueError):
+        fit_interpolant(np.array([0.0, 1.0]), np.array([0.0, 1.0]), "linear")
+
+
+def _run_importtime(code):
+    import os
+    import subprocess
+    import sys
+
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env = dict(os.environ, PYTHONPATH=src)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # "import time: self [us] | cumulative | imported package"
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = int(cumulative)
+    return proc.stdout, timings
+
+
+def test_import_does_not_load_scipy():
+    _out, timings = _run_importtime("import kspec_adc_controller.adc_calc_angle")
+
+    assert "kspec_adc_controller.adc_calc_angle" in timings
+    assert not [name for name in timings if name.split(".")[0] == "scipy"]
+
+
+def test_cache_hit_construction_does_not_load_scipy(tmp_path):
+    code = (
+        "import sys\n"
+        "import kspec_adc_controller.adc_calc_angle as mod\n"
+        "class Quiet:\n"
+        "    def __getattr__(self, _name):\n"
+        "        return lambda *_a, **_kw: None\n"
+        "mod.AdcLogger = lambda *_a, **_kw: Quiet()\n"
+        f"mod.ADCCalc(use_cache=True, cache_dir={str(tmp_path)!r})\n"
+        "print('scipy' in sys.modules)\n"
+    )
+    cold_out, _ = _run_importtime(code)
+    hot_out, timings = _run_importtime(code)
+
+    assert cold_out.strip().splitlines()[-1] == "True"
+    assert hot_out.strip().splitlines()[-1] == "False"
+    # calc 모듈 import 자체는 numpy 수준의 비용이어야 함 (SciPy import는 수백 ms)
+    assert timings["kspec_adc_controller.adc_calc_angle"] < 1_000_000
+
+
+# -------------------------
+# hot reload
+# -------------------------
+def _rewrite_table(path, slope, extra_rows=0):
+    rows = [f"{za},{slope * za}" for za in range(0, 31 + 10 * extra_rows, 10)]
+    Path(path).write_text("# za, adc\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+
+def test_reload_if_changed_requires_stable_signature(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    assert adc.reload_if_changed() is False
+
+    _rewrite_table(lookup_csv, slope=3.0)
+    # 첫 관측은 pending으로만 기록, 두 번째 관측에서 reload
+    assert adc.reload_if_changed() is False
+    assert float(adc.calc_from_za(10.0)) == pytest.approx(20.0)
+    assert adc.reload_if_changed() is True
+    assert float(adc.calc_from_za(10.0)) == pytest.approx(30.0)
+    assert any("reloaded and swapped" in m for m in logger.infos)
+
+    assert adc.reload_if_changed() is False
+
+
+def test_reload_keeps_grid_mode(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip", grid_step=0.5)
+
+    _rewrite_table(lookup_csv, slope=3.0, extra_rows=1)
+    assert adc.reload() is True
+
+    assert adc.za_max == 40
+    assert adc.grid_step == pytest.approx(0.5)
+    assert adc.calc_from_za(35.0) == pytest.approx(105.0)
+
+
+def test_reload_if_changed_ignores_touch_without_content_change(
+    logger, lookup_csv, adc_factory
+):
+    import os
+
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    fn_before = adc.fn_za_adc
+
+    st = os.stat(lookup_csv)
+    os.utime(lookup_csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert adc.reload_if_changed() is False
+    assert adc.reload_if_changed() is False
+    assert adc.fn_za_adc is fn_before
+
+
+def test_reload_failure_keeps_previous_interpolant(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    Path(lookup_csv).write_text("0\n1\n2\n", encoding="utf-8")
+
+    assert adc.reload_if_changed() is False
+    assert adc.reload_if_changed() is False
+
+    assert float(adc.calc_from_za(15.0)) == pytest.approx(30.0)
+    assert any(
+        "keeping the previous interpolation function" in m for m in logger.errors
+    )
+    # 같은 깨진 파일로 재시도하지 않음
+    n_errors = len(logger.errors)
+    assert adc.reload_if_changed() is False
+    assert len(logger.errors) == n_errors
+
+
+def test_watcher_thread_swaps_interpolant(logger, lookup_csv, adc_factory):
+    import time
+
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    adc.start_watching(interval=0.01)
+    adc.start_watching(interval=0.01)  # 중복 시작은 무시
+    try:
+        _rewrite_table(lookup_csv, slope=3.0)
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if float(adc.calc_from_za(10.0)) == pytest.approx(30.0):
+                break
+            time.sleep(0.01)
+        assert float(adc.calc_from_za(10.0)) == pytest.approx(30.0)
+    finally:
+        adc.stop_watching(timeout=1.0)
+
+    assert adc._watch_thread is None
+    assert any("already running" in m for m in logger.infos)
+    assert any("watcher stopped" in m for m in logger.infos)
+
+
+def test_calc_during_swaps_never_mixes_states(logger, lookup_csv, adc_factory):
+    import threading
+
+    adc = adc_factory(lookup_table=lookup_csv, method="pchip")
+    stop = threading.Event()
+    bad = []
+
+    def reader():
+        za = np.array([10.0, 20.0, 30.0])
+        while not stop.is_set():
+            out = adc.calc_from_za(za)
+            ratio = out / za
+            if not np.allclose(ratio, ratio[0]):
+                bad.append(out)
+
+    t = threading.Thread(target=reader)
+    t.start()
+    try:
+        for slope in (3.0, 2.0, 4.0, 5.0):
+            _rewrite_table(lookup_csv, slope=slope)
+            assert adc.reload() is True
+    finally:
+        stop.set()
+        t.join()
+
+    assert not bad
+
+
+# -------------------------
+# chebyshev / minimax backends
+# -------------------------
+@pytest.mark.parametrize("method", ["chebyshev", "minimax"])
+def test_poly_method_fits_linear_table_exactly(method, logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method=method, poly_degree=3)
+
+    za = np.array([0.0, 7.5, 15.0, 30.0])
+    assert np.allclose(adc.calc_from_za(za), 2.0 * za, atol=1e-9)
+    assert adc.calc_from_za(7.5) == pytest.approx(15.0, abs=1e-9)
+    assert adc.fit_report["max_abs_error_deg"] < 1e-9
+    assert any(f"{method} fit (degree 3) vs PCHIP" in m for m in logger.infos)
+
+
+@pytest.mark.parametrize("method", ["chebyshev", "minimax"])
+def test_poly_method_report_on_default_table(method, logger, adc_factory):
+    adc = adc_factory(method=method)
+    report = adc.fit_report
+
+    assert adc.fn_za_adc.degree == 16
+    assert report["max_abs_error_counts"] == pytest.approx(
+        report["max_abs_error_deg"] * 45
+    )
+    assert report["rms_error_deg"] <= report["max_abs_error_deg"] < 1.0
+
+    # scalar Clenshaw 경로와 vectorized 경로가 일치
+    za = np.linspace(0, 60, 121)
+    vec = adc.calc_from_za(za)
+    assert np.allclose([adc.calc_from_za(float(z)) for z in za], vec, atol=1e-9)
+
+
+def test_minimax_has_smaller_max_error_than_least_squares(logger, adc_factory):
+    lsq = adc_factory(method="chebyshev", poly_degree=12)
+    mmx = adc_factory(method="minimax", poly_degree=12)
+
+    assert mmx.fit_report["max_abs_error_deg"] < lsq.fit_report["max_abs_error_deg"]
+
+
+def test_spline_method_has_no_fit_report(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv, method="akima")
+    assert adc.fit_report is None
+
+
+@pytest.mark.parametrize("degree", [0, 2.5])
+def test_poly_method_invalid_degree_raises(degree, logger, lookup_csv, adc_factory):
+    with pytest.raises(ValueError):
+        adc_factory(lookup_table=lookup_csv, method="chebyshev", poly_degree=degree)
+
+    assert any("Invalid polynomial degree" in m for m in logger.errors)
+
+
+def test_poly_method_cache_keyed_by_degree(logger, tmp_path, adc_factory):
+    cache_dir = str(tmp_path / "cache")
+    cold = adc_factory(
+        method="chebyshev", poly_degree=10, use_cache=True, cache_dir=cache_dir
+    )
+    hot = adc_factory(
+        method="chebyshev", poly_degree=10, use_cache=True, cache_dir=cache_dir
+    )
+    other = adc_factory(
+        method="chebyshev", poly_degree=11, use_cache=True, cache_dir=cache_dir
+    )
+
+    assert (cold.interp_cache_hit, hot.interp_cache_hit) == (False, True)
+    assert other.interp_cache_hit is False
+    assert hot.fit_report is None
+    za = np.linspace(0, 60, 61)
+    assert np.array_equal(hot.calc_from_za(za), cold.calc_from_za(za))
+
+
+# -------------------------
+# inverse map
+# -------------------------
+def test_za_from_angle_inverts_linear_table(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv)
+
+    assert adc.za_from_angle(30.0) == pytest.approx(15.0, abs=1e-9)
+    assert adc.za_from_angle(0) == pytest.approx(0.0, abs=1e-9)
+    assert np.allclose(adc.za_from_angle(np.array([0.0, 20.0, 60.0])), [0, 10, 30])
+    assert adc.inverse_max_error < 1e-9
+
+
+def test_za_from_counts_uses_count_scale(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv)
+
+    # 30 deg = 1350 counts -> za 15
+    assert adc.za_from_counts(1350) == pytest.approx(15.0, abs=1e-9)
+    assert np.allclose(adc.za_from_counts(np.array([0, 900, 2700])), [0, 10, 30])
+
+
+def test_inverse_out_of_range_is_nan(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv)
+
+    assert np.isnan(adc.za_from_angle(60.5))
+    assert np.isnan(adc.za_from_counts(-10))
+    res = adc.za_from_angle(np.array([-1.0, 10.0, 61.0]))
+    assert np.isnan(res[[0, 2]]).all() and res[1] == pytest.approx(5.0)
+
+
+@pytest.mark.parametrize("method", ["pchip", "cubic", "akima", "chebyshev"])
+def test_inverse_round_trip_on_decreasing_default_table(method, logger, adc_factory):
+    adc = adc_factory(method=method)
+
+    za = np.linspace(0.3, 59.7, 200)
+    back = adc.za_from_angle(adc.calc_from_za(za))
+    assert np.allclose(back, za, atol=max(adc.inverse_max_error, 1e-6))
+    assert adc.inverse_max_error < 1e-3
+    scalar = [adc.za_from_angle(float(a)) for a in adc.calc_from_za(za[:20])]
+    assert np.allclose(scalar, back[:20], atol=1e-12)
+
+
+def test_inverse_drops_non_monotone_samples(logger, adc_factory):
+    adc = adc_factory(method="minimax")
+
+    inverse = adc._state.inverse
+    assert inverse.n_dropped > 0
+    assert np.all(np.diff(inverse.angles) > 0)
+    assert any("not monotone" in m for m in logger.warnings)
+
+
+def test_inverse_rebuilt_on_reload(logger, lookup_csv, adc_factory):
+    adc = adc_factory(lookup_table=lookup_csv)
+    Path(lookup_csv).write_text("0,0\n10,10\n20,20\n30,30\n", encoding="utf-8")
+
+    assert adc.reload() is True
+    assert adc.za_from_angle(15.0) == pytest.approx(15.0, abs=1e-9)
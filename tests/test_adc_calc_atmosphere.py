@@ -0,0 +1,159 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from kspec_adc_controller.adc_calc_atmosphere import AtmosphericADCCalc
+
+
+class DummyLogger:
+    def __init__(self):
+        self.infos = []
+        self.debugs = []
+        self.errors = []
+        self.warnings = []
+
+    def info(self, msg):
+        self.infos.append(msg)
+
+    def debug(self, msg):
+        self.debugs.append(msg)
+
+    def error(self, msg):
+        self.errors.append(msg)
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+
+@pytest.fixture
+def logger(monkeypatch):
+    import kspec_adc_controller.adc_calc_atmosphere as mod
+
+    logger = DummyLogger()
+    monkeypatch.setattr(mod, "AdcLogger", lambda *_a, **_kw: logger)
+    return logger
+
+
+def adc_model(za, t, p):
+    # 모든 축에 대해 (multi)linear라 grid 보간이 정확히 재현해야 함
+    return -za * (1 + 0.001 * t) * (p / 750.0)
+
+
+@pytest.fixture
+def lookup_3d(tmp_path: Path) -> str:
+    rows = [
+        f"{za},{t},{p},{adc_model(za, t, p)!r}"
+        for za in (0, 10, 20, 30, 40)
+        for t in (-10, 0, 15)
+        for p in (700, 800)
+    ]
+    path = tmp_path / "ADC_lookup_tp.csv"
+    path.write_text("# za, T, P, adc\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_scalar_lookup_matches_model(logger, lookup_3d):
+    calc = AtmosphericADCCalc(lookup_3d)
+
+    assert calc.values.shape[1:] == (3, 2)
+    res = calc.calc_from_za(12.5, temperature=7.0, pressure=760.0)
+    assert isinstance(res, float)
+    assert res == pytest.approx(adc_model(12.5, 7.0, 760.0), abs=1e-9)
+    assert calc.bounds == {
+        "za": (0.0, 40.0),
+        "temperature": (-10.0, 15.0),
+        "pressure": (700.0, 800.0),
+    }
+    assert any("Atmospheric lookup grid" in m for m in logger.infos)
+
+
+def test_array_inputs_broadcast(logger, lookup_3d):
+    calc = AtmosphericADCCalc(lookup_3d)
+
+    za = np.linspace(0, 40, 9)
+    res = calc.calc_from_za(za, temperature=15.0, pressure=np.full(9, 700.0))
+    assert res.shape == (9,)
+    assert np.allclose(res, adc_model(za, 15.0, 700.0), atol=1e-9)
+
+
+def test_calc_series_with_and_without_time(logger, lookup_3d):
+    calc = AtmosphericADCCalc(lookup_3d)
+    rng = np.random.default_rng(1)
+    n = 1000
+    series = np.column_stack(
+        [rng.uniform(0, 40, n), rng.uniform(-10, 15, n), rng.uniform(700, 800, n)]
+    )
+
+    times, angles = calc.calc_series(series)
+    assert times is None
+    assert np.allclose(angles, adc_model(*series.T), atol=1e-9)
+
+    stamped = np.column_stack([np.arange(n) * 60.0, series])
+    times, counts = calc.series_to_counts(stamped, dtype=np.int32, rounding="nearest")
+    assert np.array_equal(times, np.arange(n) * 60.0)
+    assert counts.dtype == np.int32
+    assert np.array_equal(counts, np.rint(adc_model(*series.T) * 45).astype(np.int32))
+
+    with pytest.raises(ValueError, match="rounding"):
+        calc.series_to_counts(series, rounding="ceil")
+    assert any("Invalid rounding mode" in m for m in logger.errors)
+
+
+def test_two_dimensional_table(logger, tmp_path):
+    path = tmp_path / "ADC_lookup_t.csv"
+    rows = [f"{za},{t},{-za * (1 + 0.01 * t)!r}" for za in (0, 30, 60) for t in (0, 20)]
+    path.write_text("\n".join(rows), encoding="utf-8")
+
+    calc = AtmosphericADCCalc(str(path), axes=("temperature",), method="akima")
+    assert calc.calc_from_za(45.0, temperature=10.0) == pytest.approx(-49.5)
+
+
+def test_from_tables(logger, tmp_path):
+    tables = {}
+    for t in (0.0, 20.0):
+        path = tmp_path / f"ADC_lookup_{t}.csv"
+        path.write_text(
+            "\n".join(f"{za},{-za * (1 + 0.01 * t)!r}" for za in (0, 30, 60)),
+            encoding="utf-8",
+        )
+        tables[(t,)] = str(path)
+
+    calc = AtmosphericADCCalc.from_tables(tables, axes=("temperature",))
+    assert calc.calc_from_za(30.0, temperature=5.0) == pytest.approx(-31.5)
+
+
+def test_out_of_bounds_raises(logger, lookup_3d):
+    calc = AtmosphericADCCalc(lookup_3d)
+
+    with pytest.raises(ValueError):
+        calc.calc_from_za(41.0, temperature=0.0, pressure=750.0)
+    with pytest.raises(ValueError):
+        calc.calc_from_za(np.array([1.0, 2.0]), temperature=20.0, pressure=750.0)
+    assert any("temperature is out of bounds" in m for m in logger.errors)
+
+
+def test_missing_condition_raises(logger, lookup_3d):
+    calc = AtmosphericADCCalc(lookup_3d)
+
+    with pytest.raises(TypeError):
+        calc.calc_from_za(10.0, temperature=0.0)
+
+
+def test_irregular_table_raises(logger, lookup_3d):
+    lines = Path(lookup_3d).read_text(encoding="utf-8").splitlines()
+    Path(lookup_3d).write_text("\n".join(lines[:-1]), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        AtmosphericADCCalc(lookup_3d)
+    assert any("not a regular grid" in m for m in logger.errors)
+
+
+def test_wrong_column_count_raises(logger, lookup_3d):
+    with pytest.raises(ValueError):
+        AtmosphericADCCalc(lookup_3d, axes=("temperature",))
+
+
+def test_missing_file_raises(logger, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        AtmosphericADCCalc(str(tmp_path / "missing.csv"))
@@ -1,6 +1,9 @@
+import asyncio
 import importlib
 import json
 import sys
+import threading
+import time
 import types
 from pathlib import Path
 
@@ -10,6 +13,22 @@ import pytest
 # -------------------------
 # Test doubles (fakes)
 # -------------------------
+def _as_async(fn):
+    """AdcController.move 대역: sync fake를 awaitable로 감싼다."""
+
+    async def _wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    return _wrapper
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(*_args):
+    return None
+
+
 class DummyLogger:
     def __init__(self):
         self.debugs = []
@@ -55,12 +74,32 @@ class _FakeSizeList(list):
 
 
 class _FakeBusId:
+    """bus hardware ID와 device ID 양쪽의 getter를 흉내낸다."""
+
     def __init__(self, s):
         self._s = s
 
     def toString(self):
         return self._s
 
+    def getBusHardware(self):
+        return "serial"
+
+    def getProtocol(self):
+        return "MODBUS RTU"
+
+    def getHardwareSpecifier(self):
+        return self._s
+
+    def getName(self):
+        return self._s
+
+    def getDeviceId(self):
+        return int(self._s[-1]) + 1 if self._s.startswith("DEV") else 0
+
+    def getDescription(self):
+        return self._s
+
     def __str__(self):
         return self._s
 
@@ -98,9 +137,12 @@ class FakeAccessor:
         self.bus_ids = _FakeSizeList([_FakeBusId("BUS0"), _FakeBusId("BUS1")])
         self.scan_device_ids = _FakeSizeList([_FakeBusId("DEV0"), _FakeBusId("DEV1")])
         self.add_device_handles = ["H1", "H2"]
+        self.calls = []  # find_devices 단계별 호출 기록
+        self.removed_handles = []
 
         # move/stop용
         self._status_sequence = [0x0000, 0x1400]  # move 완료 플래그로 종료
+        self.status_fn = None  # 설정되면 statusword를 write_calls로부터 계산
         self._status_i = 0
         self.write_calls = []  # writeNumber 호출 기록
 
@@ -130,27 +172,35 @@ class FakeAccessor:
 
     # ---- find_devices ----
     def listAvailableBusHardware(self):
+        self.calls.append("list")
         if self.list_bus_error:
             return FakeResult(error=self.list_bus_error)
         return FakeResult(result=self.bus_ids)
 
     def openBusHardwareWithProtocol(self, bus_id, options):
+        self.calls.append(("open", str(bus_id)))
         if self.open_bus_error:
             return FakeResult(error=self.open_bus_error)
         return FakeResult(result=True)
 
     def scanDevices(self, bus_id, callback):
+        self.calls.append("scan")
         if self.scan_error:
             return FakeResult(error=self.scan_error)
         return FakeResult(result=self.scan_device_ids)
 
     def addDevice(self, device_id):
+        self.calls.append(("add", str(device_id)))
         if self.add_device_error:
             return FakeResult(error="ADD_DEVICE_FAIL")
         s = str(device_id)
         idx = 0 if "DEV0" in s else 1
         return FakeResult(result=self.add_device_handles[idx])
 
+    def removeDevice(self, handle):
+        self.removed_handles.append(handle)
+        return FakeResult(result=True)
+
     # ---- motion ----
     def writeNumber(self, handle, value, od_index, bits):
         if getattr(od_index, "idx", None) in self.write_raises_at_idx:
@@ -168,6 +218,8 @@ class FakeAccessor:
             return FakeResult(error=self.read_error)
 
         if getattr(od_index, "idx", None) == 0x6041:
+            if self.status_fn is not None:
+                return FakeResult(result=self.status_fn())
             v = self._status_sequence[
                 min(self._status_i, len(self._status_sequence) - 1)
             ]
@@ -198,6 +250,14 @@ def make_fake_nanolib_module(fake_accessor: FakeAccessor):
         class NlcScanBusCallback:
             pass
 
+        @staticmethod
+        def BusHardwareId(bus_hardware, protocol, hardware_specifier, name):
+            return _FakeBusId(hardware_specifier)
+
+        @staticmethod
+        def DeviceId(bus_hardware_id, device_id, description):
+            return _FakeBusId(description)
+
         BusScanInfo_Start = 1
         BusScanInfo_Progress = 2
         BusScanInfo_Finished = 3
@@ -246,6 +306,30 @@ def logger():
     return DummyLogger()
 
 
+@pytest.fixture(autouse=True)
+def topology_path(tmp_path, monkeypatch):
+    """
+    device topology cache가 package cache 대신 tmp_path에 저장되도록 한다.
+    """
+    import kspec_adc_controller.adc_topology as topology_mod
+
+    path = tmp_path / "topology.json"
+    monkeypatch.setattr(topology_mod, "_get_default_topology_path", lambda: str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def motion_model_path(tmp_path, monkeypatch):
+    """
+    motion-time model이 package cache 대신 tmp_path에 저장되도록 한다.
+    """
+    import kspec_adc_controller.adc_motion_model as motion_mod
+
+    path = tmp_path / "motion_model.json"
+    monkeypatch.setattr(motion_mod, "_get_default_model_path", lambda: str(path))
+    return path
+
+
 @pytest.fixture
 def controller_factory(adc_controller_module, logger, monkeypatch):
     """
@@ -636,6 +720,55 @@ def test_move_motor_write_raises_logs_and_raises(
     assert any("Failed to move Motor 1" in m for m in logger.errors)
 
 
+def test_predict_move_time_constant_velocity_and_trapezoid(
+    controller_factory, config_file
+):
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+
+    # 1 RPM = 16200 counts / 60 s = 270 counts/s
+    assert c.predict_move_time(1, 2700, 1) == pytest.approx(10.0)
+    assert c.predict_move_time(1, -2700, 1) == pytest.approx(10.0)
+    assert c.predict_move_time(1, 0, 1) == 0.0
+
+    c.profile_acceleration = 1.0  # 1 RPM/s -> 1초 가속 + 1초 감속
+    assert c.predict_move_time(1, 2700, 1) == pytest.approx(11.0)
+    # 최고 속도 도달 전: 2*sqrt(d/a)
+    assert c.predict_move_time(1, 135, 1) == pytest.approx(2 * (135 / 270) ** 0.5)
+
+
+def test_move_motor_sleeps_until_predicted_end_then_fine_polls(
+    controller_factory, config_file, monkeypatch
+):
+    mod, fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+    c.devices[1]["handle"] = "H1"
+    c.devices[1]["connected"] = True
+    fake_accessor._status_sequence = [0x0000, 0x0400, 0x1400]
+    fake_accessor._status_i = 0
+
+    sleeps = []
+
+    async def recording_sleep(s):
+        sleeps.append(s)
+
+    monkeypatch.setattr(mod.asyncio, "sleep", recording_sleep)
+    monkeypatch.setattr(c, "read_motor_position", lambda motor_id: 0)
+
+    res = c.move_motor(1, pos=2700, vel=1)
+
+    assert res["predicted_time"] == pytest.approx(10.0)
+    # 예측 종료 1초 전까지 한 번 자고, 이후 poll_interval로 두 번 polling
+    assert sleeps == [pytest.approx(9.0), c.poll_interval, c.poll_interval]
+    assert fake_accessor._status_i == 3
+
+    entry = c.motion_log[-1]
+    assert entry["motor_id"] == 1 and entry["distance"] == 2700
+    assert entry["predicted_time"] == pytest.approx(10.0)
+    assert entry["move_time"] == res["move_time"]
+    assert c.motion_model.n_samples(1) == 1
+
+
 # -------------------------
 # stop_motor coverage (handle None / read fail)
 # -------------------------
@@ -759,7 +892,7 @@ async def test_parking_threshold_no_move(
         called["move"] += 1
         return {"ok": True}
 
-    monkeypatch.setattr(c, "move_motor", fake_move)
+    monkeypatch.setattr(c, "move", _as_async(fake_move))
 
     await c.parking(parking_vel=1)
 
@@ -787,7 +920,7 @@ async def test_zeroing_threshold_no_move(
         called["move"] += 1
         return {"ok": True}
 
-    monkeypatch.setattr(c, "move_motor", fake_move)
+    monkeypatch.setattr(c, "move", _as_async(fake_move))
 
     await c.zeroing(zeroing_vel=1)
 
@@ -825,7 +958,7 @@ async def test_parking_wraparound_branches_call_move(
         calls.append((motor_id, pos, vel))
         return {"motor": motor_id, "pos": pos}
 
-    monkeypatch.setattr(c, "move_motor", fake_move)
+    monkeypatch.setattr(c, "move", _as_async(fake_move))
 
     await c.parking(parking_vel=3)
 
@@ -862,7 +995,7 @@ async def test_zeroing_wraparound_branches_call_move(
         calls.append((motor_id, pos, vel))
         return {"motor": motor_id, "pos": pos}
 
-    monkeypatch.setattr(c, "move_motor", fake_move)
+    monkeypatch.setattr(c, "move", _as_async(fake_move))
 
     await c.zeroing(zeroing_vel=2)
 
@@ -933,7 +1066,7 @@ async def test_homing_when_already_home_position_wraparound_moves(
         calls.append((motor_id, pos, vel))
         return {"motor": motor_id}
 
-    monkeypatch.setattr(c, "move_motor", fake_move)
+    monkeypatch.setattr(c, "move", _as_async(fake_move))
 
     await c.homing(homing_vel=1)
 
@@ -1026,3 +1159,854 @@ def test_get_default_adc_config_path_success(
     path = mod._get_default_adc_config_path()
     assert path.endswith(str(Path("etc") / "adc_config.json"))
     assert Path(path).exists()
+
+
+def test_predict_move_time_switches_to_learned_model(controller_factory, config_file):
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+
+    for d in (1000, 2000, 4000, 8000, 16000):
+        c.motion_model.update(1, d, 1, 0.5 + d / 270.0 * 1.1)
+
+    assert c.predict_move_time(1, 2700, 1) == pytest.approx(0.5 + 11.0)
+    assert c.predict_move_time(2, 2700, 1) == pytest.approx(10.0)  # kinematic
+
+
+def test_motion_model_path_from_config(controller_factory, tmp_path):
+    mod, _fake_accessor, make_controller = controller_factory
+    config = tmp_path / "adc_config.json"
+    model_path = tmp_path / "models" / "motion.json"
+    config.write_text(
+        f'{{"selected_bus_index": 0, "motion_model_path": "{model_path}"}}',
+        encoding="utf-8",
+    )
+    c = make_controller(config=str(config))
+
+    assert c.motion_model.path == str(model_path)
+    c.motion_model.update(1, 1000, 1, 4.0)
+    c.adc_motor_id = "BUS"
+    c.close()
+    assert model_path.exists()
+
+
+def test_corrupt_motion_model_starts_empty(
+    controller_factory, logger, config_file, motion_model_path
+):
+    motion_model_path.write_text("garbage", encoding="utf-8")
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+
+    assert c.motion_model.n_samples(1) == 0
+    assert any("empty motion-time model" in m for m in logger.warnings)
+
+
+def test_predict_parking_and_zeroing_time(controller_factory, config_file, monkeypatch):
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+
+    with pytest.raises(Exception):
+        c.predict_parking_time()
+
+    c.home_position = True
+    c.home_position_motor1 = 1000
+    c.home_position_motor2 = 2000
+    positions = {1: 1000, 2: mod.max_position - 25}  # motor 2는 wrap된 위치
+    monkeypatch.setattr(c, "read_motor_position", lambda m: positions[m])
+
+    parking = c.predict_parking_time(1)
+    # motor 1: -250 counts, motor 2: 25 + 2000 - 225 counts at 270 counts/s
+    assert parking[1] == pytest.approx(250 / 270)
+    assert parking[2] == pytest.approx(1800 / 270)
+
+    zeroing = c.predict_zeroing_time(1)
+    assert zeroing[1] == pytest.approx(7635 / 270)
+
+
+@pytest.mark.asyncio
+async def test_parking_takes_shortest_rotation(
+    controller_factory, config_file, monkeypatch
+):
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+    c.home_position = True
+    c.home_position_motor1 = 0
+    c.home_position_motor2 = 0
+    # motor 1은 한 바퀴 가까이 돌아간 위치, motor 2는 0 아래로 wrap된 위치
+    positions = {1: 15000, 2: mod.max_position - 500}
+    monkeypatch.setattr(c, "read_motor_position", lambda m: positions[m])
+    moves = []
+    monkeypatch.setattr(
+        c, "move", _as_async(lambda m, pos, vel: moves.append((m, pos, vel)))
+    )
+
+    await c.parking(1)
+    # -250 - 15000 = -15250 counts 대신 +950 counts, motor 2는 -500 -> -225
+    assert sorted(moves) == [(1, 950, 1), (2, 275, 1)]
+
+    moves.clear()
+    c.approach_direction = -1
+    await c.parking(1)
+    assert sorted(moves) == [(1, 950 - 16200, 1), (2, 275 - 16200, 1)]
+
+
+# -------------------------
+# OD write shadow cache
+# -------------------------
+@pytest.fixture
+def moving_controller(controller_factory, config_file, monkeypatch):
+    mod, fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+    c.devices[1]["handle"] = "H1"
+    c.devices[1]["connected"] = True
+    monkeypatch.setattr(mod.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(mod.asyncio, "sleep", _no_sleep)
+    monkeypatch.setattr(c, "read_motor_position", lambda motor_id: 0)
+    # zero reference(home + ZERO_OFFSETS)를 drive 위치 0에 맞춤
+    c.home_position = True
+    c.home_position_motor1 = -c.ZERO_OFFSETS[0]
+    c.home_position_motor2 = -c.ZERO_OFFSETS[1]
+    return mod, fake_accessor, c
+
+
+def _move(fake_accessor, c, pos, vel, status=0x1427):
+    # 0x1427: operation enabled + set-point acknowledge + target reached
+    fake_accessor._status_sequence = [status]
+    fake_accessor._status_i = 0
+    fake_accessor.write_calls.clear()
+    c.move_motor(1, pos=pos, vel=vel)
+    return [(call[2], call[1]) for call in fake_accessor.write_calls]
+
+
+def test_repeated_move_skips_unchanged_writes(moving_controller):
+    mod, fake_accessor, c = moving_controller
+
+    first = _move(fake_accessor, c, 100, 2)
+    assert first == [
+        (0x6060, 1),
+        (0x6081, 2),
+        (0x607A, 100),
+        (0x6040, 6),
+        (0x6040, 7),
+        (0x6040, 0xF),
+        (0x6040, 0x5F),
+    ]
+
+    # 같은 mode/velocity/target: 0x0F로 bit 4를 내렸다가 0x5F로 다시 set
+    second = _move(fake_accessor, c, 100, 2)
+    assert second == [(0x6040, 0xF), (0x6040, 0x5F)]
+
+    third = _move(fake_accessor, c, 200, 2)
+    assert third == [(0x607A, 200), (0x6040, 0xF), (0x6040, 0x5F)]
+
+    stats = c.od_write_stats["move_motor"]
+    assert stats == {"writes": 7 + 2 + 3, "skipped": 0 + 5 + 4}
+
+
+def test_enable_falls_back_when_drive_left_operation_enabled(moving_controller):
+    mod, fake_accessor, c = moving_controller
+
+    _move(fake_accessor, c, 100, 2)
+    # shadow는 0x5F지만 drive는 quick stop 등으로 switched on(0x23) 상태
+    writes = _move(fake_accessor, c, 100, 2, status=0x1423)
+    assert writes == [
+        (0x6040, 6),
+        (0x6040, 7),
+        (0x6040, 0xF),
+        (0x6040, 0x5F),
+    ]
+
+    result, writes = _push(fake_accessor, c, 300, status=(0x0023, 0x1027))
+    assert writes == [
+        (0x6040, 0xF),
+        (0x6040, 6),
+        (0x6040, 7),
+        (0x6040, 0xF),
+        (0x607A, 300),
+        (0x6040, 0x3F),
+        (0x6040, 0x2F),
+    ]
+
+
+def test_move_to_plans_against_commanded_position(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    reads = []
+    c.read_motor_position = lambda motor_id: reads.append(motor_id) or 0
+
+    async def _run(target):
+        fake_accessor._status_sequence = [0x1400]
+        fake_accessor._status_i = 0
+        fake_accessor.write_calls.clear()
+        return await c.move_to(1, target, vel=2)
+
+    async def _scenario():
+        first = await _run(100)
+        assert first["skipped"] is False and first["distance"] == 100
+        n_reads = len(reads)
+
+        # 같은 목표 (1 count 미만 차이, 한 바퀴 차이 포함)는 bus 호출 없이 skip
+        for target in (100, 100.4, 100 + mod.counts_per_rev):
+            res = await _run(target)
+            assert res["skipped"] is True and res["position_change"] == 0
+            assert fake_accessor.write_calls == []
+        assert len(reads) == n_reads
+
+        # 새 목표까지의 delta만 이동 (model의 100 기준)
+        second = await _run(-50)
+        assert second["distance"] == -150
+        assert (0x607A, -150) in [(w[2], w[1]) for w in fake_accessor.write_calls]
+
+        # stop 이후에는 model이 무효이므로 위치를 다시 읽음
+        fake_accessor._status_sequence = [0x0040]
+        fake_accessor._status_i = 0
+        c.stop_motor(1)
+        assert 1 not in c._commanded_target
+        n_reads = len(reads)
+        third = await _run(-50)
+        assert third["distance"] == -50
+        assert len(reads) > n_reads
+
+    asyncio.run(_scenario())
+
+
+def test_absolute_targets_use_zero_reference(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    # zero reference = drive 위치 500, 현재 위치 0
+    c.home_position_motor1 = 500 - c.ZERO_OFFSETS[0]
+
+    fake_accessor._status_sequence = [0x1427]
+    fake_accessor._status_i = 0
+    result = asyncio.run(c.move_to(1, 100, vel=2))
+    assert result["distance"] == 600
+    assert c._commanded_target[1] == 600
+
+    result, writes = _push(fake_accessor, c, -100)
+    assert result["target"] == 400 and result["distance"] == -200
+    assert (0x607A, 400) in writes
+
+
+def test_absolute_targets_require_homing(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.home_position = False
+    fake_accessor.write_calls.clear()
+
+    with pytest.raises(Exception, match="homing"):
+        asyncio.run(c.move_to(1, 100, vel=2))
+    with pytest.raises(Exception, match="homing"):
+        _push(fake_accessor, c, 100)
+    assert fake_accessor.write_calls == []
+
+
+def _push(fake_accessor, c, target, buffered=False, status=(0x0027, 0x1027)):
+    fake_accessor._status_sequence = list(status)
+    fake_accessor._status_i = 0
+    fake_accessor.write_calls.clear()
+    stream = c.setpoint_stream(1, vel=2, buffered=buffered)
+    result = asyncio.run(stream.push(target))
+    return result, [(call[2], call[1]) for call in fake_accessor.write_calls]
+
+
+def test_push_setpoint_handshake(moving_controller):
+    mod, fake_accessor, c = moving_controller
+
+    result, writes = _push(fake_accessor, c, 100)
+    assert result["skipped"] is False and result["target"] == 100
+    assert writes == [
+        (0x6060, 1),
+        (0x6081, 2),
+        (0x6040, 6),
+        (0x6040, 7),
+        (0x6040, 0xF),
+        (0x607A, 100),
+        (0x6040, 0x3F),  # new set-point + change set immediately
+        (0x6040, 0x2F),
+    ]
+    assert c._commanded_target[1] == 100
+
+    # drive가 이미 enable 상태: target과 bit 4 handshake만
+    result, writes = _push(fake_accessor, c, 300)
+    assert result["distance"] == 200
+    assert writes == [(0x607A, 300), (0x6040, 0x3F), (0x6040, 0x2F)]
+
+    # 1 count 미만 차이는 bus 호출 없이 skip
+    result, writes = _push(fake_accessor, c, 300.2)
+    assert result["skipped"] is True and writes == []
+
+    result, writes = _push(fake_accessor, c, 250, buffered=True)
+    assert writes == [(0x607A, 250), (0x6040, 0x21F), (0x6040, 0x20F)]
+
+    # stream 이후의 relative move는 6/7 없이 시작 (bit 4는 이미 0)
+    assert _move(fake_accessor, c, 100, 2) == [(0x607A, 100), (0x6040, 0x5F)]
+
+
+def test_push_after_move_lowers_new_setpoint_bit(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.setpoint_ack_timeout = 0.05
+
+    # drive: controlword bit 4가 high인 동안 set-point acknowledge(bit 12) 유지
+    def _statusword():
+        controlwords = [w[1] for w in fake_accessor.write_calls if w[2] == 0x6040]
+        return 0x1427 if controlwords and controlwords[-1] & 0x10 else 0x0427
+
+    fake_accessor.status_fn = _statusword
+    c.move_motor(1, pos=100, vel=2)
+    assert c._shadowed_controlword(1) == 0x5F
+
+    n_writes = len(fake_accessor.write_calls)
+    result = asyncio.run(c.setpoint_stream(1, vel=2).push(300))
+    writes = [(call[2], call[1]) for call in fake_accessor.write_calls[n_writes:]]
+    assert result["skipped"] is False
+    assert writes == [
+        (0x6040, 0xF),  # 0x5F의 bit 4를 먼저 내림
+        (0x607A, 300),
+        (0x6040, 0x3F),
+        (0x6040, 0x2F),
+    ]
+
+
+def test_push_setpoint_waits_for_free_buffer(moving_controller):
+    mod, fake_accessor, c = moving_controller
+
+    result, writes = _push(
+        fake_accessor, c, 100, status=(0x1000, 0x1000, 0x0000, 0x1000)
+    )
+    assert result["skipped"] is False
+    assert fake_accessor._status_i == 4
+    assert writes[-2:] == [(0x6040, 0x3F), (0x6040, 0x2F)]
+
+
+def test_push_setpoint_timeout_and_fault(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.setpoint_ack_timeout = 0.02
+
+    with pytest.raises(Exception, match="timeout"):
+        _push(fake_accessor, c, 100, status=(0x0000,))
+    assert 1 not in c._commanded_target
+
+    with pytest.raises(Exception, match="fault"):
+        _push(fake_accessor, c, 100, status=(0x0008,))
+    assert c._od_shadow.get(1) is None
+
+
+def test_setpoint_stream_stats_and_settle(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    stream = c.setpoint_stream(1, vel=2)
+
+    async def _scenario():
+        for target in (100, 100, 200):
+            fake_accessor._status_sequence = [0x0000, 0x1000]
+            fake_accessor._status_i = 0
+            await stream.push(target)
+        fake_accessor._status_sequence = [0x1000, 0x1400]
+        fake_accessor._status_i = 0
+        await stream.settle(timeout=1.0)
+
+    asyncio.run(_scenario())
+    assert (stream.pushed, stream.skipped) == (2, 1)
+    assert stream.mean_ack_time >= 0.0
+    assert fake_accessor._status_i == 2
+
+
+def test_setpoint_stream_close(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    idle = c.setpoint_stream(1, vel=2)
+    stream = c.setpoint_stream(1, vel=2)
+
+    async def _scenario():
+        # push가 없던 stream은 drive를 기다리지 않음
+        assert await idle.close() is None
+        await stream.push(100)
+        fake_accessor._status_sequence = [0x1000, 0x1400]
+        fake_accessor._status_i = 0
+        assert await stream.close(timeout=1.0) >= 0.0
+        with pytest.raises(RuntimeError, match="closed"):
+            await stream.push(200)
+
+    fake_accessor._status_sequence = [0x0027, 0x1027]
+    fake_accessor._status_i = 0
+    asyncio.run(_scenario())
+    assert stream.closed and stream.pushed == 1
+    assert fake_accessor._status_i == 2
+
+
+def test_move_times_out_stops_and_invalidates(moving_controller, monkeypatch):
+    mod, fake_accessor, c = moving_controller
+    c.move_timeout_min = 0.05
+    c.move_timeout_margin = 0.0
+    stops = []
+    monkeypatch.setattr(c, "stop_motor", lambda motor_id: stops.append(motor_id))
+
+    fake_accessor._status_sequence = [0x0000]  # 0x1400이 오지 않음
+    fake_accessor._status_i = 0
+    with pytest.raises(TimeoutError, match="not completed"):
+        c.move_motor(1, pos=100, vel=2)
+
+    assert stops == [1]
+    assert c._od_shadow.get(1) is None
+    assert 1 not in c._commanded_target
+    assert c._active_moves == {}
+
+
+def test_reconnect_invalidates_shadow(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    _move(fake_accessor, c, 100, 2)
+
+    c.disconnect(1)
+    c.connect(1)
+    assert len(_move(fake_accessor, c, 100, 2)) == 7
+
+
+def test_fault_during_move_invalidates_shadow_and_raises(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    _move(fake_accessor, c, 100, 2)
+
+    fake_accessor._status_sequence = [0x0008]
+    fake_accessor._status_i = 0
+    with pytest.raises(Exception, match="fault"):
+        c.move_motor(1, pos=100, vel=2)
+    assert c._od_shadow.get(1) is None
+    assert len(_move(fake_accessor, c, 100, 2)) == 7
+
+
+def test_stop_always_writes_and_forces_full_enable(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    _move(fake_accessor, c, 100, 2)
+
+    for _ in range(2):
+        fake_accessor._status_sequence = [0x0040]
+        fake_accessor._status_i = 0
+        fake_accessor.write_calls.clear()
+        c.stop_motor(1)
+        assert [call[1] for call in fake_accessor.write_calls] == [0x1F, 0x01]
+
+    # stop 이후에는 drive가 enable 상태가 아니므로 6/7/F 전체 시퀀스
+    assert _move(fake_accessor, c, 100, 2)[-4:] == [
+        (0x6040, 6),
+        (0x6040, 7),
+        (0x6040, 0xF),
+        (0x6040, 0x5F),
+    ]
+
+
+def test_failed_write_is_not_shadowed(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    orig_write = fake_accessor.writeNumber
+
+    def failing_velocity(handle, value, od_index, bits):
+        orig_write(handle, value, od_index, bits)
+        if od_index.idx == 0x6081:
+            return FakeResult(error="WRITE_FAIL")
+        return FakeResult(result=True)
+
+    fake_accessor.writeNumber = failing_velocity
+    _move(fake_accessor, c, 100, 2)
+    assert (0x6081, 2) in _move(fake_accessor, c, 100, 2)
+
+
+def test_out_of_range_target_is_rejected_before_write(moving_controller):
+    mod, fake_accessor, c = moving_controller
+
+    with pytest.raises(ValueError, match="Target position"):
+        _move(fake_accessor, c, 2**31, 2)
+    assert all(call[2] != 0x607A for call in fake_accessor.write_calls)
+
+
+def test_motion_loops_reuse_prebuilt_od_index(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    seen = []
+    orig_read = fake_accessor.readNumber
+
+    def recording_read(handle, od_index):
+        seen.append(od_index)
+        return orig_read(handle, od_index)
+
+    fake_accessor.readNumber = recording_read
+    fake_accessor._status_sequence = [0x0000, 0x0000, 0x1400]
+    fake_accessor._status_i = 0
+    c.move_motor(1, pos=100, vel=2)
+
+    statusword_reads = [o for o in seen if o.idx == 0x6041]
+    assert len(statusword_reads) == 3
+    assert all(o is c._od_statusword.od_index for o in statusword_reads)
+
+
+# -------------------------
+# telemetry snapshot
+# -------------------------
+@pytest.fixture
+def telemetry_controller(controller_factory, config_file, monkeypatch):
+    import kspec_adc_controller.adc_telemetry as telemetry_mod
+
+    mod, fake_accessor, make_controller = controller_factory
+    monkeypatch.setattr(telemetry_mod, "AdcLogger", lambda *_a, **_kw: DummyLogger())
+    c = make_controller(config=config_file)
+    for motor, handle in ((1, "H1"), (2, "H2")):
+        c.devices[motor]["handle"] = handle
+        c.devices[motor]["connected"] = True
+        fake_accessor.check_conn_state[handle] = True
+    fake_accessor.positions.update({"H1": 100, "H2": 200})
+    fake_accessor._status_sequence = [0x1237]
+    fake_accessor._status_i = 0
+    c.telemetry = telemetry_mod.TelemetryPoller(c._read_telemetry)
+    c.telemetry.poll_once()
+    return mod, fake_accessor, c
+
+
+def test_device_state_answers_from_snapshot(telemetry_controller):
+    mod, fake_accessor, c = telemetry_controller
+    fake_accessor.positions["H1"] = 111
+
+    res = c.device_state(0)
+    assert res["motor1"] == {"position_state": 100, "connection_state": True}
+    assert c.telemetry.get(1).statusword == 0x1237
+
+    # max_staleness=0 이면 항상 live read
+    assert c.device_state(1, max_staleness=0)["motor1"]["position_state"] == 111
+
+
+def test_device_state_falls_back_to_live_read_when_stale(
+    telemetry_controller, monkeypatch
+):
+    mod, fake_accessor, c = telemetry_controller
+    fake_accessor.positions["H2"] = 222
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10.0)
+
+    assert c.device_state(2)["motor2"]["position_state"] == 222
+
+
+def test_move_invalidates_snapshot(telemetry_controller, monkeypatch):
+    mod, fake_accessor, c = telemetry_controller
+    monkeypatch.setattr(mod.asyncio, "sleep", _no_sleep)
+    fake_accessor._status_sequence = [0x1400]
+    fake_accessor._status_i = 0
+
+    c.move_motor(1, pos=50, vel=2)
+    fake_accessor.positions["H1"] = 150
+    assert c.telemetry.get(1) is None
+    assert c.device_state(1)["motor1"]["position_state"] == 150
+    assert c.telemetry.get(2) is not None
+
+
+def test_start_and_stop_telemetry(telemetry_controller):
+    mod, fake_accessor, c = telemetry_controller
+
+    c.start_telemetry(interval=0.01, max_staleness=0.5)
+    assert c.telemetry.running
+    assert c.telemetry_max_staleness == 0.5
+    c.stop_telemetry()
+    assert c.telemetry is None
+
+
+def test_telemetry_settings_from_config(controller_factory, tmp_path):
+    mod, _fake_accessor, make_controller = controller_factory
+    c = make_controller(config=str(tmp_path / "missing.json"))
+    assert c.telemetry_autostart is True and c.telemetry_interval == 0.2
+
+    config = tmp_path / "adc_config.json"
+    config.write_text(
+        json.dumps({"telemetry_autostart": False, "telemetry_interval": 0.05}),
+        encoding="utf-8",
+    )
+    c = make_controller(config=str(config))
+    assert c.telemetry_autostart is False
+    c.start_telemetry()
+    assert c.telemetry.interval == 0.05
+    c.stop_telemetry()
+
+
+def test_move_records_polled_statuswords(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    fake_accessor._status_sequence = [0x0000, 0x1400]
+    fake_accessor._status_i = 0
+
+    c.move_motor(1, pos=300, vel=2)
+
+    snap = c.recorder.snapshot(motor_id=1)
+    assert snap["statusword"].tolist() == [0x0000, 0x1400]
+    assert (snap["target"] == 300).all()  # read_motor_position == 0 이므로 0 + 300
+    assert (snap["position"] == mod.NO_VALUE).all()
+
+
+def test_telemetry_poll_records_full_sample(telemetry_controller):
+    mod, fake_accessor, c = telemetry_controller
+
+    snap = c.recorder.snapshot()
+    assert snap["motor_id"].tolist() == [1, 2]
+    assert snap["position"].tolist() == [100, 200]
+    assert snap["statusword"].tolist() == [0x1237, 0x1237]
+
+
+def test_bus_calls_go_through_executor(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.bus.reset_metrics()
+
+    _move(fake_accessor, c, 100, 2)
+
+    m = c.bus.metrics()
+    # set-up transaction + statusword poll + final position read
+    assert m["completed"] == m["submitted"] == 3
+    assert m["queue_depth"] == 0
+
+
+def test_stop_measures_latency_and_runs_at_stop_priority(
+    controller_factory, logger, config_file, monkeypatch
+):
+    mod, fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+    c.devices[1]["handle"] = "H1"
+    c.devices[1]["connected"] = True
+    monkeypatch.setattr(mod.time, "sleep", lambda *_: None)
+    fake_accessor._status_sequence = [0x0000, 0x0040]
+    fake_accessor._status_i = 0
+    c.bus.reset_metrics()
+
+    res = c.stop_motor(1, requested_at=time.monotonic() - 0.5)
+
+    assert res["status"] == "success"
+    assert 0.5 <= res["latency"]["command"] <= res["latency"]["confirm"]
+    assert any("SLO" in m for m in logger.warnings)  # 0.5 s > stop_command_slo
+    by_priority = c.bus.metrics()["by_priority"]
+    assert by_priority["stop"]["completed"] == 4  # controlword x2 + statusword x2
+    assert by_priority["motion"]["completed"] == 0
+
+    stats = c.stop_latency_stats()
+    assert stats["count"] == 1 and stats["timeouts"] == 0
+    assert stats["command"]["max"] == res["latency"]["command"]
+
+
+def test_stop_timeout_is_logged_without_confirm_latency(
+    controller_factory, logger, config_file, monkeypatch
+):
+    mod, fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+    c.devices[1]["handle"] = "H1"
+    c.devices[1]["connected"] = True
+    fake_accessor._status_sequence = [0x0001]
+    fake_accessor._status_i = 0
+
+    res = c.stop_motor(1, timeout_s=0.0)
+
+    assert res["status"] == "failed"
+    assert res["latency"]["confirm"] is None
+    stats = c.stop_latency_stats()
+    assert stats["timeouts"] == 1 and stats["confirm"] is None
+    assert not any("SLO" in m for m in logger.warnings)
+
+
+def test_move_polls_run_at_poll_priority(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.bus.reset_metrics()
+
+    _move(fake_accessor, c, 100, 2)
+
+    by_priority = c.bus.metrics()["by_priority"]
+    assert by_priority["poll"]["completed"] == 1  # statusword
+    assert by_priority["motion"]["completed"] == 2
+
+
+# -------------------------
+# async motion API
+# -------------------------
+def _stop_confirms_on_disable(fake_accessor):
+    """controlword 0x01이 써지면 statusword가 0x0040(stop 확인)으로 바뀜"""
+    orig_write = fake_accessor.writeNumber
+
+    def write(handle, value, od_index, bits):
+        if od_index.idx == 0x6040 and value == 0x01:
+            fake_accessor._status_sequence = [0x0040]
+            fake_accessor._status_i = 0
+        return orig_write(handle, value, od_index, bits)
+
+    fake_accessor.writeNumber = write
+
+
+async def _wait_for_state(handle, state):
+    for _ in range(500):
+        if handle.state == state:
+            return
+        await _real_sleep(0.001)
+    raise AssertionError(f"handle never reached {state}: {handle!r}")
+
+
+@pytest.mark.asyncio
+async def test_move_returns_awaitable_handle_with_progress(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    fake_accessor._status_sequence = [0x0000, 0x1400]
+    fake_accessor._status_i = 0
+
+    handle = c.move(1, 300, 2)
+    assert handle.progress()["state"] == "setup"
+    res = await handle
+
+    assert handle.done() and handle.result() is res
+    assert res["move_time"] >= 0 and res["predicted_time"] > 0
+    progress = handle.progress()
+    assert progress["state"] == "done" and progress["fraction"] == 1.0
+    assert progress["statusword"] == 0x1400
+    assert c._active_moves == {}
+
+
+@pytest.mark.asyncio
+async def test_cancel_issues_stop_and_resolves(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    fake_accessor._status_sequence = [0x0000]
+    fake_accessor._status_i = 0
+    _stop_confirms_on_disable(fake_accessor)
+
+    handle = c.move(1, 300, 2)
+    await _wait_for_state(handle, "moving")
+    assert handle.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await handle
+
+    assert handle.cancelled() and handle.state == "cancelled"
+    controlwords = [call[1] for call in fake_accessor.write_calls if call[2] == 0x6040]
+    assert controlwords[-2:] == [0x1F, 0x01]
+    assert c.stop_latency_log[-1]["confirm"] is not None
+    assert not handle.cancel()
+
+
+@pytest.mark.asyncio
+async def test_external_stop_interrupts_move(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    fake_accessor._status_sequence = [0x0000]
+    fake_accessor._status_i = 0
+    _stop_confirms_on_disable(fake_accessor)
+
+    handle = c.move(1, 300, 2)
+    await _wait_for_state(handle, "moving")
+    stop = await c.bus.run(c.stop_motor, 1)
+
+    with pytest.raises(mod.MotionInterrupted):
+        await handle
+    assert stop["status"] == "success"
+    # stop은 한 번만 전송됨
+    controlwords = [call[1] for call in fake_accessor.write_calls if call[2] == 0x6040]
+    assert controlwords.count(0x1F) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_setup_reaches_bus_skips_stop(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    fake_accessor.write_calls.clear()
+    gate = threading.Event()
+    blocker = c.bus.submit(gate.wait)  # bus worker를 잠시 막아 둠
+
+    handle = c.move(1, 300, 2)
+    await _real_sleep(0.01)
+    handle.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await handle  # set-up이 아직 queue에 있으므로 worker 없이 끝남
+    gate.set()
+    blocker.result(timeout=2)
+
+    assert fake_accessor.write_calls == []
+
+
+@pytest.mark.asyncio
+async def test_move_not_connected_raises_on_await(moving_controller):
+    mod, fake_accessor, c = moving_controller
+    c.devices[2]["connected"] = False
+
+    handle = c.move(2, 100, 1)
+    with pytest.raises(Exception, match="not connected"):
+        await handle
+
+
+# -------------------------
+# device topology cache
+# -------------------------
+def test_scan_writes_topology_cache_and_logs_timing(
+    controller_factory, logger, config_file, topology_path
+):
+    mod, fake_accessor, make_controller = controller_factory
+    c = make_controller(config=config_file)
+
+    c.find_devices()
+
+    assert "scan" in fake_accessor.calls
+    data = json.loads(topology_path.read_text())
+    assert data["selected_bus_index"] == 0
+    assert data["bus"]["hardware_specifier"] == "BUS0"
+    assert [d["description"] for d in data["devices"]] == ["DEV0", "DEV1"]
+    assert c.startup_timings["source"] == "scan"
+    assert set(c.startup_timings) >= {"list_bus", "open_bus", "scan", "add_devices"}
+    assert any(m.startswith("Startup timing (scan):") for m in logger.infos)
+
+
+def test_cached_topology_skips_list_and_scan(
+    controller_factory, logger, config_file, topology_path
+):
+    mod, fake_accessor, make_controller = controller_factory
+    make_controller(config=config_file).find_devices()
+    fake_accessor.calls.clear()
+
+    c = make_controller(config=config_file)
+    c.find_devices()
+
+    assert fake_accessor.calls == [
+        ("open", "BUS0"),
+        ("add", "DEV0"),
+        ("add", "DEV1"),
+    ]
+    assert c.devices[1]["handle"] == "H1" and c.devices[2]["handle"] == "H2"
+    # 검증을 위해 연결했던 device는 다시 끊어 둠
+    assert fake_accessor.connected_handles == set()
+    assert c.startup_timings["source"] == "cache"
+    assert "verify" in c.startup_timings
+    assert any(m.startswith("Startup timing (cache):") for m in logger.infos)
+
+
+def test_before_open_gets_port_before_the_bus_is_opened(
+    controller_factory, config_file, topology_path
+):
+    mod, fake_accessor, make_controller = controller_factory
+    opened = []
+
+    def _before_open(port):
+        opened.append((port, list(fake_accessor.calls)))
+
+    make_controller(config=config_file).find_devices(before_open=_before_open)
+    fake_accessor.calls.clear()
+    make_controller(config=config_file).find_devices(before_open=_before_open)
+
+    # scan과 cache 경로 모두 open 직전에 호출
+    assert [port for port, _ in opened] == ["BUS0", "BUS0"]
+    assert ("open", "BUS0") not in opened[0][1]
+    assert opened[1][1] == []
+
+
+def test_failed_verification_falls_back_to_scan(
+    controller_factory, logger, config_file, topology_path
+):
+    mod, fake_accessor, make_controller = controller_factory
+    make_controller(config=config_file).find_devices()
+    fake_accessor.calls.clear()
+    fake_accessor.read_error = "NO_RESPONSE"
+
+    c = make_controller(config=config_file)
+    c.find_devices()
+
+    assert "list" in fake_accessor.calls and "scan" in fake_accessor.calls
+    assert fake_accessor.removed_handles == ["H1", "H2"]
+    assert c.startup_timings["source"] == "scan"
+    assert any("falling back to a full bus scan" in m for m in logger.warnings)
+
+
+def test_cache_for_other_bus_or_disabled_is_ignored(
+    controller_factory, config_file, topology_path
+):
+    mod, fake_accessor, make_controller = controller_factory
+    make_controller(config=config_file).find_devices()
+    fake_accessor.calls.clear()
+
+    c = make_controller(config=config_file)
+    c.find_devices(use_cache=False)
+    assert "scan" in fake_accessor.calls
+
+    fake_accessor.calls.clear()
+    c = make_controller(config=config_file)
+    c.selected_bus_index = 1
+    c.find_devices()
+    assert "scan" in fake_accessor.calls
+    assert json.loads(topology_path.read_text())["selected_bus_index"] == 1
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from kspec_adc_controller.adc_ephemeris import (
+    days_since_j2000,
+    local_sidereal_time,
+    tracking_schedule,
+    zenith_distance,
+    zenith_distance_at,
+)
+
+
+def test_days_since_j2000_accepts_datetime64_and_unix():
+    t = np.datetime64("2000-01-02T12:00:00")
+    assert days_since_j2000(t) == pytest.approx(1.0)
+    assert days_since_j2000(946728000.0 + 43200.0) == pytest.approx(0.5)
+
+
+def test_local_sidereal_time_matches_meeus_example():
+    # Meeus, Astronomical Algorithms, Example 12.a/12.b
+    utc = np.array(
+        ["1987-04-10T00:00:00", "1987-04-10T19:21:00"], dtype="datetime64[s]"
+    )
+    lst = local_sidereal_time(utc, 0.0)
+    assert lst == pytest.approx([197.693195, 128.7378734], abs=1e-6)
+    assert local_sidereal_time(utc[0], -90.0) == pytest.approx(107.693195, abs=1e-6)
+
+
+def test_zenith_distance_geometry():
+    # 천정 통과 / 천구 북극 / 지평선 아래
+    assert zenith_distance(10.0, 35.0, 35.0, 10.0) == pytest.approx(0.0, abs=1e-6)
+    assert zenith_distance(123.0, 90.0, 30.0, 0.0) == pytest.approx(60.0)
+    assert zenith_distance(0.0, 0.0, 0.0, 180.0) == pytest.approx(180.0)
+
+    lst = np.linspace(0, 360, 73)
+    za = zenith_distance(0.0, -20.0, -30.0, lst)
+    assert za.shape == lst.shape
+    assert za.min() == pytest.approx(10.0)
+
+
+def test_zenith_distance_at_transit():
+    utc = np.array(["1987-04-10T00:00:00"], dtype="datetime64[s]")
+    za = zenith_distance_at(197.693195, -30.0, -30.0, 0.0, utc)
+    assert za[0] == pytest.approx(0.0, abs=1e-4)
+
+
+class FakeCalc:
+    za_min = 0.0
+    za_max = 60.0
+
+    def za_to_counts(self, za, dtype=np.int64, rounding="trunc"):
+        return None, np.trunc(-np.asarray(za) * 45).astype(dtype)
+
+
+def test_tracking_schedule_keeps_samples_in_table_range():
+    utc = 1.7e9 + np.arange(0, 86400, 600.0)
+    times, za, counts = tracking_schedule(FakeCalc(), 0.0, -30.0, -30.0, 0.0, utc)
+
+    expected = zenith_distance_at(0.0, -30.0, -30.0, 0.0, utc)
+    mask = expected <= 60.0
+    assert 0 < mask.sum() < len(utc)
+    assert np.array_equal(times, utc[mask])
+    assert np.allclose(za, expected[mask])
+    assert np.array_equal(counts, np.trunc(-expected[mask] * 45).astype(np.int64))
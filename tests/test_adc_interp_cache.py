@@ -0,0 +1,50 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from kspec_adc_controller.adc_interp_cache import InterpCache, lookup_table_digest
+
+
+def test_lookup_table_digest_matches_sha256(tmp_path):
+    p = tmp_path / "table.csv"
+    p.write_bytes(b"0,0\n10,20\n")
+
+    assert lookup_table_digest(str(p)) == hashlib.sha256(b"0,0\n10,20\n").hexdigest()
+
+
+def test_default_cache_dir_used_when_none(monkeypatch, tmp_path):
+    monkeypatch.setenv("KSPEC_ADC_CACHE_DIR", str(tmp_path))
+    cache = InterpCache()
+    assert cache.cache_dir == str(tmp_path / "interp")
+
+
+def test_load_missing_entry_returns_none(tmp_path):
+    cache = InterpCache(str(tmp_path))
+    assert cache.load("abc", "pchip") is None
+
+
+def test_store_and_load_roundtrip_is_memory_mapped(tmp_path):
+    cache = InterpCache(str(tmp_path / "nested"))
+    x = np.array([0.0, 1.0, 2.0])
+    c = np.arange(8, dtype=float).reshape(4, 2)
+
+    cache.store("abc", "pchip", x, c)
+    loaded_x, loaded_c = cache.load("abc", "pchip")
+
+    assert isinstance(loaded_x, np.memmap)
+    assert isinstance(loaded_c, np.memmap)
+    assert np.array_equal(loaded_x, x)
+    assert np.array_equal(loaded_c, c)
+    # 다른 method는 별도 entry
+    assert cache.load("abc", "cubic") is None
+    # 임시 파일이 남지 않아야 함
+    assert not [p for p in (tmp_path / "nested").iterdir() if p.suffix == ".tmp"]
+
+
+def test_load_corrupt_entry_raises(tmp_path):
+    cache = InterpCache(str(tmp_path))
+    cache.store("abc", "pchip", np.array([0.0, 1.0]), np.zeros((4, 3)))
+
+    with pytest.raises(ValueError):
+        cache.load("abc", "pchip")
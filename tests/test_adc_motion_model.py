@@ -0,0 +1,123 @@
+import json
+
+import numpy as np
+import pytest
+
+from kspec_adc_controller.adc_motion_model import MIN_SAMPLES, MotionTimeModel
+
+
+def trapezoid(distance, vel, overhead=0.2, accel=2.0):
+    # counts/RPM 단위 cruise 계수 1/270 (16200 counts/rev)
+    return overhead + abs(distance) / vel / 270.0 + vel / accel
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "motion_model.json")
+
+
+def test_untrained_model_returns_none(path):
+    model = MotionTimeModel(path)
+
+    assert model.predict(1, 1000, 1) is None
+    assert model.predict(1, 0, 1) == 0.0
+    for _ in range(MIN_SAMPLES - 1):
+        model.update(1, 1000, 1, 4.0)
+    assert model.predict(1, 1000, 1) is None
+
+
+def test_fit_recovers_trapezoid_timing(path):
+    model = MotionTimeModel(path)
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        d = int(rng.integers(-20000, 20000))
+        v = float(rng.choice([1, 2, 3, 5]))
+        model.update(1, d, v, trapezoid(d, v))
+
+    assert model.n_samples(1) == 50
+    assert model.predict(1, 8100, 3) == pytest.approx(trapezoid(8100, 3))
+    assert np.allclose(model.coefficients(1), [0.2, 1 / 270.0, 0.5])
+    assert model.predict(2, 8100, 3) is None  # motor별로 독립
+
+
+def test_model_persists_across_instances(path):
+    model = MotionTimeModel(path)
+    for d, v in [(1000, 1), (2000, 1), (5000, 2), (800, 3), (12000, 5), (300, 2)]:
+        model.update(2, d, v, trapezoid(d, v))
+    model.flush()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["motors"]["2"]["n"] == 6
+
+    reloaded = MotionTimeModel(path)
+    assert reloaded.n_samples(2) == 6
+    assert reloaded.predict(2, 4000, 2) == pytest.approx(model.predict(2, 4000, 2))
+
+
+def test_autosave_disabled_writes_nothing(path):
+    model = MotionTimeModel(path, autosave=False)
+    model.update(1, 1000, 1, 4.0)
+
+    import os
+
+    assert not os.path.exists(path)
+    model.save()
+    assert MotionTimeModel(path).n_samples(1) == 1
+
+
+def test_corrupt_model_raises_unless_not_loaded(path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    with pytest.raises(ValueError):
+        MotionTimeModel(path)
+    assert MotionTimeModel(path, load=False).n_samples(1) == 0
+
+
+def test_autosave_is_debounced_and_off_thread(path, monkeypatch):
+    import threading
+
+    model = MotionTimeModel(path, save_interval=3600)
+    writers = []
+    orig_write = model._write
+
+    def recording_write():
+        writers.append(threading.current_thread().name)
+        orig_write()
+
+    monkeypatch.setattr(model, "_write", recording_write)
+    model.update(1, 1000, 1, 4.0)
+    model._save_thread.join()
+    for d in (2000, 3000):
+        model.update(1, d, 1, 4.0)
+
+    # 첫 update만 background thread에서 저장, 나머지는 interval 안이라 보류
+    assert writers == ["adc-motion-model-save"]
+    assert MotionTimeModel(path).n_samples(1) == 1
+
+    model.flush()
+    assert len(writers) == 2
+    assert MotionTimeModel(path).n_samples(1) == 3
+    model.flush()
+    assert len(writers) == 2  # 변경이 없으면 쓰지 않음
+
+
+def test_failed_autosave_is_kept_for_flush(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    model = MotionTimeModel(str(blocker / "model.json"))  # 디렉터리 생성 불가
+    model.update(1, 1000, 1, 4.0)
+    model._save_thread.join()
+
+    assert isinstance(model.save_error, OSError)
+    with pytest.raises(OSError):
+        model.flush()
+
+
+def test_default_path_is_user_cache(monkeypatch, tmp_path):
+    import kspec_adc_controller.adc_motion_model as motion_mod
+
+    monkeypatch.setenv("KSPEC_ADC_CACHE_DIR", str(tmp_path / "adc"))
+    assert motion_mod._get_default_model_path() == str(
+        tmp_path / "adc" / "motion_model.json"
+    )
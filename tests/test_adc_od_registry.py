@@ -0,0 +1,75 @@
+import pytest
+
+from kspec_adc_controller.adc_od_registry import OdRegistry
+
+
+class FakeOdIndex:
+    def __init__(self, idx, sub):
+        self.idx = idx
+        self.sub = sub
+
+
+def test_default_registry_has_motion_entries():
+    od = OdRegistry(od_index_factory=FakeOdIndex)
+
+    controlword = od.require(0x6040, 0x00, "w")
+    assert controlword.bits == 16
+    assert controlword.data_type == "UNSIGNED16"
+    assert (controlword.od_index.idx, controlword.od_index.sub) == (0x6040, 0x00)
+
+    assert od.require(0x6060, 0x00, "w").bits == 8
+    assert od.require(0x607A, 0x00, "w").data_type == "INTEGER32"
+    assert od.require(0x6081, 0x00, "w").bits == 32
+    assert od.require(0x6064, 0x00, "r").access == "ro"
+    assert od.require(0x3240, 0x05, "r").od_index.sub == 5
+    # record header (DataType 없음)은 entry가 아님
+    assert (0x6099, 0x00) not in od
+    assert (0x5FFC, 0x16) in od
+
+
+def test_od_index_is_built_once():
+    calls = []
+
+    def factory(idx, sub):
+        calls.append((idx, sub))
+        return FakeOdIndex(idx, sub)
+
+    od = OdRegistry(od_index_factory=factory)
+    n_calls = len(calls)
+    entry = od.require(0x6041, 0x00, "r")
+
+    assert od.require(0x6041, 0x00, "r").od_index is entry.od_index
+    assert len(calls) == n_calls == len(od)
+
+
+def test_access_rights_are_checked():
+    od = OdRegistry()
+
+    with pytest.raises(PermissionError):
+        od.require(0x6041, 0x00, "w")
+    with pytest.raises(PermissionError):
+        od.require(0x6064, 0x00, "rw")
+    with pytest.raises(KeyError):
+        od.require(0x1234, 0x00)
+
+
+def test_value_range_follows_data_type():
+    od = OdRegistry()
+
+    od.entry(0x607A).check_value(-(2**31))
+    with pytest.raises(ValueError):
+        od.entry(0x607A).check_value(2**31)
+    with pytest.raises(ValueError):
+        od.entry(0x6081).check_value(-1)
+    with pytest.raises(ValueError):
+        od.entry(0x6040).check_value(0x10000)
+
+
+def test_invalid_files_raise_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        OdRegistry([str(tmp_path / "missing.txt")])
+
+    bad = tmp_path / "bad.txt"
+    bad.write_text("[6040]\nParameterName=Controlword\nDataType=0x0009\n")
+    with pytest.raises(ValueError, match="Unsupported data type"):
+        OdRegistry([str(bad)])
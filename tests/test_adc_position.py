@@ -0,0 +1,56 @@
+import pytest
+
+from kspec_adc_controller.adc_position import (
+    COUNTS_PER_REV,
+    shortest_delta,
+    unwrap_position,
+    wrap_position,
+)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (0, 0),
+        (1234, 1234),
+        (2**31 - 1, 2**31 - 1),
+        (2**31, -(2**31)),
+        (2**32 - 25, -25),
+        (-25, -25),
+    ],
+)
+def test_unwrap_position(raw, expected):
+    assert unwrap_position(raw) == expected
+
+
+def test_wrap_position():
+    assert wrap_position(COUNTS_PER_REV + 5) == 5
+    assert wrap_position(2**32 - 25) == COUNTS_PER_REV - 25
+
+
+@pytest.mark.parametrize(
+    "current, target, expected",
+    [
+        (0, 100, 100),
+        (100, 0, -100),
+        (0, 9000, 9000 - COUNTS_PER_REV),  # 반 바퀴 넘으면 반대 방향
+        (0, -9000, COUNTS_PER_REV - 9000),
+        (0, COUNTS_PER_REV // 2, COUNTS_PER_REV // 2),  # tie는 + 방향
+        (2**32 - 25, 1775, 1800),  # wrap된 raw 위치
+        (5 * COUNTS_PER_REV + 10, 20, 10),  # 여러 바퀴 돈 위치
+        (42, 42 + 3 * COUNTS_PER_REV, 0),
+    ],
+)
+def test_shortest_delta(current, target, expected):
+    assert shortest_delta(current, target) == expected
+    assert abs(shortest_delta(current, target)) <= COUNTS_PER_REV // 2
+
+
+def test_shortest_delta_preferred_direction():
+    assert shortest_delta(100, 0, direction=1) == COUNTS_PER_REV - 100
+    assert shortest_delta(0, 100, direction=-1) == 100 - COUNTS_PER_REV
+    assert shortest_delta(0, 100, direction=1) == 100
+    assert shortest_delta(7, 7, direction=-1) == 0
+
+    with pytest.raises(ValueError):
+        shortest_delta(0, 100, direction=2)
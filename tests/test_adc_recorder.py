@@ -0,0 +1,137 @@
+import threading
+
+import numpy as np
+import pytest
+
+from kspec_adc_controller.adc_recorder import (
+    NO_VALUE,
+    RECORD_DTYPE,
+    TelemetryRecorder,
+    load_chunks,
+)
+
+
+def _fill(rec, n, start=0):
+    for k in range(start, start + n):
+        rec.append(float(k), 1 + k % 2, 10 * k, 0x1237, 1000)
+
+
+def test_snapshot_is_chronological_before_and_after_wrap():
+    rec = TelemetryRecorder(capacity=8, chunk_size=4)
+    _fill(rec, 5)
+    snap = rec.snapshot()
+    assert snap.dtype == RECORD_DTYPE
+    assert snap["timestamp"].tolist() == [0, 1, 2, 3, 4]
+
+    _fill(rec, 6, start=5)
+    snap = rec.snapshot()
+    assert len(rec) == 8 and rec.total == 11
+    assert snap["timestamp"].tolist() == list(range(3, 11))
+    assert snap["position"].tolist() == [10 * k for k in range(3, 11)]
+
+
+def test_snapshot_window_and_motor_filter():
+    rec = TelemetryRecorder(capacity=16, chunk_size=4)
+    _fill(rec, 10)
+
+    snap = rec.snapshot(t_start=2, t_end=6, motor_id=1)
+    assert snap["timestamp"].tolist() == [2, 4, 6]
+    assert (snap["motor_id"] == 1).all()
+
+
+def test_snapshot_is_a_copy():
+    rec = TelemetryRecorder(capacity=4, chunk_size=4)
+    _fill(rec, 2)
+    snap = rec.snapshot()
+    snap["position"][:] = -1
+    assert rec.snapshot()["position"].tolist() == [0, 10]
+
+
+def test_append_does_not_reallocate_buffer():
+    rec = TelemetryRecorder(capacity=4, chunk_size=2)
+    buf = rec._buf
+    _fill(rec, 9)
+    assert rec._buf is buf
+    assert np.shares_memory(rec._position, buf)
+
+
+def test_full_chunks_are_flushed_to_npy(tmp_path):
+    rec = TelemetryRecorder(capacity=8, chunk_dir=str(tmp_path), chunk_size=4)
+    _fill(rec, 10)  # 4개짜리 chunk 2개 + 버퍼에만 남은 2개
+    rec.flush()
+
+    assert rec.chunks_written == 2
+    assert len(list(tmp_path.glob("adc_*.npy"))) == 2
+    data = load_chunks(str(tmp_path))
+    assert data.dtype == RECORD_DTYPE
+    assert data["timestamp"].tolist() == list(range(8))
+
+    _fill(rec, 8, start=10)  # wrap 이후에도 순서 유지
+    rec.close()
+    assert load_chunks(str(tmp_path))["timestamp"].tolist() == list(range(16))
+
+
+def test_append_does_not_write_to_disk(tmp_path, monkeypatch):
+    rec = TelemetryRecorder(capacity=8, chunk_dir=str(tmp_path), chunk_size=4)
+    writer_threads = []
+    write_chunk = rec._write_chunk
+
+    def _recording_write(index, data):
+        writer_threads.append(threading.current_thread().name)
+        write_chunk(index, data)
+
+    monkeypatch.setattr(rec, "_write_chunk", _recording_write)
+    _fill(rec, 8)
+    rec.close()
+
+    assert writer_threads == ["adc-recorder-writer"] * 2
+    assert rec.chunks_written == 2
+
+
+def test_new_recorder_continues_chunk_numbering(tmp_path):
+    first = TelemetryRecorder(capacity=8, chunk_dir=str(tmp_path), chunk_size=4)
+    _fill(first, 8)
+    first.close()
+
+    # 재시작: 같은 chunk_dir에 이전 session의 chunk를 덮어쓰지 않음
+    second = TelemetryRecorder(capacity=8, chunk_dir=str(tmp_path), chunk_size=4)
+    _fill(second, 4, start=100)
+    second.close()
+
+    names = sorted(p.name for p in tmp_path.glob("adc_*.npy"))
+    assert names == ["adc_000000.npy", "adc_000001.npy", "adc_000002.npy"]
+    assert load_chunks(str(tmp_path))["timestamp"].tolist() == list(range(8)) + [
+        100,
+        101,
+        102,
+        103,
+    ]
+
+
+def test_failed_chunk_write_is_reported(tmp_path, monkeypatch):
+    rec = TelemetryRecorder(capacity=4, chunk_dir=str(tmp_path), chunk_size=4)
+
+    def _fail(index, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rec, "_write_chunk", _fail)
+    _fill(rec, 4)
+    with pytest.raises(OSError, match="disk full"):
+        rec.flush()
+    assert rec.chunks_written == 0
+
+
+def test_unknown_values_use_sentinel():
+    rec = TelemetryRecorder(capacity=4, chunk_size=4)
+    rec.append(1.0, 2, NO_VALUE, 0x1400)
+    snap = rec.snapshot()
+    assert snap["position"][0] == NO_VALUE
+    assert snap["target"][0] == NO_VALUE
+
+
+def test_invalid_sizes_raise():
+    with pytest.raises(ValueError):
+        TelemetryRecorder(capacity=10, chunk_size=4)
+    with pytest.raises(ValueError):
+        TelemetryRecorder(capacity=0)
+    assert len(load_chunks("/nonexistent/dir")) == 0
@@ -0,0 +1,224 @@
+import importlib
+import multiprocessing
+
+import pytest
+
+
+class DummyLogger:
+    def __init__(self):
+        self.infos = []
+        self.debugs = []
+        self.errors = []
+        self.warnings = []
+
+    def info(self, msg):
+        self.infos.append(msg)
+
+    def debug(self, msg):
+        self.debugs.append(msg)
+
+    def error(self, msg):
+        self.errors.append(msg)
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+
+class FakeController:
+    def __init__(self, config=None):
+        self.config = config
+        self.port = "/dev/ttyFAKE1" if config is None else "/dev/ttyFAKE2"
+        self.find_devices_raises = None
+        self.telemetry_autostart = True
+        self.calls = []
+
+    def find_devices(self, before_open=None):
+        self.calls.append("find_devices")
+        if before_open is not None:
+            before_open(self.port)
+        if self.find_devices_raises:
+            raise self.find_devices_raises
+
+    def start_telemetry(self):
+        self.calls.append("start_telemetry")
+
+    def stop_telemetry(self):
+        self.calls.append("stop_telemetry")
+
+    def disconnect(self):
+        self.calls.append("disconnect")
+
+    def close(self):
+        self.calls.append("close")
+
+
+@pytest.fixture
+def session_mod(monkeypatch):
+    mod = importlib.import_module("kspec_adc_controller.adc_session")
+    monkeypatch.setattr(mod, "AdcLogger", lambda *_a, **_kw: DummyLogger())
+    return mod
+
+
+@pytest.fixture
+def registry(session_mod, tmp_path):
+    return session_mod.SessionRegistry(lock_dir=str(tmp_path), lock_timeout=0.1)
+
+
+def test_acquire_shares_controller_until_last_release(registry):
+    a = registry.acquire(FakeController)
+    b = registry.acquire(FakeController)
+
+    assert a.controller is b.controller
+    assert a.controller.calls == ["find_devices", "start_telemetry"]
+    assert b.users == 2 and len(registry) == 1
+
+    assert a.release() is False
+    assert a.controller.calls == ["find_devices", "start_telemetry"]
+    assert b.release() is True
+    assert a.controller.calls == [
+        "find_devices",
+        "start_telemetry",
+        "stop_telemetry",
+        "disconnect",
+        "close",
+    ]
+    assert len(registry) == 0
+
+    with pytest.raises(RuntimeError):
+        a.release()
+
+
+def test_sessions_are_keyed_by_config(registry, tmp_path):
+    a = registry.acquire(FakeController)
+    b = registry.acquire(FakeController, config=str(tmp_path / "other.json"))
+
+    assert a.controller is not b.controller
+    assert b.controller.config == str(tmp_path / "other.json")
+    assert len(registry) == 2
+
+
+def test_second_session_on_same_bus_is_busy(session_mod, registry, tmp_path):
+    registry.acquire(FakeController)
+
+    class SameBus(FakeController):
+        def __init__(self, config=None):
+            super().__init__(config)
+            self.port = "/dev/ttyFAKE1"
+
+    with pytest.raises(session_mod.SessionBusyError):
+        registry.acquire(SameBus, config=str(tmp_path / "other.json"))
+    assert len(registry) == 1
+
+
+def test_lock_is_keyed_by_port(session_mod, registry, tmp_path):
+    registry.acquire(FakeController)
+    assert (tmp_path / "bus-dev_ttyFAKE1.lock").exists()
+
+    # 같은 port를 가리키는 link도 같은 lock
+    link = tmp_path / "by-id"
+    link.symlink_to("/dev/ttyFAKE1")
+    assert session_mod._lock_name(str(link)) == "bus-dev_ttyFAKE1.lock"
+    assert session_mod._lock_name("COM3") == "bus-COM3.lock"
+
+
+def test_unwritable_lock_dir_opens_without_lock(session_mod, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    registry = session_mod.SessionRegistry(lock_dir=str(blocker / "locks"))
+
+    lease = registry.acquire(FakeController)
+    assert lease.users == 1
+    assert "without the inter-process lock" in registry.logger.warnings[0]
+    assert lease.release() is True
+
+
+def test_rescan_on_another_port_moves_the_lock(session_mod, registry, tmp_path):
+    class Rescan(FakeController):
+        def find_devices(self, before_open=None):
+            before_open("/dev/ttyFAKE1")  # cached port, verification failed
+            before_open("/dev/ttyFAKE3")
+
+    def _on_port(port):
+        def _factory(config):
+            controller = FakeController(config)
+            controller.port = port
+            return controller
+
+        return _factory
+
+    lease = registry.acquire(Rescan)
+    # 처음 port의 lock은 풀렸으므로 다른 session이 열 수 있음
+    registry.acquire(_on_port("/dev/ttyFAKE1"), config=str(tmp_path / "a.json"))
+    with pytest.raises(session_mod.SessionBusyError):
+        registry.acquire(_on_port("/dev/ttyFAKE3"), config=str(tmp_path / "b.json"))
+    lease.release()
+
+
+def test_telemetry_autostart_can_be_disabled(registry):
+    def _factory():
+        controller = FakeController()
+        controller.telemetry_autostart = False
+        return controller
+
+    lease = registry.acquire(_factory)
+    assert lease.controller.calls == ["find_devices"]
+
+
+def test_failed_open_keeps_no_session(registry):
+    ctrl = FakeController()
+    ctrl.find_devices_raises = RuntimeError("scan fail")
+
+    with pytest.raises(RuntimeError, match="scan fail"):
+        registry.acquire(lambda: ctrl)
+    assert len(registry) == 0
+
+    # bus lock도 풀렸으므로 다시 열 수 있음
+    lease = registry.acquire(FakeController)
+    assert lease.users == 1
+
+
+def test_failed_close_still_drops_session(registry):
+    lease = registry.acquire(FakeController)
+
+    def _fail():
+        raise RuntimeError("close fail")
+
+    lease.controller.close = _fail
+    with pytest.raises(RuntimeError, match="close fail"):
+        lease.release()
+    assert len(registry) == 0
+    assert lease.released
+
+
+def _hold_bus(lock_dir, ready, done):
+    mod = importlib.import_module("kspec_adc_controller.adc_session")
+    mod.AdcLogger = lambda *_a, **_kw: DummyLogger()
+    lease = mod.SessionRegistry(lock_dir=lock_dir).acquire(FakeController)
+    ready.set()
+    done.wait(10)
+    lease.release()
+
+
+@pytest.mark.skipif(
+    importlib.import_module("kspec_adc_controller.adc_session").fcntl is None,
+    reason="flock not available",
+)
+def test_bus_held_by_another_process(session_mod, registry, tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    ready, done = ctx.Event(), ctx.Event()
+    proc = ctx.Process(target=_hold_bus, args=(str(tmp_path), ready, done))
+    proc.start()
+    try:
+        assert ready.wait(10)
+        with pytest.raises(session_mod.SessionBusyError):
+            registry.acquire(FakeController)
+    finally:
+        done.set()
+        proc.join(10)
+
+    lease = registry.acquire(FakeController)
+    assert lease.users == 1
+
+
+def test_get_session_registry_is_shared(session_mod):
+    assert session_mod.get_session_registry() is session_mod.get_session_registry()
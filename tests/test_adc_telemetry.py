@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+import kspec_adc_controller.adc_telemetry as mod
+from kspec_adc_controller.adc_telemetry import TelemetryPoller
+
+
+class DummyLogger:
+    def __init__(self):
+        self.debugs = []
+        self.errors = []
+
+    def info(self, msg):
+        pass
+
+    def debug(self, msg):
+        self.debugs.append(msg)
+
+    def error(self, msg):
+        self.errors.append(msg)
+
+
+@pytest.fixture(autouse=True)
+def logger(monkeypatch):
+    logger = DummyLogger()
+    monkeypatch.setattr(mod, "AdcLogger", lambda *_a, **_kw: logger)
+    return logger
+
+
+class FakeBus:
+    def __init__(self):
+        self.positions = {1: 100, 2: 200}
+        self.fail = set()
+        self.reads = []
+        self.on_read = None
+
+    def read(self, motor_id):
+        self.reads.append(motor_id)
+        if self.on_read:
+            self.on_read(motor_id)
+        if motor_id in self.fail:
+            raise RuntimeError(f"read fail {motor_id}")
+        return self.positions[motor_id], 0x1237, True
+
+
+def test_poll_once_publishes_timestamped_samples():
+    bus = FakeBus()
+    poller = TelemetryPoller(bus.read, interval=0.1)
+
+    assert poller.get(1) is None
+    before = time.monotonic()
+    poller.poll_once()
+
+    sample = poller.get(1)
+    assert sample.position_state == 100
+    assert sample.statusword == 0x1237
+    assert sample.connection_state is True
+    assert sample.timestamp >= before
+    assert poller.get(2).position_state == 200
+    assert poller.cycles == 1
+
+
+def test_stale_sample_is_rejected(monkeypatch):
+    bus = FakeBus()
+    poller = TelemetryPoller(bus.read)
+    poller.poll_once()
+
+    now = time.monotonic()
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now + 5.0)
+    assert poller.get(1, max_staleness=1.0) is None
+    assert poller.get(1, max_staleness=10.0).position_state == 100
+    assert poller.get(1) is not None
+
+
+def test_failed_read_drops_motor(logger):
+    bus = FakeBus()
+    poller = TelemetryPoller(bus.read)
+    poller.poll_once()
+
+    bus.fail.add(2)
+    poller.poll_once()
+    assert poller.get(1) is not None
+    assert poller.get(2) is None
+    assert any("read fail 2" in m for m in logger.debugs)
+
+
+def test_invalidate_discards_in_flight_read():
+    bus = FakeBus()
+    poller = TelemetryPoller(bus.read)
+
+    # motor 1을 읽는 도중 이동이 끝나 invalidate 된 상황
+    bus.on_read = lambda motor_id: motor_id == 1 and poller.invalidate(1)
+    poller.poll_once()
+    assert poller.get(1) is None
+    assert poller.get(2) is not None
+
+    bus.on_read = None
+    poller.poll_once()
+    poller.invalidate(0)
+    assert poller.get(1) is None and poller.get(2) is None
+
+
+def test_thread_polls_until_stopped():
+    bus = FakeBus()
+    poller = TelemetryPoller(bus.read, interval=0.01)
+
+    poller.start()
+    poller.start()  # 두 번째 호출은 무시
+    deadline = time.monotonic() + 2.0
+    while poller.cycles < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    poller.stop()
+
+    assert not poller.running
+    assert poller.cycles >= 3
+    n_reads = len(bus.reads)
+    time.sleep(0.05)
+    assert len(bus.reads) == n_reads
+
+
+def test_invalid_interval_raises(logger):
+    with pytest.raises(ValueError):
+        TelemetryPoller(lambda motor_id: None, interval=0)
+    assert logger.errors
@@ -0,0 +1,41 @@
+import json
+
+from kspec_adc_controller.adc_topology import TopologyCache
+
+BUS = {
+    "bus_hardware": "serial",
+    "protocol": "MODBUS RTU",
+    "hardware_specifier": "/dev/ttyUSB0",
+    "name": "USB-Serial",
+}
+DEVICES = [
+    {"device_id": 1, "description": "PD4-E 1"},
+    {"device_id": 2, "description": "PD4-E 2"},
+]
+
+
+def test_round_trip(tmp_path):
+    cache = TopologyCache(str(tmp_path / "cache" / "topology.json"))
+    assert cache.load(0) is None
+
+    cache.save(0, BUS, DEVICES)
+    assert cache.load(0) == {"bus": BUS, "devices": DEVICES}
+    assert cache.load(1) is None  # 다른 bus index의 cache는 무시
+
+    cache.clear()
+    assert cache.load(0) is None
+    cache.clear()
+
+
+def test_invalid_cache_is_ignored(tmp_path):
+    path = tmp_path / "topology.json"
+    cache = TopologyCache(str(path))
+
+    path.write_text("{not json")
+    assert cache.load(0) is None
+
+    path.write_text(json.dumps({"selected_bus_index": 0, "bus": BUS}))
+    assert cache.load(0) is None
+
+    path.write_text(json.dumps({"selected_bus_index": 0, "bus": BUS, "devices": []}))
+    assert cache.load(0) is None